@@ -0,0 +1,124 @@
+"""
+Wspólne zbiory danych i konfiguracja konektora dla pomiarów wydajności (pytest-benchmark).
+
+Zbiory danych to syntetyczne drzewa grup (tests/support/fake_gitlab.SyntheticTree) z 100, 1000
+i 10000 projektami. Odpowiedzi GraphQL wyliczane są raz na zbiór danych i zapamiętywane jako tekst
+JSON, dzięki czemu pomiar obejmuje dekodowanie odpowiedzi i logikę konektora, a nie zastępnik Gitlab.
+Zapytania REST (user, badges, protected tags, mirrors) obsługuje lokalny serwer FakeGitlab.
+"""
+import json
+import sys
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests"))
+
+from support.fake_gitlab import FakeGitlab, SyntheticTree  # noqa: E402
+
+from codebase_suite.connectors.Gitlab import GitlabConnector, HttpPool  # noqa: E402
+
+
+SIZES = (100, 1000, 10000)
+GROUPS = 10
+
+
+class QuietLogger:
+    """
+    Logger bez wyjścia - komunikaty konektora i generatorów nie wpływają na pomiar.
+    """
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class ReplayGraphQL:
+    """
+    Zastępuje gitlab.GraphQL: odpowiedzi GraphQL FakeGitlab są wyliczane raz dla każdego zapytania
+    i odtwarzane z zapamiętanego tekstu JSON (json.loads przy każdym wywołaniu, jak w kliencie).
+    """
+
+    def __init__(self, fake: FakeGitlab) -> None:
+        self.__fake = fake
+        self.__responses = {}
+
+    def __call__(self, *args, **kwargs) -> "ReplayGraphQL":
+        return self
+
+    def execute(self, query: str, variables: dict = None) -> dict:
+        body = json.dumps({'query': query, 'variables': variables}, sort_keys=True)
+        if body not in self.__responses:
+            status, headers, payload = self.__fake.respond('POST', '/api/graphql', body.encode())
+            self.__responses[body] = json.dumps(payload['data'])
+        return json.loads(self.__responses[body])
+
+
+class Dataset:
+    """
+    Syntetyczne drzewo o zadanej liczbie projektów (GROUPS grup: grupa główna i jej podgrupy).
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.tree = SyntheticTree(root="bench", depth=1, width=GROUPS - 1, projects=size // GROUPS)
+        self.root = "bench"
+        # liczba powtórzeń pomiaru - mniej dla dużych zbiorów danych
+        self.rounds = max(1, 1000 // size)
+        self.fake = FakeGitlab(self.tree)
+        self.graphql = ReplayGraphQL(self.fake)
+
+    def reset(self) -> None:
+        """
+        Czyści współdzielony cache konektora (drzewo, indeksy, ustawienia REST).
+        """
+        GitlabConnector._GitlabConnector__tree.clear()
+        GitlabConnector._GitlabConnector__indexed_roots.clear()
+        GitlabConnector._GitlabConnector__rest_cache.clear()
+        for index in (GitlabConnector._GitlabConnector__paths, GitlabConnector._GitlabConnector__ids, GitlabConnector._GitlabConnector__projections):
+            for entity in index.values():
+                entity.clear()
+
+
+@pytest.fixture
+def logger():
+    """Logger bez wyjścia."""
+    return QuietLogger()
+
+
+@pytest.fixture(scope="session", params=SIZES, ids=lambda size: f"{size}-projects")
+def dataset(request):
+    """Zbiór danych ze 100, 1000 i 10000 projektami."""
+    return Dataset(request.param)
+
+
+@pytest.fixture
+def connector(dataset):
+    """
+    Fabryka GitlabConnector połączonego z FakeGitlab (REST) i odtwarzanymi odpowiedziami GraphQL.
+    """
+    config = MagicMock()
+    config.gitlab_token.get_secret_value.return_value = "secret-token"
+    config.ssl_verify = False
+    config.api_version = "4"
+    config.gitlab_max_concurrency = 8
+    config.http_pool_size = 8
+    config.http_keepalive = 5
+    config.http_timeout = 5
+    config.http2 = False
+
+    GitlabConnector.configure_cache(enabled=False)
+    GitlabConnector.configure_requests()
+    GitlabConnector.configure_snapshot()
+    dataset.reset()
+    with dataset.fake as fake:
+        config.gitlab_url = fake.url
+        pool = HttpPool.__wrapped__(config, QuietLogger())
+        with patch("codebase_suite.connectors.Gitlab.GitlabConnector.HttpPool", return_value=pool), \
+             patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config", return_value=config), \
+             patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL", dataset.graphql):
+            yield lambda: GitlabConnector(logger=QuietLogger())
+        pool.close()
+    dataset.reset()
+
@@ -0,0 +1,15 @@
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize("argv", [
+    pytest.param(["-c", "import codebase_suite"], id="import"),
+    pytest.param(["-c", "from codebase_suite import main; main()", "--help"], id="help"),
+])
+def test_cli_startup(benchmark, argv):
+    def run():
+        subprocess.run([sys.executable, *argv], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    benchmark.pedantic(run, rounds=10)
@@ -0,0 +1,71 @@
+import json
+
+from codebase_suite.connectors.Gitlab import ProjectRecord
+from codebase_suite.connectors.Gitlab.Stream import JsonStream
+from codebase_suite.connectors.Gitlab.Graphql import query_group_projects
+
+
+def project_pages(dataset) -> list:
+    """
+    Zwraca kolejne strony projektów grupy głównej w formacie odpowiedzi GraphQL.
+    """
+    pages = []
+    after = None
+    while True:
+        page = dataset.graphql.execute(query_group_projects(None), {'fullPath': dataset.root, 'after': after})
+        pages.append(page)
+        connection = page['group']['projects']
+        if not connection['pageInfo']['hasNextPage']:
+            return pages
+        after = connection['pageInfo']['endCursor']
+
+
+def test_decode_project_pages(benchmark, dataset):
+    nodes = [node for page in project_pages(dataset) for node in page['group']['projects']['nodes']]
+
+    records = benchmark.pedantic(lambda: [ProjectRecord.decode(node) for node in nodes], rounds=dataset.rounds)
+
+    assert len(records) == dataset.size
+
+
+def test_stream_project_pages(benchmark, dataset):
+    texts = [json.dumps({'data': page}) for page in project_pages(dataset)]
+
+    def decode():
+        records = []
+        for text in texts:
+            chunks = (text[i:i + 65536] for i in range(0, len(text), 65536))
+            records.extend(ProjectRecord.decode(node) for node in JsonStream(chunks, ('data', 'group', 'projects', 'nodes')))
+        return records
+
+    assert len(benchmark.pedantic(decode, rounds=dataset.rounds)) == dataset.size
+
+
+def test_graphql_get_group_projects(benchmark, dataset, connector):
+    gl = connector()
+    gl.graphql_get_group_projects(dataset.root)
+
+    projects = benchmark.pedantic(gl.graphql_get_group_projects, args=(dataset.root,), setup=dataset.reset, rounds=dataset.rounds)
+
+    assert len(projects) == dataset.size
+
+
+def test_graphql_index_namespace(benchmark, dataset, connector):
+    gl = connector()
+    gl.graphql_index_namespace(dataset.root)
+
+    benchmark.pedantic(gl.graphql_index_namespace, args=(dataset.root,), setup=dataset.reset, rounds=dataset.rounds)
+
+    assert len(gl.graphql_get_group_projects(dataset.root)) == dataset.size
+
+
+def test_get_project_inherited_variables(benchmark, dataset, connector):
+    gl = connector()
+    gl.graphql_index_namespace(dataset.root)
+
+    def inherited_variables():
+        return [gl.get_project_inherited_variables(path) for path in dataset.tree.projects]
+
+    variables = benchmark.pedantic(inherited_variables, rounds=dataset.rounds)
+
+    assert len(variables) == dataset.size
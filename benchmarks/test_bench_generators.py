@@ -0,0 +1,74 @@
+import itertools
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from codebase_suite.generators.terraform import GitlabGroup, GitlabProject
+
+
+TEMPLATES = Path(__file__).resolve().parent.parent / "templates" / "terraform" / "modules"
+
+
+@pytest.fixture
+def entities(dataset, connector):
+    """
+    Grupy i projekty zbioru danych pobrane przez konektor, z dołączonymi badges i protected tags.
+    """
+    gl = connector()
+    gl.graphql_index_namespace(dataset.root)
+    groups = [gl.graphql_get_group(path) for path in dataset.tree.groups]
+    for group in groups:
+        group['badges'] = dataset.tree.groups[group['fullPath']]['badges']
+    projects = gl.graphql_get_group_projects(dataset.root)
+    for project in projects:
+        project['badges'] = dataset.tree.projects[project['fullPath']]['badges']
+        project['protected_tags'] = dataset.tree.projects[project['fullPath']]['protected_tags']
+
+    with patch("codebase_suite.generators.terraform.GitlabGroup.Config") as group_config, \
+         patch("codebase_suite.generators.terraform.GitlabProject.Config") as project_config:
+        group_config.return_value.tf_module_gitlab_group_source = "git@gitlab.example.com:modules/gitlab-group.git"
+        project_config.return_value.tf_module_gitlab_project_source = "git@gitlab.example.com:modules/gitlab-project.git"
+        yield groups, projects
+
+
+def repositories(tmp_path: Path, dataset):
+    """
+    Zwraca funkcję setup dla benchmark.pedantic tworzącą pusty katalog repozytorium dla każdego powtórzenia.
+    """
+    counter = itertools.count()
+
+    def setup():
+        repository_path = tmp_path / f"round-{next(counter)}"
+        for path in dataset.tree.groups:
+            (repository_path / path).mkdir(parents=True)
+        return (repository_path,), {}
+    return setup
+
+
+@pytest.mark.parametrize("output", ["hcl", "json"])
+def test_generate_groups(benchmark, dataset, entities, logger, tmp_path, output):
+    groups, _ = entities
+
+    def generate(repository_path):
+        for group in groups:
+            gen = GitlabGroup(TEMPLATES / "gitlab-group", group, repository_path, logger)
+            gen.generate_json() if output == "json" else gen.generate_hcl()
+
+    benchmark.pedantic(generate, setup=repositories(tmp_path, dataset), rounds=dataset.rounds)
+
+
+@pytest.mark.parametrize("output", ["hcl", "json"])
+def test_generate_projects(benchmark, dataset, entities, logger, tmp_path, output):
+    _, projects = entities
+
+    def generate(repository_path):
+        for project in projects:
+            gen = GitlabProject(TEMPLATES / "gitlab-project", project, repository_path, logger)
+            gen.generate_json() if output == "json" else gen.generate_hcl()
+
+    benchmark.pedantic(generate, setup=repositories(tmp_path, dataset), rounds=dataset.rounds)
+
+    suffix = ".tf.json" if output == "json" else ".tf"
+    assert len(list(tmp_path.glob(f"round-0/**/project-*{suffix}"))) == dataset.size
@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from codebase_suite.commands.terraform.import_tf import gitlab
+
+
+class PlanTerraform:
+    """
+    Terraform zwracający gotowy plan - pomiar obejmuje tylko przechodzenie planu w import_tf.gitlab.
+    """
+
+    def __init__(self, plan: dict) -> None:
+        self.plan = plan
+        self.imports = 0
+
+    def terraform_init(self, *args) -> None:
+        pass
+
+    def terraform_plan(self) -> None:
+        pass
+
+    def terraform_show(self) -> None:
+        pass
+
+    def get_terraform_plan_json(self) -> dict:
+        return self.plan
+
+    def terraform_import(self, address, resource_id, dry) -> None:
+        self.imports += 1
+
+
+def resource(kind: str, address: str, after: dict) -> dict:
+    return {'address': f"{kind}.{address}", 'mode': 'managed', 'type': kind, 'change': {'actions': ['create'], 'after': after}}
+
+
+def terraform_plan(tree) -> dict:
+    """
+    Plan terraform tworzący wszystkie grupy i projekty drzewa wraz z ich ustawieniami.
+    """
+    changes = []
+    for path, group in tree.groups.items():
+        parent = tree.groups.get(path.rsplit('/', 1)[0]) if '/' in path else None
+        after = {'path': group['name']} if parent is None else {'path': group['name'], 'parent_id': parent['id']}
+        address = path.replace('/', '_')
+        changes.append(resource('gitlab_group', address, after))
+        changes.extend(resource('gitlab_group_variable', f"{address}_{v['key']}", {'group': group['id'], 'key': v['key']}) for v in group['ciVariables'])
+        changes.extend(resource('gitlab_group_label', f"{address}_{l['title']}", {'group': group['id'], 'name': l['title']}) for l in group['labels'])
+        changes.extend(resource('gitlab_group_badge', f"{address}_{b['name']}", {'group': group['id'], 'name': b['name']}) for b in group['badges'])
+
+    for path, project in tree.projects.items():
+        namespace = tree.groups[path.rsplit('/', 1)[0]]
+        address = path.replace('/', '_')
+        changes.append(resource('gitlab_project', address, {'name': project['name'], 'namespace_id': namespace['id']}))
+        changes.extend(resource('gitlab_project_variable', f"{address}_{v['key']}", {'project': project['id'], 'key': v['key']}) for v in project['ciVariables'])
+        changes.extend(resource('gitlab_project_label', f"{address}_{l['title']}", {'project': project['id'], 'name': l['title']}) for l in project['labels'])
+        changes.extend(resource('gitlab_branch_protection', f"{address}_{r['name']}", {'project': project['id'], 'branch': r['name']}) for r in project['branchRules'])
+        changes.extend(resource('gitlab_project_badge', f"{address}_{b['name']}", {'project': project['id'], 'name': b['name']}) for b in project['badges'])
+        changes.extend(resource('gitlab_tag_protection', f"{address}_{t['name']}", {'project': project['id'], 'tag': t['name']}) for t in project['protected_tags'])
+    return {'resource_changes': changes}
+
+
+@pytest.fixture
+def plan(dataset):
+    return terraform_plan(dataset.tree)
+
+
+def test_import_gitlab_plan_walk(benchmark, dataset, connector, logger, plan, tmp_path):
+    gl = connector()
+    tf = PlanTerraform(plan)
+    obj = SimpleNamespace(logger=lambda: logger)
+
+    with patch("codebase_suite.commands.terraform.import_tf.GitlabConnector", return_value=gl), \
+         patch("codebase_suite.commands.terraform.import_tf.Terraform", return_value=tf), \
+         patch("codebase_suite.commands.terraform.import_tf.Config"):
+        def walk():
+            gitlab.main(["--repository-path", str(tmp_path), "--dry"], obj=obj, standalone_mode=False)
+
+        # pierwsze przejście pobiera grupy, projekty i ustawienia REST - mierzone jest przejście z cache
+        gl.graphql_index_namespace(dataset.root)
+        walk()
+        tf.imports = 0
+        benchmark.pedantic(walk, rounds=dataset.rounds)
+
+    assert tf.imports == len(plan['resource_changes']) * dataset.rounds
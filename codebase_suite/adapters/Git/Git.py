@@ -4,7 +4,7 @@ import subprocess
 from path import Path
 from singleton_decorator import singleton
 
-from ...core import Logger
+from ...core import Logger, Profiler
 
 
 @singleton
@@ -36,13 +36,14 @@ class Git:
         cmd = "git remote get-url origin"
         self.__logger.debug(f"📀  execute: {cmd}")
 
-        result = subprocess.run(
-            cmd,
-            cwd=self.__cwd,
-            shell=True,
-            text=True,
-            capture_output=True,
-        )
+        with Profiler.span('git.remote', self.__cwd):
+            result = subprocess.run(
+                cmd,
+                cwd=self.__cwd,
+                shell=True,
+                text=True,
+                capture_output=True,
+            )
 
         if result.returncode > 0:
             print(result.stdout)
@@ -5,7 +5,7 @@ import json
 from pathlib import Path
 
 from ...config import Config
-from ...core import Logger
+from ...core import Logger, Metrics, Profiler
 from ...adapters.Git import Git
 from ...connectors.Gitlab import GitlabConnector
 
@@ -72,13 +72,14 @@ class Terraform:
         
         self.__logger.debug("🚀  Terraform init has been started")
         self.__logger.debug(cmd)
-        result = subprocess.run(
-            cmd,
-            cwd=self.__cwd,
-            shell=True,
-            text=True,
-            capture_output=True,
-        )
+        with Profiler.span('terraform.init', tf_state):
+            result = subprocess.run(
+                cmd,
+                cwd=self.__cwd,
+                shell=True,
+                text=True,
+                capture_output=True,
+            )
 
         if result.returncode != 0:
             print(cmd)
@@ -102,13 +103,14 @@ class Terraform:
 
         self.__logger.debug("🚀  Terraform plan has been started")
         self.__logger.debug(cmd)
-        result = subprocess.run(
-            cmd,
-            cwd=self.__cwd,
-            shell=True,
-            text=True,
-            capture_output=True,
-        )
+        with Profiler.span('terraform.plan', self.__cwd):
+            result = subprocess.run(
+                cmd,
+                cwd=self.__cwd,
+                shell=True,
+                text=True,
+                capture_output=True,
+            )
 
         if result.returncode != 0:
             print(cmd)
@@ -134,13 +136,14 @@ class Terraform:
 
         self.__logger.debug("🚀  Terraform show has been started")
         self.__logger.debug(cmd)
-        result = subprocess.run(
-            cmd,
-            cwd=self.__cwd,
-            shell=True,
-            text=True,
-            capture_output=True,
-        )
+        with Profiler.span('terraform.show', self.__cwd):
+            result = subprocess.run(
+                cmd,
+                cwd=self.__cwd,
+                shell=True,
+                text=True,
+                capture_output=True,
+            )
 
         if result.returncode != 0:
             print(cmd)
@@ -160,13 +163,14 @@ class Terraform:
         self.__logger.debug("🚀  Terraform import has been started")
         self.__logger.debug(cmd)
         if not dry:
-            result = subprocess.run(
-                cmd,
-                cwd=self.__cwd,
-                shell=True,
-                text=True,
-                capture_output=True,
-            )
+            with Profiler.span('terraform.import', to):
+                result = subprocess.run(
+                    cmd,
+                    cwd=self.__cwd,
+                    shell=True,
+                    text=True,
+                    capture_output=True,
+                )
 
             if result.returncode != 0:
                 print(cmd)
@@ -177,6 +181,18 @@ class Terraform:
             else:
                 self.__logger.success(f"✔️   Terraform import {to} has been successfully executed!")
 
+        Metrics.inc('codebase_terraform_resources_imported_total', type=self.resource_type(to), dry=str(dry).lower())
+
+    @staticmethod
+    def resource_type(address: str) -> str:
+        """
+        Zwraca typ zasobu z adresu terraform, np. module.groups.gitlab_group.app["x"] → gitlab_group.
+        """
+        parts = address.split('.')
+        while len(parts) > 2 and parts[0] == 'module':
+            parts = parts[2:]
+        return parts[1] if parts[0] == 'data' and len(parts) > 1 else parts[0]
+
     def get_terraform_plan_json(self):
         """
         Analiza pliku json z terraform plan
@@ -187,7 +203,9 @@ class Terraform:
             self.__logger.error(f"Plik {tfplanjson_path} nie istnieje!")
             exit(1)
 
-        with open(tfplanjson_path, 'r') as f:
-            data = json.load(f)
+        with Profiler.span('terraform.plan_json', tfplanjson_path) as span:
+            with open(tfplanjson_path, 'r') as f:
+                data = json.load(f)
+                span.add_bytes(f.tell())
 
         return data
\ No newline at end of file
@@ -1,7 +1,11 @@
 import click
+import cProfile
 import shutil
 
-from ..core import Context
+from pathlib import Path
+
+from ..core import Context, Metrics, Profiler, SamplingProfiler
+from ..connectors.Gitlab import GitlabConnector
 
 from .gitlab import gitlab
 from .terraform import terraform
@@ -19,15 +23,93 @@ print('''
     
 ''')
 
+def save_profile(ctx: click.Context, path: Path) -> None:
+    """
+    Zapisuje raport pomiarów uruchomienia (opcja --profile).
+
+    :params ctx: Kontekst click
+    :params path: Plik raportu JSON
+    """
+    report = Profiler.save(path)
+    ctx.obj.logger().info(f"✔️  Profile report ({report['spans']} spans) saved: {path}")
+
+
+def save_metrics(ctx: click.Context, path: Path) -> None:
+    """
+    Zapisuje metryki uruchomienia w formacie tekstowym Prometheus (opcja --metrics).
+
+    :params ctx: Kontekst click
+    :params path: Plik metryk
+    """
+    Metrics.save(path)
+    ctx.obj.logger().info(f"✔️  Metrics saved: {path}")
+
+
+def save_cpu_profile(ctx: click.Context, cpu: cProfile.Profile, path: Path) -> None:
+    """
+    Zatrzymuje cProfile i zapisuje statystyki (opcja --cpu-profile, do odczytu przez pstats lub snakeviz).
+
+    :params ctx: Kontekst click
+    :params cpu: Profiler cProfile
+    :params path: Plik pstats
+    """
+    cpu.disable()
+    cpu.dump_stats(path)
+    ctx.obj.logger().info(f"✔️  CPU profile saved: {path}")
+
+
+def save_sample_profile(ctx: click.Context, sampler: SamplingProfiler, path: Path) -> None:
+    """
+    Zatrzymuje profiler próbkujący i zapisuje profil speedscope (opcja --sample-profile).
+
+    :params ctx: Kontekst click
+    :params sampler: Profiler próbkujący
+    :params path: Plik profilu speedscope
+    """
+    sampler.stop()
+    sampler.save(path, name=ctx.command_path)
+    ctx.obj.logger().info(f"✔️  Sampling profile ({sampler.samples()} samples) saved: {path}")
+
+
 @click.group(context_settings={'show_default': True})
 @click.option('-v','--verbose', count=True, help='Enable verbose output')
 @click.option('--no-color', is_flag=True, help='Disable colored output')
+@click.option('--no-cache', is_flag=True, help='Disable persistent cache of gitlab responses')
+@click.option('--refresh', is_flag=True, help='Ignore cached gitlab responses and download them again')
+@click.option('--check-auth', is_flag=True, help='Authenticate in gitlab before running the command')
+@click.option('--retries', type=click.IntRange(min=0), default=3, help='Retry gitlab reads failed with a transient error (5xx, timeout) up to N times')
+@click.option('--deadline', type=click.FloatRange(min=0), default=None, help='Stop sending gitlab requests after SECONDS')
+@click.option('--hedge', is_flag=True, help='Send a duplicate of gitlab reads slower than p95 and use the first response')
+@click.option('--snapshot', type=click.Path(exists=True, dir_okay=False, path_type=Path), default=None, help='Serve every gitlab read from a snapshot file (gitlab snapshot export)')
+@click.option('--stream-json', is_flag=True, help='Decode gitlab group and project pages incrementally to keep memory flat')
+@click.option('--profile', type=click.Path(dir_okay=False, writable=True, path_type=Path), default=None, help='Write a timing report of gitlab, terraform, git and rendering calls to a JSON file')
+@click.option('--cpu-profile', type=click.Path(dir_okay=False, writable=True, path_type=Path), default=None, help='Profile the command with cProfile (main thread) and write pstats to a file')
+@click.option('--sample-profile', type=click.Path(dir_okay=False, writable=True, path_type=Path), default=None, help='Sample stacks of all threads and write a speedscope profile to a file')
+@click.option('--metrics', type=click.Path(dir_okay=False, writable=True, path_type=Path), default=None, help='Write Prometheus textfile metrics of the run to a file (eg. node_exporter textfile collector *.prom)')
 @click.pass_context
-def commands(ctx: click.Context, verbose, no_color):
+def commands(ctx: click.Context, verbose, no_color, no_cache, refresh, check_auth, retries, deadline, hedge, stream_json, snapshot, profile, cpu_profile, sample_profile, metrics):
     """
     Narzędzie wspomagające devops w codziennej pracy
     """
     ctx.obj = Context(verbose, not no_color)
+    GitlabConnector.configure_cache(enabled=not no_cache, refresh=refresh)
+    GitlabConnector.configure_auth(check_auth=check_auth)
+    GitlabConnector.configure_requests(retries=retries, deadline=deadline, hedge=hedge, stream=stream_json)
+    GitlabConnector.configure_snapshot(snapshot)
+    # metryki czasów i rozmiarów operacji wyliczane są z pomiarów Profiler
+    Profiler.configure(enabled=profile is not None or metrics is not None)
+    Metrics.configure(enabled=metrics is not None)
+    if profile is not None:
+        ctx.call_on_close(lambda: save_profile(ctx, profile))
+    if metrics is not None:
+        ctx.call_on_close(lambda: save_metrics(ctx, metrics))
+    if cpu_profile is not None:
+        cpu = cProfile.Profile()
+        ctx.call_on_close(lambda: save_cpu_profile(ctx, cpu, cpu_profile))
+        cpu.enable()
+    if sample_profile is not None:
+        sampler = SamplingProfiler().start()
+        ctx.call_on_close(lambda: save_sample_profile(ctx, sampler, sample_profile))
     
     columns = 150 if shutil.get_terminal_size().columns == None else shutil.get_terminal_size().columns
     ctx.max_content_width=columns
@@ -2,6 +2,8 @@ import click
 
 from .project import project
 from .group import group
+from .cache import cache
+from .snapshot import snapshot
 
 @click.group()
 @click.pass_context
@@ -13,3 +15,5 @@ def gitlab(ctx: click.Context):
 
 gitlab.add_command(project)
 gitlab.add_command(group)
+gitlab.add_command(cache)
+gitlab.add_command(snapshot)
@@ -0,0 +1,35 @@
+import click
+
+from ...connectors.Gitlab import GitlabCache
+
+
+@click.group()
+@click.pass_context
+def cache(ctx):
+    """
+    Zarządzanie trwałym cache odpowiedzi z gitlab
+    """
+    ctx.obj.logger().trace("✔️  codebase-suite → gitlab → cache")
+
+
+@cache.command()
+@click.option('-p','--full-path', type=str, required=False, help="Invalidate only group/project and objects below it (eg. pl.rachuna-net/app)")
+@click.pass_context
+def clear(ctx, full_path):
+    """
+    Usuwanie wpisów z trwałego cache
+    """
+    config = ctx.obj.get_config()
+    store = GitlabCache(
+        config.cache_dir,
+        config.cache_ttl,
+        ctx.obj.logger(),
+        GitlabCache.fingerprint(config.gitlab_url, config.gitlab_token.get_secret_value())
+    )
+
+    if full_path:
+        removed = store.invalidate(full_path)
+    else:
+        removed = store.clear()
+
+    ctx.obj.logger().success(f"🧹  Removed {removed} cache entries.")
@@ -1,3 +1,4 @@
+import json
 import sys
 import click
 from path import Path
@@ -55,7 +56,7 @@ def list_ci(ctx, full_path):
     Lista procesów CI/CD dla projektów w grupie
     """
     gl = GitlabConnector(ctx.obj.logger())
-    result = gl.graphql_get_group_projects(full_path)
+    result = gl.graphql_get_group_projects(full_path, fields=('ciConfigPathOrDefault',))
 
     table = Table(show_header=True, header_style="bold", show_lines=True)
     table.add_column("id", justify="left", no_wrap=True)
@@ -63,9 +64,8 @@ def list_ci(ctx, full_path):
     table.add_column("ciConfigPathOrDefault", justify="left", no_wrap=False, overflow="fold")
 
     for project in sorted(result, key=lambda x: x.get("fullPath", "")):
-        project_id = project.get("id", "").replace("gid://gitlab/Project/", "")
         table.add_row(
-            project_id,
+            project.get("id", ""),
             project.get("fullPath", ""),
             project.get("ciConfigPathOrDefault", "")
         )
@@ -83,7 +83,7 @@ def list_labels(ctx, full_path):
     Lista labels zdefiniowanych w grupie gitlab
     """
     gl = GitlabConnector(ctx.obj.logger())
-    result = gl.graphql_get_group(full_path)
+    result = gl.graphql_get_group(full_path, fields=('labels',))
 
     table = Table(show_header=True, header_style="bold", show_lines=True)
     table.add_column("id", justify="left", no_wrap=True)
@@ -114,7 +114,7 @@ def list_vars(ctx, full_path):
     Lista zmiennych w zdefiniowana w grupie gitlab
     """
     gl = GitlabConnector(ctx.obj.logger())
-    result = gl.graphql_get_group(full_path)
+    result = gl.graphql_get_group(full_path, fields=('ciVariables',))
 
     table = Table(show_header=True, header_style="bold", show_lines=True)
     table.add_column("id", justify="left", no_wrap=True)
@@ -150,3 +150,66 @@ def list_vars(ctx, full_path):
     console.print(table)
 
     sys.exit(0)
+
+
+@group.command()
+@click.option('-p','--full-path', type=Path, required=True, help="Set full path to group (eg. pl.rachuna-net/app)")
+@click.option('-f','--format', 'output_format', type=click.Choice(['table', 'ndjson']), default='table', show_default=True, help="Output format (ndjson - one JSON object per line)")
+@click.pass_context
+def effective_vars(ctx, full_path, output_format):
+    """
+    Lista zmiennych (własnych i dziedziczonych) wszystkich projektów w grupie
+    """
+    gl = GitlabConnector(ctx.obj.logger())
+    result = gl.get_group_effective_variables(full_path)
+
+    rows = [
+        {
+            'project': project,
+            'key': var.get('key', ""),
+            'environmentScope': var.get('environmentScope', ""),
+            'source': var.get('path', ""),
+            'value': var.get('value', ""),
+            'protected': var.get('protected', False),
+            'masked': var.get('masked', False),
+        }
+        for project, variables in result.items()
+        for var in sorted(variables.values(), key=lambda x: (x.get('key', ""), x.get('environmentScope', "")))
+    ]
+
+    if output_format == 'ndjson':
+        for row in rows:
+            click.echo(json.dumps(row, ensure_ascii=False))
+        sys.exit(0)
+
+    table = Table(show_header=True, header_style="bold", show_lines=True)
+    table.add_column("project", justify="left", no_wrap=False, overflow="fold")
+    table.add_column("key", justify="left", no_wrap=False, overflow="fold")
+    table.add_column("scope", justify="left", no_wrap=False, overflow="fold")
+    table.add_column("source", justify="left", no_wrap=False, overflow="fold")
+    table.add_column("value", justify="left", no_wrap=False, overflow="fold")
+    table.add_column("protected", justify="left", no_wrap=False, overflow="fold")
+    table.add_column("masked", justify="left", no_wrap=False, overflow="fold")
+
+    for row in rows:
+        if row['protected']:
+            row_style = "bold red"
+        elif row['masked']:
+            row_style = "bold green"
+        else:
+            row_style = ""
+
+        table.add_row(
+            Text(row['project'], style=row_style),
+            Text(row['key'], style=row_style),
+            Text(row['environmentScope'], style=row_style),
+            Text(row['source'], style=row_style),
+            Text(row['value'] or "", style=row_style),
+            Text("Yes" if row['protected'] else "No", style=row_style),
+            Text("Yes" if row['masked'] else "No", style=row_style)
+        )
+
+    console = Console()
+    console.print(table)
+
+    sys.exit(0)
@@ -0,0 +1,31 @@
+import click
+
+from pathlib import Path
+
+from ...connectors.Gitlab import GitlabConnector
+
+
+@click.group()
+@click.pass_context
+def snapshot(ctx):
+    """
+    Migawki drzewa grup gitlab do pracy offline (opcja --snapshot)
+    """
+    ctx.obj.logger().trace("✔️  codebase-suite → gitlab → snapshot")
+
+
+@snapshot.command()
+@click.option('-p','--full-path', type=str, required=True, help="Set full path to group (eg. pl.rachuna-net/app)")
+@click.option('-o','--output', type=Path, required=True, help="Set path to snapshot file (eg. tree.snap)")
+@click.pass_context
+def export(ctx, full_path, output):
+    """
+    Zapisywanie grupy, jej podgrup i projektów (wraz ze zmiennymi, etykietami, regułami gałęzi,
+    badges, protected tags i mirrorami) w pliku migawki
+    """
+    gl = GitlabConnector(ctx.obj.logger())
+    exported = gl.export_snapshot(full_path, output)
+
+    groups = len(exported.entries('group'))
+    projects = len(exported.entries('project'))
+    ctx.obj.logger().success(f"✔️  Saved snapshot of {full_path} ({groups} groups, {projects} projects) to {output}.")
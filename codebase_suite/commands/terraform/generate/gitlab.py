@@ -1,6 +1,8 @@
 import click
 import json as json1
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ....connectors.Gitlab import GitlabConnector
@@ -44,6 +46,35 @@ def generate_project(ctx, gl, full_path, repository_path, template_path, force,
     else:
         gen.generate_hcl(force)
 
+def prefetch_rest_settings(gl: GitlabConnector, entities, entity: str, workers: int):
+    """
+    Pobiera równolegle (pula workers wątków) ustawienia dostępne tylko w Gitlab API (badges, protected tags)
+    i dołącza je do grup lub projektów. Obiekty zwracane są w kolejności wejściowej, gdy ich ustawienia
+    zostaną pobrane - pobieranie wyprzedza generowanie plików o co najwyżej 2 * workers obiektów.
+
+    :params gl: Konektor Gitlab
+    :params entities: Grupy lub projekty (lista lub generator)
+    :params entity: Typ obiektów (group lub project)
+    :params workers: Liczba równoległych zapytań REST
+    :return: Generator grup lub projektów z dołączonymi ustawieniami
+    """
+    def fetch(node):
+        if entity == 'group':
+            node['badges'] = gl.get_group_badges(node['fullPath'])
+        else:
+            node['badges'] = gl.get_project_badges(node['fullPath'])
+            node['protected_tags'] = gl.get_project_protected_tags(node['fullPath'])
+        return node
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for node in entities:
+            pending.append(executor.submit(fetch, node))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
 @click.group()
 @click.pass_context
 def gitlab(ctx):
@@ -94,24 +125,33 @@ def project(ctx, full_path, repository_path, template_path, force, json):
 @click.option('-t','--template-path', type=Path, required=False, help="Set path to template file definition gitlab group")
 @click.option('-f', '--force', is_flag=True, default=False, help="Wymuś nadpisanie istniejących plików")
 @click.option('--json', is_flag=True, default=False, help="Generuj konfiguracje w formacie json")
+@click.option('--incremental', is_flag=True, default=False, help="Generuj (nadpisując) pliki tylko dla grup i projektów zmienionych od poprzedniego uruchomienia (wymaga CODEBASE_CACHE_ENABLED)")
+@click.option('-w', '--workers', type=click.IntRange(min=1), default=None, help="Liczba równoległych zapytań REST o badges i protected tags (domyślnie: GITLAB_MAX_CONCURRENCY)")
 @click.pass_context
-def groups(ctx, full_path, repository_path, template_path, force, json):
+def groups(ctx, full_path, repository_path, template_path, force, json, incremental, workers):
     """
     Generowanie plików terraform dla grupy gitlab i ich dzieci
     """
     gl = GitlabConnector(ctx.obj.logger())
+    workers = max(1, int(ctx.obj.get_config().gitlab_max_concurrency)) if workers is None else workers
 
-    # generate root
-    generate_group(ctx, gl, full_path, repository_path, template_path, force, json)
+    if incremental:
+        # zmienione obiekty zawsze nadpisują wcześniej wygenerowane pliki
+        force = True
+        groups = gl.graphql_get_changed_groups(full_path)
+        projects = gl.graphql_get_changed_projects(full_path)
+    else:
+        # generate root
+        generate_group(ctx, gl, full_path, repository_path, template_path, force, json)
 
-    # children
-    groups = gl.graphql_get_descendantGroups(full_path)
-    projects = gl.graphql_get_group_projects(full_path)
-    
-    for group in groups:
+        # children - pliki są generowane w trakcie pobierania kolejnych stron
+        groups = gl.iter_descendant_groups(full_path)
+        projects = gl.iter_group_projects(full_path)
+
+    for group in prefetch_rest_settings(gl, groups, 'group', workers):
         ctx.obj.logger().trace(f"Przygotowanie do generowania plików dla {group['fullPath']}")
         generate_group(ctx, gl, group['fullPath'], repository_path, template_path, force, json)
 
-    for project in projects:
+    for project in prefetch_rest_settings(gl, projects, 'project', workers):
         ctx.obj.logger().trace(f"Przygotowanie do generowania plików dla {project['fullPath']}")
         generate_project(ctx, gl, project['fullPath'], repository_path, template_path, force, json)
\ No newline at end of file
@@ -12,6 +12,13 @@ from codebase_suite.connectors.Gitlab.GitlabConnector import GitlabConnector
 
 gl: GitlabConnector
 
+# zasoby projektu dostępne tylko w REST API → rodzaj ustawienia w GitlabConnector.prefetch_rest_settings
+REST_PROJECT_SETTINGS = {
+    "gitlab_project_badge": "project_badges",
+    "gitlab_tag_protection": "project_protected_tags",
+    "gitlab_project_mirror": "project_mirrors",
+}
+
 
 def print_progress_bar(ctx, index, size, width=60):
     percent = (index / size) * 100
@@ -73,8 +80,7 @@ def gitlab(ctx, repository_path, dry, no_gitlab_state, progress):
                 
                 if 'parent_id' in resource['change']['after']:
                     parent_id = resource['change']['after']['parent_id']
-                    parent_group = gl.get_group_by_id(parent_id)
-                    group = gl.graphql_get_group(parent_group.full_path+"/"+group_path)
+                    group = gl.graphql_get_group(gl.get_group_full_path(parent_id)+"/"+group_path)
                 else:
                     group = gl.graphql_get_group(group_path)
                 tf.terraform_import(resource['address'], group['id'], dry)
@@ -100,8 +106,7 @@ def gitlab(ctx, repository_path, dry, no_gitlab_state, progress):
                 
                 if 'namespace_id' in resource['change']['after']:
                     parent_id = resource['change']['after']['namespace_id']
-                    parent_group = gl.get_group_by_id(parent_id)
-                    project = gl.graphql_get_project(parent_group.full_path+"/"+project_name)
+                    project = gl.graphql_get_project(gl.get_group_full_path(parent_id)+"/"+project_name)
                 else:
                     project = gl.graphql_get_project(project_name)
                 tf.terraform_import(resource['address'], project['id'], dry)
@@ -115,6 +120,17 @@ def gitlab(ctx, repository_path, dry, no_gitlab_state, progress):
     resources_count = len(plan['resource_changes'])
     counter = 0
     ctx.obj.logger().info("🔼  Import gitlab group and project settings ...")
+
+    # ustawienia dostępne tylko w REST API pobieramy równolegle, zanim zaczniemy import
+    rest_settings = []
+    for resource in plan['resource_changes']:
+        if "create" in resource['change']['actions'] and "delete" not in resource['change']['actions']:
+            if resource['type'] == "gitlab_group_badge" and 'group' in resource['change']['after']:
+                rest_settings.append(("group_badges", gl.get_group_full_path(resource['change']['after']['group'])))
+            if resource['type'] in REST_PROJECT_SETTINGS and 'project' in resource['change']['after']:
+                rest_settings.append((REST_PROJECT_SETTINGS[resource['type']], gl.get_project_full_path(resource['change']['after']['project'])))
+    gl.prefetch_rest_settings(rest_settings)
+
     for resource in plan['resource_changes']:
         counter += 1
         if "create" in resource['change']['actions'] and "delete" not in resource['change']['actions']:
@@ -122,7 +138,7 @@ def gitlab(ctx, repository_path, dry, no_gitlab_state, progress):
             # group parameters
             if 'group' in resource['change']['after']:
                 group_id = resource['change']['after']['group']
-                group = gl.get_group_by_id(group_id)
+                group_full_path = gl.get_group_full_path(group_id)
 
                 if resource['type'] == "gitlab_group_badge":
                     for badge in gl.get_group_badges(group_id):
@@ -130,12 +146,12 @@ def gitlab(ctx, repository_path, dry, no_gitlab_state, progress):
                             tf.terraform_import(resource['address'], f"{group_id}:{badge['id']}", dry)
 
                 if resource['type'] == "gitlab_group_label":
-                    for g in gl.graphql_get_group(group.full_path)['labels']:
+                    for g in gl.graphql_get_group(group_full_path)['labels']:
                         if g['title'] == resource['change']['after']['name']:
                             tf.terraform_import(resource['address'], f"{group_id}:{g['id']}", dry)
                 
                 if resource['type'] == "gitlab_group_variable":
-                    for g in gl.graphql_get_group(group.full_path)['ciVariables']:
+                    for g in gl.graphql_get_group(group_full_path)['ciVariables']:
                         if g['key'] == resource['change']['after']['key']:
                             tf.terraform_import(resource['address'], f"{group_id}:{g['key']}:{g['environmentScope']}", dry)
             
@@ -145,10 +161,10 @@ def gitlab(ctx, repository_path, dry, no_gitlab_state, progress):
             # nie pobieraj tego samego
             if 'project' in resource['change']['after']:
                 project_id = resource['change']['after']['project']
-                project = gl.get_project_by_id(project_id)
+                project_full_path = gl.get_project_full_path(project_id)
 
                 if resource['type'] == "gitlab_branch_protection":
-                    for protected_branch in gl.graphql_get_project(project.path_with_namespace)['branchRules']:
+                    for protected_branch in gl.graphql_get_project(project_full_path)['branchRules']:
                         if protected_branch['name'] == resource['change']['after']['branch']:
                             tf.terraform_import(resource['address'], f"{project_id}:{protected_branch['name']}", dry)
                 
@@ -168,13 +184,13 @@ def gitlab(ctx, repository_path, dry, no_gitlab_state, progress):
                             tf.terraform_import(resource['address'], f"{project_id}:{mirror.id}", dry)
 
                 if resource['type'] == "gitlab_project_label":
-                    for label in gl.graphql_get_project(project.path_with_namespace)['labels']:
+                    for label in gl.graphql_get_project(project_full_path)['labels']:
                         if label['title'] == resource['change']['after']['name']:
                             tf.terraform_import(resource['address'], f"{project_id}:{label['id']}", dry)
                 
                 if resource['type'] == "gitlab_project_variable":
                     # print(resource)
-                    for ci_var in gl.graphql_get_project(project.path_with_namespace)['ciVariables']:
+                    for ci_var in gl.graphql_get_project(project_full_path)['ciVariables']:
                         if ci_var['key'] == resource['change']['after']['key']:
                             tf.terraform_import(resource['address'], f"{project_id}:{ci_var['key']}:{ci_var['environmentScope']}", dry)
 
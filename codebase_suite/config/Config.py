@@ -12,6 +12,10 @@ class Config(BaseSettings):
 
     ### global
     templates_dir: Path = Field(validation_alias='CODEBASE_TEMPLATES_PATH', description="Path to templates directory", default=Path.cwd() / 'templates')
+    cache_enabled: bool = Field(validation_alias='CODEBASE_CACHE_ENABLED', description="Enable persistent cache of gitlab responses", default=False)
+    cache_dir: Path = Field(validation_alias='CODEBASE_CACHE_DIR', description="Path to persistent cache directory", default=Path.home() / '.cache' / 'codebase-suite')
+    cache_ttl: int = Field(validation_alias='CODEBASE_CACHE_TTL', description="Persistent cache entry time to live (seconds)", default=3600)
+    cache_secrets: bool = Field(validation_alias='CODEBASE_CACHE_SECRETS', description="Store CI/CD variable values in persistent cache", default=False)
 
     ### gitlab
     gitlab_url: str = Field(validation_alias='GITLAB_FQDN', description="GitLab server URL", default="https://gitlab.com/")
@@ -19,6 +23,11 @@ class Config(BaseSettings):
     gitlab_username: str = Field(validation_alias='CI_USERNAME', description="GitLab username")
     ssl_verify: str = Field(validation_alias='GITLAB_SSL_VERIFY', description="Path SSL verify enabled", default="")
     api_version: str = Field(validation_alias='GITLAB_API_VERSION', description="Set gitlab api version", default="4")
+    http_pool_size: int = Field(validation_alias='GITLAB_HTTP_POOL_SIZE', description="Size of the shared HTTP connection pool", default=10)
+    http_keepalive: float = Field(validation_alias='GITLAB_HTTP_KEEPALIVE', description="Idle keep-alive connection expiry (seconds)", default=30.0)
+    http_timeout: float | None = Field(validation_alias='GITLAB_HTTP_TIMEOUT', description="Gitlab REST and GraphQL request timeout (seconds), no timeout when unset", default=None)
+    http2: bool = Field(validation_alias='GITLAB_HTTP2', description="Enable HTTP/2 for GraphQL (requires the h2 package)", default=False)
+    gitlab_max_concurrency: int = Field(validation_alias='GITLAB_MAX_CONCURRENCY', description="Maximum number of concurrent gitlab requests", default=8)
 
 
     ## terraform
@@ -0,0 +1,144 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from pathlib import Path
+
+from ...core import Logger
+
+
+class GitlabCache:
+    """
+    Trwały (SQLite) cache odpowiedzi z Gitlab, współdzielony pomiędzy kolejnymi uruchomieniami aplikacji.
+    Wpisy są identyfikowane przez instancję Gitlab (adres i token), typ obiektu (np. group, project) oraz fullPath.
+    Katalog i plik cache dostępne są tylko dla właściciela (0700/0600).
+    """
+
+    FILENAME = "gitlab.sqlite"
+    SCHEMA_VERSION = 2
+
+    __logger: Logger
+    __path: Path
+    __ttl: int
+    __instance: str
+    __connection: sqlite3.Connection
+
+    def __init__(self, cache_dir: Path, ttl: int, logger: Logger = None, instance: str = "") -> None:
+        """
+        Otwiera (lub tworzy) bazę cache w podanym katalogu.
+
+        :params cache_dir: Katalog, w którym przechowywany jest plik cache
+        :params ttl: Czas ważności wpisu w sekundach
+        :params logger: Logger aplikacji
+        :params instance: Identyfikator instancji Gitlab (patrz GitlabCache.fingerprint)
+        """
+        if logger == None:
+            self.__logger = Logger()
+        else:
+            self.__logger = logger
+
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        os.chmod(cache_dir, 0o700)
+        self.__path = cache_dir / self.FILENAME
+        self.__ttl = ttl
+        self.__instance = instance
+        self.__lock = threading.Lock()
+
+        os.close(os.open(self.__path, os.O_CREAT | os.O_WRONLY, 0o600))
+        os.chmod(self.__path, 0o600)
+
+        self.__connection = sqlite3.connect(self.__path, check_same_thread=False)
+        if self.__connection.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+            self.__connection.execute("DROP TABLE IF EXISTS entries")
+            self.__connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self.__connection.execute('''
+            CREATE TABLE IF NOT EXISTS entries (
+                instance TEXT NOT NULL,
+                entity TEXT NOT NULL,
+                full_path TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (instance, entity, full_path)
+            )
+        ''')
+        self.__connection.commit()
+        self.__logger.trace(f"  Set gitlab cache: {self.__path} (ttl: {self.__ttl}s)")
+
+    @staticmethod
+    def fingerprint(url: str, token: str) -> str:
+        """
+        Zwraca identyfikator instancji Gitlab na podstawie adresu i tokenu (bez zapisywania samego tokenu).
+
+        :params url: Adres instancji Gitlab
+        :params token: Token Gitlab API
+        :return: Skrót sha256 (16 znaków)
+        """
+        return hashlib.sha256(f"{url.rstrip('/')}\0{token}".encode()).hexdigest()[:16]
+
+    def get(self, entity: str, full_path: str):
+        """
+        Zwraca wpis z cache, jeżeli istnieje i nie jest przeterminowany.
+
+        :params entity: Typ obiektu (np. group, project)
+        :params full_path: Nazwa (fullPath) obiektu w Gitlab
+        :return: Zapisana wartość lub None
+        """
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT payload, updated_at FROM entries WHERE instance = ? AND entity = ? AND full_path = ?",
+                (self.__instance, entity, full_path)
+            ).fetchone()
+
+        if row is None:
+            return None
+        if time.time() - row[1] > self.__ttl:
+            self.__logger.trace(f"  Cache stale: {entity}:{full_path}")
+            return None
+        return json.loads(row[0])
+
+    def set(self, entity: str, full_path: str, value) -> None:
+        """
+        Zapisuje wartość w cache.
+
+        :params entity: Typ obiektu (np. group, project)
+        :params full_path: Nazwa (fullPath) obiektu w Gitlab
+        :params value: Wartość (serializowalna do JSON)
+        """
+        with self.__lock:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO entries (instance, entity, full_path, payload, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (self.__instance, entity, full_path, json.dumps(value), time.time())
+            )
+            self.__connection.commit()
+
+    def invalidate(self, prefix: str) -> int:
+        """
+        Usuwa z cache wszystkie wpisy dla podanej ścieżki i obiektów pod nią.
+
+        :params prefix: Nazwa (fullPath) grupy lub projektu
+        :return: Liczba usuniętych wpisów
+        """
+        prefix = prefix.rstrip('/')
+        pattern = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '/%'
+        with self.__lock:
+            cursor = self.__connection.execute(
+                "DELETE FROM entries WHERE instance = ? AND (full_path = ? OR full_path LIKE ? ESCAPE '\\')",
+                (self.__instance, prefix, pattern)
+            )
+            self.__connection.commit()
+        return cursor.rowcount
+
+    def clear(self) -> int:
+        """
+        Usuwa wszystkie wpisy instancji Gitlab z cache.
+
+        :return: Liczba usuniętych wpisów
+        """
+        with self.__lock:
+            cursor = self.__connection.execute("DELETE FROM entries WHERE instance = ?", (self.__instance,))
+            self.__connection.commit()
+        return cursor.rowcount
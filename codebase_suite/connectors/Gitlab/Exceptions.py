@@ -2,4 +2,8 @@ class GitlabInstanceUnavailableException(Exception):
     pass
 
 class GitlabGraphQLUnavailableException(Exception):
-    pass
\ No newline at end of file
+    pass
+class GitlabDeadlineExceededException(Exception):
+    pass
+class GitlabSnapshotMissException(Exception):
+    pass
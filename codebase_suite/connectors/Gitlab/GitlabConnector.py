@@ -1,20 +1,42 @@
+import asyncio
+import threading
+import types
+
+from concurrent.futures import ThreadPoolExecutor
+
 import gitlab
 import gitlab.exceptions
 import urllib3
 
+from gql.transport.exceptions import TransportQueryError
+
+from .Cache import GitlabCache
 from .Exceptions import (
     GitlabInstanceUnavailableException,
-    GitlabGraphQLUnavailableException
+    GitlabGraphQLUnavailableException,
+    GitlabSnapshotMissException
 )
+from .HttpPool import HttpPool
+from .Records import GroupRecord, ProjectRecord
+from .Retry import RetryPolicy
+from .Scheduler import RequestScheduler
+from .SingleFlight import SingleFlight
+from .Snapshot import GitlabSnapshot
+from .Stream import JsonStream
+from .Tree import NamespaceTree
 from .Graphql import (
+    query_changed_projects,
+    query_get_ancestors,
     query_get_descendantGroups,
     query_get_group,
+    query_get_nested_pages,
     query_get_project,
-    query_group_projects
+    query_group_projects,
+    projection
 )
 
 from ...config import Config
-from ...core import Logger
+from ...core import Logger, Profiler
 
 
 urllib3.disable_warnings()
@@ -29,48 +51,405 @@ class GitlabConnector:
     __graphql = None
     __config = None
     _is_dry = False
-    __cache = {}
+    __tree = NamespaceTree()
+    __paths = {'group': {}, 'project': {}}
+    __ids = {'group': {}, 'project': {}}
+    __projections = {'group': {}, 'project': {}}
+    __records = {'group': GroupRecord, 'project': ProjectRecord}
+    __indexed_roots = set()
+    __rest_cache = {}
+    __flights = SingleFlight()
+    __nested_connections = {'group': ('labels', 'ciVariables'), 'project': ('branchRules', 'ciVariables', 'labels')}
+    __nested_batch_size: int = 25
+    __max_concurrency: int = 1
+    __semaphore: asyncio.Semaphore = None
+    __semaphore_loop = None
+    __store: GitlabCache = None
+    __use_store: bool = False
+    __store_secrets: bool = False
+    __refresh: bool = False
+    __check_auth: bool = False
+    __policy: RetryPolicy = None
+    __policy_settings: dict = {}
+    __stream: bool = False
+    __snapshot: GitlabSnapshot = None
+    __snapshot_path = None
+    __rest_kinds = ('group_badges', 'project_badges', 'project_protected_tags', 'project_mirrors')
 
-    def __init__(self, logger: Logger = None) -> None:
+    def __init__(self, logger: Logger = None, check_auth: bool = None) -> None:
         """
-        Inicjalizuje połączenie z instancją Gitlab, uwierzytelnia klienta oraz tworzy obiekt GraphQL do wykonywania zapytań.
+        Inicjalizuje konektor Gitlab. Klienci API i GRAPHQL tworzeni są leniwie, przy pierwszym zapytaniu,
+        a poprawność tokenu weryfikowana jest na podstawie pierwszej odpowiedzi.
 
-        :params config: Obiekt konfiguracji Gitlab (GitlabConfig)
+        :params logger: Logger aplikacji
+        :params check_auth: Czy od razu utworzyć klientów i uwierzytelnić się w Gitlab API (domyślnie opcja --check-auth)
         """
         if logger == None:
             self.__logger = Logger()
         else:
             self.__logger = logger
         self.__config = Config()
+        self.__max_concurrency = max(1, int(self.__config.gitlab_max_concurrency))
         
-        self.__client = gitlab.Gitlab(
-            url = self.__config.gitlab_url,
-            private_token = self.__config.gitlab_token.get_secret_value(),
-            ssl_verify = self.__config.ssl_verify,
-            api_version = self.__config.api_version
-        )
+        self.__lock = threading.Lock()
         self.__logger.trace(f"  Set gitlab url: {self.__config.gitlab_url}")
         self.__logger.trace(f"  Set gitlab token: {self.__config.gitlab_token.get_secret_value()}")
         self.__logger.trace(f"  Set gitlab api version: {self.__config.api_version}")
         self.__logger.trace(f"  Set gitlab ssl verify: {self.__config.ssl_verify}")
+        self.__logger.trace(f"  Set gitlab max concurrency: {self.__max_concurrency}")
 
-        try:
-            self.__client.auth()
-            self.__logger.debug("✔️  Authorization in Gitlab API successful.")
-        except gitlab.exceptions.GitlabAuthenticationError as e:
-            self.__logger.error("❌  Authorization Gitlab API failed. Please check your configuration.")
-            raise GitlabInstanceUnavailableException
-        
-        try:
-            self.__graphql = gitlab.GraphQL(
-                url = self.__config.gitlab_url,
-                token = self.__config.gitlab_token.get_secret_value(),
-                ssl_verify = False,
+        if GitlabConnector.__policy is None:
+            GitlabConnector.__policy = RetryPolicy(logger=self.__logger, **GitlabConnector.__policy_settings)
+
+        if GitlabConnector.__snapshot_path is not None and GitlabConnector.__snapshot is None:
+            self.__load_snapshot(GitlabConnector.__snapshot_path)
+
+        if GitlabConnector.__use_store and GitlabConnector.__store is None and self.__config.cache_enabled:
+            GitlabConnector.__store = GitlabCache(
+                self.__config.cache_dir,
+                self.__config.cache_ttl,
+                self.__logger,
+                GitlabCache.fingerprint(self.__config.gitlab_url, self.__config.gitlab_token.get_secret_value())
             )
-            self.__logger.debug("✔️  Authorization in Gitlab GRAPHQL successful.")
-        except Exception as e:
-            self.__logger.error("❌  Authorization Gitlab GRAPHQL failed. Please check your configuration.")
-            raise GitlabGraphQLUnavailableException(e)
+            GitlabConnector.__store_secrets = self.__config.cache_secrets is True
+
+        if check_auth is None:
+            check_auth = GitlabConnector.__check_auth
+        if check_auth:
+            self.__get_client()
+            try:
+                self.__client.auth()
+                self.__logger.debug("✔️  Authorization in Gitlab API successful.")
+            except gitlab.exceptions.GitlabAuthenticationError as e:
+                self.__logger.error("❌  Authorization Gitlab API failed. Please check your configuration.")
+                raise GitlabInstanceUnavailableException
+            self.__get_graphql()
+
+    def __get_client(self) -> gitlab.Gitlab:
+        """
+        Zwraca klienta Gitlab API, tworząc go przy pierwszym użyciu.
+        """
+        with self.__lock:
+            if self.__client is None:
+                self.__client = gitlab.Gitlab(
+                    url = self.__config.gitlab_url,
+                    private_token = self.__config.gitlab_token.get_secret_value(),
+                    ssl_verify = self.__config.ssl_verify,
+                    api_version = self.__config.api_version,
+                    timeout = self.__config.http_timeout,
+                    session = HttpPool(self.__config, self.__logger).session()
+                )
+                self.__logger.debug("✔️  Gitlab API client created.")
+        return self.__client
+
+    def __get_graphql(self) -> gitlab.GraphQL:
+        """
+        Zwraca klienta Gitlab GRAPHQL, tworząc go przy pierwszym użyciu.
+        """
+        with self.__lock:
+            if self.__graphql is None:
+                try:
+                    self.__graphql = gitlab.GraphQL(
+                        url = self.__config.gitlab_url,
+                        token = self.__config.gitlab_token.get_secret_value(),
+                        ssl_verify = False,
+                        client = HttpPool(self.__config, self.__logger).client()
+                    )
+                    self.__logger.debug("✔️  Gitlab GRAPHQL client created.")
+                except Exception as e:
+                    self.__logger.error("❌  Authorization Gitlab GRAPHQL failed. Please check your configuration.")
+                    raise GitlabGraphQLUnavailableException(e)
+        return self.__graphql
+
+    @classmethod
+    def configure_auth(cls, check_auth: bool = False) -> None:
+        """
+        Ustawia, czy konektory mają uwierzytelniać się w Gitlab od razu przy tworzeniu (opcja --check-auth).
+
+        :params check_auth: Wartość logiczna włączająca weryfikację tokenu przy tworzeniu konektora
+        :return: None
+        """
+        cls.__check_auth = check_auth
+
+    @classmethod
+    def configure_requests(cls, retries: int = 3, deadline: float = None, hedge: bool = False, stream: bool = False) -> None:
+        """
+        Ustawia politykę odczytów z Gitlab dla wszystkich instancji konektora (opcje --retries, --deadline, --hedge, --stream-json).
+
+        :params retries: Maksymalna liczba ponowień zapytania zakończonego błędem przejściowym
+        :params deadline: Limit czasu wszystkich zapytań uruchomienia w sekundach (None - bez limitu)
+        :params hedge: Czy wysyłać zapytania zapasowe dla zapytań dłuższych niż p95
+        :params stream: Czy dekodować strony grup i projektów przyrostowo, węzeł po węźle
+        :return: None
+        """
+        cls.__policy_settings = {'retries': retries, 'deadline': deadline, 'hedge': hedge}
+        cls.__policy = None
+        cls.__stream = stream
+
+    @classmethod
+    def configure_snapshot(cls, path = None) -> None:
+        """
+        Ustawia migawkę, z której wszystkie instancje konektora obsługują odczyty bez zapytań do Gitlab (opcja --snapshot).
+
+        :params path: Plik migawki (gitlab snapshot export) lub None - odczyty z Gitlab
+        :return: None
+        """
+        cls.__snapshot_path = path
+        cls.__snapshot = None
+
+    @classmethod
+    def configure_cache(cls, enabled: bool = True, refresh: bool = False) -> None:
+        """
+        Ustawia tryb trwałego cache dla wszystkich instancji konektora (opcje --no-cache / --refresh).
+
+        :params enabled: Czy korzystać z trwałego cache (CODEBASE_CACHE_DIR)
+        :params refresh: Czy pominąć odczyt z trwałego cache i pobrać dane ponownie
+        :return: None
+        """
+        cls.__use_store = enabled
+        cls.__refresh = refresh
+        cls.__store = None
+        cls.__snapshot = None
+
+    def invalidate_cache(self, prefix: str) -> int:
+        """
+        Usuwa z cache (w pamięci i trwałego) obiekty o podanej ścieżce oraz wszystkie obiekty pod nią.
+
+        :params prefix: Nazwa (fullPath) grupy lub projektu
+        :return: Liczba usuniętych wpisów trwałego cache
+        """
+        prefix = prefix.rstrip('/')
+        self.__tree.remove(prefix)
+
+        def under(path: str) -> bool:
+            return path == prefix or path.startswith(f"{prefix}/")
+
+        for entity in self.__projections:
+            for path in list(self.__projections[entity]):
+                if under(path):
+                    del self.__projections[entity][path]
+        for entity in self.__paths:
+            for entity_id, path in list(self.__paths[entity].items()):
+                if under(path):
+                    del self.__paths[entity][entity_id]
+                    self.__ids[entity].pop(path, None)
+        for path in list(self.__indexed_roots):
+            if under(path):
+                self.__indexed_roots.discard(path)
+        for key in list(self.__rest_cache):
+            if under(key.split(':', 1)[1]):
+                del self.__rest_cache[key]
+
+        if self.__store is None:
+            return 0
+        return self.__store.invalidate(prefix)
+
+    def __cache_get(self, entity: str, full_path: str, fields: tuple = None):
+        """
+        Zwraca obiekt z cache (__cache_lookup), zapisując trafienie lub chybienie w raporcie --profile.
+
+        :params entity: Typ obiektu (group lub project)
+        :params full_path: Nazwa (fullPath) obiektu w Gitlab
+        :params fields: Wymagana projekcja pól (None - wszystkie pola)
+        :return: Obiekt lub None
+        """
+        with Profiler.span(f"cache.{entity}", full_path) as span:
+            value = self.__cache_lookup(entity, full_path, fields)
+            span.cache = 'miss' if value is None else 'hit'
+        return value
+
+    def __cache_lookup(self, entity: str, full_path: str, fields: tuple = None):
+        """
+        Zwraca obiekt z cache w pamięci lub, jeżeli jest aktualny, z trwałego cache.
+        Obiekt zapisany z węższą projekcją pól niż wymagana traktowany jest jak brak w cache.
+
+        :params entity: Typ obiektu (group lub project)
+        :params full_path: Nazwa (fullPath) obiektu w Gitlab
+        :params fields: Wymagana projekcja pól (None - wszystkie pola)
+        :return: Obiekt lub None
+        """
+        if self.__tree.get(entity, full_path) is not None:
+            return self.__held(entity, full_path, fields)
+
+        if self.__store is not None and not self.__refresh:
+            value = self.__store.get(entity, full_path)
+            if value is not None and value.get('ciVariablesRedacted'):
+                self.__logger.trace(f"  Cache entry without variable values: {entity}:{full_path}")
+                value = None
+            if value is not None:
+                held = value.pop('projection', None)
+                value = self.__records[entity].decode(value)
+                self.__tree.set(entity, full_path, value)
+                self.__index(entity, value)
+                if held is not None:
+                    self.__projections[entity][full_path] = tuple(held)
+                return self.__held(entity, full_path, fields)
+        return None
+
+    def __held(self, entity: str, full_path: str, fields: tuple = None):
+        """
+        Zwraca obiekt z cache w pamięci, jeżeli zawiera wszystkie wymagane pola.
+        """
+        value = self.__tree.get(entity, full_path)
+        held = self.__projections[entity].get(full_path)
+        if value is None or held is None or set(projection(entity, fields)) <= set(held):
+            return value
+        return None
+
+    def __cache_set(self, entity: str, full_path: str, value, fields: tuple = None):
+        """
+        Zapisuje obiekt w cache w pamięci oraz w trwałym cache. Obiekt pobrany z węższą projekcją
+        uzupełnia wcześniej zapisany wpis, a cache zapamiętuje, które pola zawiera wpis.
+
+        :params entity: Typ obiektu (group lub project)
+        :params full_path: Nazwa (fullPath) obiektu w Gitlab
+        :params value: Znormalizowany obiekt
+        :params fields: Projekcja pól obiektu (None - wszystkie pola)
+        :return: Zapisany obiekt
+        """
+        old = self.__tree.get(entity, full_path)
+        if fields is not None and old is not None:
+            old.update(value)
+            value = old
+            held = self.__projections[entity].get(full_path)
+            fields = None if held is None else projection(entity, set(held) | set(fields))
+        if fields is not None and fields == projection(entity):
+            fields = None
+
+        if fields is None:
+            self.__projections[entity].pop(full_path, None)
+        else:
+            self.__projections[entity][full_path] = fields
+        self.__tree.set(entity, full_path, value)
+        self.__index(entity, value)
+        if self.__store is not None:
+            stored = self.__redact(value.to_dict())
+            if fields is not None:
+                stored = {**stored, 'projection': list(fields)}
+            self.__store.set(entity, full_path, stored)
+        return value
+
+    def __redact(self, value: dict) -> dict:
+        """
+        Usuwa wartości zmiennych CI/CD przed zapisem w trwałym cache (chyba że włączono CODEBASE_CACHE_SECRETS).
+        Wpis bez wartości zmiennych nie jest później odczytywany z cache.
+        """
+        if self.__store_secrets or not value.get('ciVariables'):
+            return value
+        redacted = dict(value)
+        redacted['ciVariables'] = [{k: v for k, v in var.items() if k != 'value'} for var in value['ciVariables']]
+        redacted['ciVariablesRedacted'] = True
+        return redacted
+
+    def __index(self, entity: str, value: dict) -> None:
+        """
+        Dopisuje grupę lub projekt do indeksu id ↔ fullPath.
+        """
+        if entity in self.__paths and value.get('id') is not None:
+            self.__paths[entity][str(value['id'])] = value['fullPath']
+            self.__ids[entity][value['fullPath']] = str(value['id'])
+
+    def __get_full_path(self, entity: str, entity_id) -> str:
+        """
+        Zwraca fullPath grupy lub projektu na podstawie id, korzystając z indeksu id ↔ fullPath.
+        Gdy id nie jest znane, wykonuje jedno zapytanie REST i zapamiętuje wynik. Aby uniknąć
+        zapytań REST dla wielu obiektów, można wcześniej wywołać graphql_index_namespace.
+
+        :params entity: Typ obiektu (group lub project)
+        :params entity_id: Id obiektu w Gitlab lub jego fullPath
+        :return: fullPath obiektu
+        """
+        entity_id = str(entity_id)
+        if not entity_id.isdigit():
+            return entity_id
+        if entity_id in self.__paths[entity]:
+            return self.__paths[entity][entity_id]
+
+        self.__logger.trace(f"  Index miss: {entity}:{entity_id}")
+        if entity == 'group':
+            full_path = self.get_group_by_id(entity_id).full_path
+        else:
+            full_path = self.get_project_by_id(entity_id).path_with_namespace
+        self.__paths[entity][entity_id] = full_path
+        self.__ids[entity][full_path] = entity_id
+        return full_path
+
+    def graphql_index_namespace(self, full_path: str) -> None:
+        """
+        Pobiera (raz na uruchomienie) grupę wraz ze wszystkimi grupami potomnymi i projektami,
+        zasilając indeks id ↔ fullPath. Wywoływane jawnie, gdy potrzebne będą id wielu obiektów z poddrzewa.
+
+        :params full_path: Nazwa (fullPath) grupy w Gitlab
+        :return: None
+        """
+        parts = full_path.split('/')
+        if any('/'.join(parts[:i]) in self.__indexed_roots for i in range(1, len(parts) + 1)):
+            return
+        self.__indexed_roots.add(full_path)
+
+        self.__logger.debug(f"🔎  Index groups and projects of {full_path}")
+        self.graphql_get_group(full_path)
+        self.graphql_get_descendantGroups(full_path)
+        self.graphql_get_group_projects(full_path)
+
+    def get_group_full_path(self, group_id) -> str:
+        """
+        Zwraca fullPath grupy o podanym id (indeks id ↔ fullPath, w ostateczności Gitlab API).
+
+        :params group_id: Id grupy w Gitlab
+        :return: fullPath grupy
+        """
+        return self.__get_full_path('group', group_id)
+
+    def get_project_full_path(self, project_id) -> str:
+        """
+        Zwraca fullPath projektu o podanym id (indeks id ↔ fullPath, w ostateczności Gitlab API).
+
+        :params project_id: Id projektu w Gitlab
+        :return: fullPath projektu
+        """
+        return self.__get_full_path('project', project_id)
+
+    def get_group_id(self, full_path: str):
+        """
+        Zwraca id grupy o podanym fullPath, jeżeli grupa została już pobrana.
+        """
+        return self.__ids['group'].get(full_path)
+
+    def get_project_id(self, full_path: str):
+        """
+        Zwraca id projektu o podanym fullPath, jeżeli projekt został już pobrany.
+        """
+        return self.__ids['project'].get(full_path)
+
+    def __cache_set_listing(self, entity: str, full_path: str, paths: list) -> None:
+        """
+        Zapisuje listę fullPath obiektów w trwałym cache.
+        """
+        if self.__store is not None:
+            self.__store.set(entity, full_path, paths)
+
+    def __cache_get_listing(self, entity: str, full_path: str, member: str, fields: tuple = None):
+        """
+        Zwraca listę fullPath zapisaną w trwałym cache, jeżeli lista oraz wszystkie jej elementy są aktualne.
+
+        :params entity: Typ listy (np. group_projects)
+        :params full_path: Nazwa (fullPath) grupy w Gitlab
+        :params member: Typ elementów listy (np. project)
+        :params fields: Wymagana projekcja pól elementów (None - wszystkie pola)
+        :return: Lista fullPath lub None
+        """
+        if self.__store is None or self.__refresh:
+            return None
+
+        paths = self.__store.get(entity, full_path)
+        if paths is None:
+            return None
+        for path in paths:
+            if self.__cache_get(member, path, fields) is None:
+                return None
+        self.__logger.trace(f"  Cache hit: {entity}:{full_path}")
+        return paths
 
     # def set_is_dry(self, dry: bool) -> None:
     #     """
@@ -82,211 +461,832 @@ class GitlabConnector:
 
     #     self._is_dry = dry
 
+    def __load_snapshot(self, path) -> None:
+        """
+        Wczytuje migawkę i zasila z niej cache w pamięci (grupy, projekty, indeks id ↔ fullPath i ustawienia REST).
+        Migawka zastępuje trwały cache - listy grup i projektów odczytywane są z niej tak jak z GitlabCache.
+        """
+        snapshot = GitlabSnapshot(path, self.__logger)
+        GitlabConnector.__snapshot = snapshot
+        GitlabConnector.__store = snapshot
+        GitlabConnector.__store_secrets = True
+        GitlabConnector.__refresh = False
+
+        for entity in self.__records:
+            for full_path, value in snapshot.entries(entity).items():
+                value = self.__records[entity].decode(value)
+                self.__tree.set(entity, full_path, value)
+                self.__index(entity, value)
+        for kind in self.__rest_kinds:
+            for full_path, value in snapshot.entries(kind).items():
+                if kind == 'project_mirrors':
+                    value = [types.SimpleNamespace(**mirror) for mirror in value]
+                self.__rest_cache[f"{kind}:{full_path}"] = value
+        self.__logger.debug(f"✔️  Gitlab snapshot of {snapshot.root()} loaded from {path}.")
+
+    def __check_online(self, full_path: str = None) -> None:
+        """
+        Zgłasza GitlabSnapshotMissException, gdy odczyty obsługiwane są z migawki, a potrzebnych danych w niej nie ma.
+        """
+        if self.__snapshot is not None:
+            missing = f" ({full_path})" if full_path else ""
+            self.__logger.error(f"❌  Requested data{missing} is missing in the snapshot {self.__snapshot_path}.")
+            raise GitlabSnapshotMissException(full_path)
+
+    def export_snapshot(self, full_path: str, output) -> GitlabSnapshot:
+        """
+        Pobiera grupę wraz z grupami potomnymi, projektami i ustawieniami dostępnymi tylko w Gitlab API
+        (badges, protected tags, mirrory) i zapisuje je w pliku migawki. Grupy i projekty pobierane są
+        zbiorczo zapytaniami GraphQL, a ustawienia REST - równolegle (GITLAB_MAX_CONCURRENCY).
+
+        :params full_path: Nazwa (fullPath) grupy w Gitlab
+        :params output: Plik migawki
+        :return: Zapisana migawka
+        """
+        self.__logger.debug(f"🔎  Export snapshot of {full_path}")
+        root = self.graphql_get_group(full_path)
+        if root is None:
+            raise GitlabSnapshotMissException(full_path)
+        groups = [root, *self.graphql_get_descendantGroups(full_path)]
+        projects = self.graphql_get_group_projects(full_path)
+
+        settings = [('group_badges', group['fullPath']) for group in groups]
+        for project in projects:
+            settings.extend((kind, project['fullPath']) for kind in self.__rest_kinds[1:])
+        self.prefetch_rest_settings(settings)
+
+        snapshot = GitlabSnapshot(logger=self.__logger)
+        for group in groups:
+            path = group['fullPath']
+            snapshot.set('group', path, group.to_dict())
+            snapshot.set('descendant_groups', path, [child['fullPath'] for child in self.__tree.descendant_groups(path)])
+            snapshot.set('group_projects', path, [project['fullPath'] for project in self.__tree.projects(path)])
+            snapshot.set('group_badges', path, self.get_group_badges(path))
+        for project in projects:
+            path = project['fullPath']
+            snapshot.set('project', path, project.to_dict())
+            snapshot.set('project_badges', path, self.get_project_badges(path))
+            snapshot.set('project_protected_tags', path, self.get_project_protected_tags(path))
+            snapshot.set('project_mirrors', path, [mirror.attributes for mirror in self.get_project_mirrors(path)])
+        snapshot.save(output, full_path)
+        return snapshot
+
+    def __acquire(self, priority: int) -> None:
+        """
+        Czeka na zgodę planisty zapytań (limit zapytań instancji Gitlab) na wysłanie zapytania.
+        """
+        HttpPool(self.__config, self.__logger).scheduler().acquire(priority)
+
+    def __rest_execute(self, call, priority: int = RequestScheduler.PRIORITY_SETTINGS, target = None):
+        """
+        Wykonuje zapytanie do Gitlab API. Ponieważ uwierzytelnienie jest leniwe, błąd autoryzacji
+        przy pierwszym zapytaniu zamieniany jest na GitlabInstanceUnavailableException.
+
+        :params call: Funkcja wywoływana z klientem Gitlab API
+        :params priority: Priorytet zapytania w planiście zapytań
+        :params target: Id lub fullPath obiektu zapytania (raport --profile)
+        :return: Wynik zapytania
+        """
+        self.__check_online()
+        client = self.__get_client()
+
+        def execute():
+            self.__acquire(priority)
+            return call(client)
+
+        try:
+            with Profiler.span('gitlab.rest', target):
+                return self.__policy.call(execute)
+        except gitlab.exceptions.GitlabError as e:
+            if isinstance(e, gitlab.exceptions.GitlabAuthenticationError) or e.response_code == 401:
+                self.__logger.error("❌  Authorization Gitlab API failed. Please check your configuration.")
+                raise GitlabInstanceUnavailableException(e)
+            raise
+
     def get_project_by_id(self, project_id: int):
         """
         Wykonuje zapytanie do API, aby pobrać project o podanym id.
         """
-        return self.__client.projects.get(id=project_id)
+        return self.__rest_execute(lambda client: client.projects.get(id=project_id), RequestScheduler.PRIORITY_PROJECT, project_id)
     
     def get_group_by_id(self, group_id: int):
         """
         Wykonuje zapytanie do API, aby pobrać grupę o podanym id.
         """
-        return self.__client.groups.get(id=group_id)
+        return self.__rest_execute(lambda client: client.groups.get(id=group_id), RequestScheduler.PRIORITY_GROUP, group_id)
 
 
+    def __rest_key(self, entity: str, kind: str, owner) -> str:
+        """
+        Zwraca klucz cache ustawień REST właściciela (id zamieniane jest na fullPath, jeżeli jest znane).
+        """
+        owner = str(owner)
+        return f"{kind}:{self.__paths[entity].get(owner, owner)}"
+
+    def __rest_cached(self, key: str, call, target):
+        """
+        Zwraca ustawienie REST z cache w pamięci lub pobiera je z Gitlab API i zapamiętuje.
+
+        :params key: Klucz cache (__rest_key)
+        :params call: Funkcja wywoływana z klientem Gitlab API
+        :params target: Id lub fullPath właściciela ustawienia
+        :return: Ustawienie
+        """
+        with Profiler.span(f"cache.{key.split(':', 1)[0]}", target) as span:
+            span.cache = 'hit' if key in self.__rest_cache else 'miss'
+            if key not in self.__rest_cache:
+                def fetch():
+                    if key not in self.__rest_cache:
+                        self.__rest_cache[key] = self.__rest_execute(call, target=target)
+                # równoczesne pobranie tego samego ustawienia (np. prefetch_rest_settings) wykonuje jedno zapytanie
+                self.__flights.do(key, fetch)
+        return self.__rest_cache[key]
+
     def get_group_badges(self, full_path: str):
         """
         Wykonuje zapytanie do API, aby pobrać badges dla danej grupy
         """
-        badges = []
-        badges.extend(self.__client.groups.get(full_path).badges.list(all=True))
-        
-        return [badge.attributes for badge in badges]
+        key = self.__rest_key('group', 'group_badges', full_path)
+        return self.__rest_cached(key, lambda client: [
+            badge.attributes for badge in client.groups.get(full_path, lazy=True).badges.list(all=True, per_page=100)
+        ], full_path)
 
     def get_project_badges(self, full_path: str):
         """
         Wykonuje zapytanie do API, aby pobrać badges dla danego projektu
         """
-        badges = []
-        badges.extend(self.__client.projects.get(full_path).badges.list(all=True))
-        
-        return [badge.attributes for badge in badges]
+        key = self.__rest_key('project', 'project_badges', full_path)
+        return self.__rest_cached(key, lambda client: [
+            badge.attributes for badge in client.projects.get(full_path, lazy=True).badges.list(all=True, per_page=100)
+        ], full_path)
 
     def get_project_mirrors(self, project: str):
         """
         Wykonuje zapytanie do API, aby pobrać mirror dla danego projektu
         """
-        project_obj = self.__client.projects.get(project)
-        return project_obj.remote_mirrors.list()
+        key = self.__rest_key('project', 'project_mirrors', project)
+        return self.__rest_cached(
+            key, lambda client: client.projects.get(project, lazy=True).remote_mirrors.list(all=True, per_page=100), project
+        )
 
     def get_project_protected_tags(self, full_path: str):
         """
         Wykonuje zapytanie do Api, aby pobrać protected tags dla danego projektu.
         """
-        protected_tags = []
-        protected_tags.extend(self.__client.projects.get(full_path).protectedtags.list(all=True))
-        return [tag.attributes for tag in protected_tags]
+        key = self.__rest_key('project', 'project_protected_tags', full_path)
+        return self.__rest_cached(key, lambda client: [
+            tag.attributes for tag in client.projects.get(full_path, lazy=True).protectedtags.list(all=True, per_page=100)
+        ], full_path)
+
+    def prefetch_rest_settings(self, settings: list) -> None:
+        """
+        Pobiera równolegle (z ograniczeniem GITLAB_MAX_CONCURRENCY) ustawienia dostępne tylko w Gitlab API.
+        Błędy nie przerywają pobierania - zostaną zgłoszone przy właściwym odczycie ustawienia.
+
+        :params settings: Lista par (rodzaj, właściciel), gdzie rodzaj to group_badges, project_badges,
+                          project_protected_tags lub project_mirrors, a właściciel to id lub fullPath
+        :return: None
+        """
+        self.__run(self.async_prefetch_rest_settings(settings))
+
+    async def async_prefetch_rest_settings(self, settings: list) -> None:
+        """
+        Asynchroniczny odpowiednik prefetch_rest_settings.
+
+        :params settings: Lista par (rodzaj, właściciel)
+        :return: None
+        """
+        calls = {
+            'group_badges': self.get_group_badges,
+            'project_badges': self.get_project_badges,
+            'project_protected_tags': self.get_project_protected_tags,
+            'project_mirrors': self.get_project_mirrors,
+        }
+        pending = []
+        for kind, owner in dict.fromkeys(settings):
+            if kind in calls:
+                pending.append((kind, owner))
+            else:
+                self.__logger.trace(f"  Skip prefetch of unknown setting: {kind}")
+
+        self.__logger.debug(f"🔼  Prefetch {len(pending)} REST settings")
+        results = await asyncio.gather(
+            *[self.__rest_call_async(calls[kind], owner) for kind, owner in pending],
+            return_exceptions=True
+        )
+        for (kind, owner), result in zip(pending, results):
+            if isinstance(result, Exception):
+                self.__logger.trace(f"  Prefetch of {kind} for {owner} failed: {result}")
+
+    async def __rest_call_async(self, call, *args):
+        """
+        Wykonuje wywołanie Gitlab API w wątku roboczym, z ograniczeniem liczby równoległych zapytań.
+        """
+        async with self.__get_semaphore():
+            return await asyncio.to_thread(call, *args)
+
+    def __run(self, coroutine):
+        """
+        Uruchamia korutynę silnika asynchronicznego z poziomu synchronicznego API.
+
+        :params coroutine: Korutyna do wykonania
+        :return: Wynik korutyny
+        """
+        return asyncio.run(coroutine)
 
-    def graphql_get_group(self, full_path: str):
+    def __get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Zwraca semafor ograniczający liczbę równoległych zapytań w bieżącej pętli zdarzeń.
+        """
+        loop = asyncio.get_running_loop()
+        if self.__semaphore_loop is not loop:
+            self.__semaphore = asyncio.Semaphore(self.__max_concurrency)
+            self.__semaphore_loop = loop
+        return self.__semaphore
+
+    def __graphql_execute(self, query: str, variables: dict, priority: int = RequestScheduler.PRIORITY_GROUP) -> dict:
+        """
+        Wykonuje zapytanie GraphQL w sposób synchroniczny.
+        """
+        self.__check_online(variables.get('fullPath', variables.get('path0')))
+        graphql = self.__get_graphql()
+
+        def execute():
+            self.__acquire(priority)
+            return graphql.execute(query, variables)
+
+        try:
+            with Profiler.span('gitlab.graphql', variables.get('fullPath', variables.get('path0'))):
+                return self.__policy.call(execute)
+        except gitlab.exceptions.GitlabAuthenticationError as e:
+            self.__logger.error("❌  Authorization Gitlab GRAPHQL failed. Please check your configuration.")
+            raise GitlabInstanceUnavailableException(e)
+
+    async def __graphql_execute_async(self, query: str, variables: dict, priority: int = RequestScheduler.PRIORITY_GROUP) -> dict:
+        """
+        Wykonuje zapytanie GraphQL w wątku roboczym, z ograniczeniem liczby równoległych zapytań.
+        """
+        async with self.__get_semaphore():
+            return await asyncio.to_thread(self.__graphql_execute, query, variables, priority)
+
+    async def __graphql_paginate_async(self, query: str, variables: dict, connection: str, priority: int = RequestScheduler.PRIORITY_GROUP) -> list:
+        """
+        Pobiera kolejne strony połączenia GraphQL (cursor) dla grupy i zwraca wszystkie węzły.
+
+        :params query: Zapytanie GraphQL z parametrem $after
+        :params variables: Zmienne zapytania (bez $after)
+        :params connection: Nazwa połączenia w grupie (np. projects, descendantGroups)
+        :params priority: Priorytet zapytań w planiście zapytań
+        :return: Lista węzłów ze wszystkich stron
+        """
+        nodes = []
+        after = None
+        while True:
+            if self.__stream:
+                async with self.__get_semaphore():
+                    result = await asyncio.to_thread(self.__graphql_stream_page, query, {**variables, 'after': after}, connection, priority)
+            else:
+                result = await self.__graphql_execute_async(query, {**variables, 'after': after}, priority)
+                result = result['group']
+            if result is None:
+                break
+
+            nodes.extend(result[connection]['nodes'])
+            if not result[connection]['pageInfo']['hasNextPage']:
+                break
+
+            after = result[connection]['pageInfo']['endCursor']
+        return nodes
+
+    def __graphql_stream_page(self, query: str, variables: dict, connection: str, priority: int = RequestScheduler.PRIORITY_GROUP) -> dict:
+        """
+        Pobiera stronę połączenia GraphQL grupy, dekodując odpowiedź przyrostowo (JsonStream) - cała odpowiedź
+        nie jest przechowywana w pamięci, a każdy węzeł bez niepełnych połączeń zagnieżdżonych jest od razu
+        zamieniany na zwarty rekord (GroupRecord, ProjectRecord).
+
+        :params query: Zapytanie GraphQL z parametrem $after
+        :params variables: Zmienne zapytania
+        :params connection: Nazwa połączenia w grupie (np. projects, descendantGroups)
+        :params priority: Priorytet zapytania w planiście zapytań
+        :return: Grupa z połączeniem (nodes, pageInfo) lub None, gdy grupa nie istnieje
+        """
+        self.__check_online(variables.get('fullPath'))
+        client = HttpPool(self.__config, self.__logger).client()
+        url = f"{self.__config.gitlab_url.rstrip('/')}/api/graphql"
+        entity = 'group' if connection == 'descendantGroups' else 'project'
+
+        def execute():
+            self.__acquire(priority)
+            response = client.send(client.build_request('POST', url, json={'query': query, 'variables': variables}), stream=True)
+            if response.status_code >= 400:
+                response.read()
+                response.close()
+                if response.status_code == 401:
+                    raise gitlab.exceptions.GitlabAuthenticationError(response_code=response.status_code, error_message=response.text)
+                raise gitlab.exceptions.GitlabHttpError(response_code=response.status_code, error_message=response.text)
+            return response
+
+        # pomiar obejmuje odczyt strumienia - rozmiar odpowiedzi znany jest dopiero po jej pobraniu
+        with Profiler.span('gitlab.graphql', variables.get('fullPath')):
+            try:
+                response = self.__policy.call(execute)
+            except gitlab.exceptions.GitlabAuthenticationError as e:
+                self.__logger.error("❌  Authorization Gitlab GRAPHQL failed. Please check your configuration.")
+                raise GitlabInstanceUnavailableException(e)
+
+            nodes = []
+            stream = JsonStream(response.iter_text(), ('data', 'group', connection, 'nodes'))
+            try:
+                for node in stream:
+                    nodes.append(node if self.__nested_pending(entity, [node]) else self.__records[entity].decode(node))
+            finally:
+                response.close()
+
+        document = stream.document()
+        if document.get('errors'):
+            raise TransportQueryError(str(document['errors'][0]), errors=document['errors'], data=document.get('data'))
+        group = document['data']['group']
+        if group is not None:
+            group[connection]['nodes'] = nodes
+        return group
+
+    def __priority(self, entity: str) -> int:
+        """
+        Zwraca priorytet zapytań GraphQL o grupy lub projekty.
+        """
+        return RequestScheduler.PRIORITY_GROUP if entity == 'group' else RequestScheduler.PRIORITY_PROJECT
+
+    def __graphql_iter_pages(self, query: str, variables: dict, connection: str, entity: str, fields: tuple = None):
+        """
+        Pobiera kolejne strony połączenia GraphQL (cursor) dla grupy i zwraca je strona po stronie.
+        Następna strona (wraz z brakującymi stronami połączeń zagnieżdżonych) jest pobierana w tle,
+        podczas gdy wywołujący przetwarza bieżącą.
+
+        :params query: Zapytanie GraphQL z parametrem $after
+        :params variables: Zmienne zapytania (bez $after)
+        :params connection: Nazwa połączenia w grupie (np. projects, descendantGroups)
+        :params entity: Typ węzłów połączenia (group lub project)
+        :params fields: Projekcja pól węzłów - węzły zapisane już w cache z tymi polami nie są uzupełniane
+        :return: Generator list węzłów (przed normalizacją)
+        """
+        def fetch(after):
+            if self.__stream:
+                result = self.__graphql_stream_page(query, {**variables, 'after': after}, connection, self.__priority(entity))
+            else:
+                result = self.__graphql_execute(query, {**variables, 'after': after}, self.__priority(entity))['group']
+            if result is None:
+                return None
+            page = result[connection]
+            self.__graphql_complete_nested(entity, [node for node in page['nodes'] if self.__held(entity, node['fullPath'], fields) is None])
+            return page
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(fetch, None)
+            while future is not None:
+                page = future.result()
+                if page is None:
+                    return
+                future = None
+                if page['pageInfo']['hasNextPage']:
+                    future = executor.submit(fetch, page['pageInfo']['endCursor'])
+                yield page['nodes']
+
+    async def __graphql_complete_nested_async(self, entity: str, nodes: list) -> list:
+        """
+        Dopobiera brakujące strony zagnieżdżonych połączeń (labels, ciVariables, branchRules) grup lub projektów.
+        Pobierane są tylko pozostałe strony, zgrupowane po kilka(naście) w jednym zapytaniu z aliasami.
+
+        :params entity: Typ obiektu (group lub project)
+        :params nodes: Węzły GraphQL (przed normalizacją)
+        :return: Węzły z kompletnymi połączeniami
+        """
+        pending = self.__nested_pending(entity, nodes)
+        while pending:
+            self.__logger.trace(f"  Fetch next pages of {len(pending)} nested {entity} connections")
+            size = self.__nested_batch_size
+            await asyncio.gather(*[
+                self.__graphql_nested_batch_async(entity, pending[i:i + size]) for i in range(0, len(pending), size)
+            ])
+            pending = [(node, connection) for node, connection in pending if node[connection]['pageInfo']['hasNextPage']]
+        return nodes
+
+    def __graphql_complete_nested(self, entity: str, nodes: list) -> list:
+        """
+        Synchroniczny odpowiednik __graphql_complete_nested_async.
+        """
+        if self.__nested_pending(entity, nodes):
+            self.__run(self.__graphql_complete_nested_async(entity, nodes))
+        return nodes
+
+    def __nested_pending(self, entity: str, nodes: list) -> list:
+        """
+        Zwraca pary (węzeł, połączenie), dla których Gitlab zwrócił niepełną listę (hasNextPage).
+        """
+        pending = []
+        for node in nodes:
+            for connection in self.__nested_connections[entity]:
+                page = node.get(connection)
+                if isinstance(page, dict) and isinstance(page.get('pageInfo'), dict) and page['pageInfo']['hasNextPage']:
+                    pending.append((node, connection))
+        return pending
+
+    async def __graphql_nested_batch_async(self, entity: str, batch: list) -> None:
+        """
+        Pobiera jednym zapytaniem kolejne strony zagnieżdżonych połączeń i dołącza je do węzłów.
+        """
+        variables = {}
+        for i, (node, connection) in enumerate(batch):
+            variables[f"path{i}"] = node['fullPath']
+            variables[f"after{i}"] = node[connection]['pageInfo']['endCursor']
+
+        query = query_get_nested_pages(entity, [c for _, c in batch])
+        result = await self.__graphql_execute_async(query, variables, self.__priority(entity))
+        for i, (node, connection) in enumerate(batch):
+            page = result[f"page{i}"]
+            if page is None:
+                self.__logger.warning(f"⛔  {entity} {node['fullPath']} not found while fetching {connection}")
+                node[connection]['pageInfo']['hasNextPage'] = False
+                continue
+            node[connection]['nodes'].extend(page[connection]['nodes'])
+            node[connection]['pageInfo'] = page[connection]['pageInfo']
+
+    def graphql_get_group(self, full_path: str, fields: tuple = None):
         """
         Wykonuje zapytanie GraphQl, aby pobrać informacje o grupie
 
         :params full_path: Nazwa (fullPath) grupy w Gitlab
+        :params fields: Potrzebne pola grupy (None - wszystkie pola), id i fullPath pobierane są zawsze
         :return: Słownik zawierający wyniki zapytań GraphQL
         """
-        cache_id = f"group:{full_path}"
-        if cache_id not in self.__cache:
-            variables = {
-                'fullPath': full_path
-            }
-            if cache_id not in self.__cache:
-                self.__cache[cache_id] = self.__graphql.execute(query_get_group(), variables)['group']
-                self.__cache[cache_id]['ciVariables'] = self.__cache[cache_id]["ciVariables"]['nodes']
-                for i in self.__cache[cache_id]['ciVariables']:
-                    i['id'] = i['id'].replace("gid://gitlab/Ci::GroupVariable/","")
-                self.__cache[cache_id]['labels'] = self.__cache[cache_id]["labels"]['nodes']
-                for i in self.__cache[cache_id]['labels']:
-                    i['id'] = i['id'].replace("gid://gitlab/GroupLabel/","")
-                    i['id'] = i['id'].replace("gid://gitlab/ProjectLabel/","")
-                self.__cache[cache_id]['id'] = self.__cache[cache_id]['id'].replace("gid://gitlab/Group/","")
-        return self.__cache[cache_id]
-
-    def graphql_get_descendantGroups(self, full_path: str):
+        fields = None if fields is None else projection('group', fields)
+        group = self.__cache_get('group', full_path, fields)
+        if group is None:
+            def fetch():
+                # grupa mogła zostać zapisana przez zakończone przed chwilą równoczesne wywołanie
+                group = self.__held('group', full_path, fields)
+                if group is not None:
+                    return group
+                variables = {
+                    'fullPath': full_path
+                }
+                group = self.__graphql_execute(query_get_group(fields), variables)['group']
+                if group is None:
+                    return None
+                self.__graphql_complete_nested('group', [group])
+                return self.__cache_set('group', full_path, GroupRecord.decode(group), fields)
+            group = self.__flights.do(('group', full_path, fields), fetch)
+        return group
+
+    async def async_graphql_get_group(self, full_path: str, fields: tuple = None):
+        """
+        Asynchroniczny odpowiednik graphql_get_group.
+
+        :params full_path: Nazwa (fullPath) grupy w Gitlab
+        :params fields: Potrzebne pola grupy (None - wszystkie pola)
+        :return: Słownik zawierający wyniki zapytań GraphQL
+        """
+        fields = None if fields is None else projection('group', fields)
+        group = self.__cache_get('group', full_path, fields)
+        if group is None:
+            async def fetch():
+                group = self.__held('group', full_path, fields)
+                if group is not None:
+                    return group
+                variables = {
+                    'fullPath': full_path
+                }
+                group = (await self.__graphql_execute_async(query_get_group(fields), variables))['group']
+                if group is None:
+                    return None
+                await self.__graphql_complete_nested_async('group', [group])
+                return self.__cache_set('group', full_path, GroupRecord.decode(group), fields)
+            group = await self.__flights.do_async(('group', full_path, fields), fetch)
+        return group
+
+    def graphql_get_descendantGroups(self, full_path: str, fields: tuple = None):
         """
         Wykonuje zapytanie GraphQl, aby pobrać grupy potomne dla podanej grupy.
         dla wszystkich projektów w wybranej grupie.
 
         :params group: Nazwa (fullPath) grupy w Gitlab
+        :params fields: Potrzebne pola grup (None - wszystkie pola)
         :return: Słownik zawierający wyniki zapytań GraphQL
         """
-        after= None
-        while True:
+        return self.__run(self.async_graphql_get_descendantGroups(full_path, fields))
+
+    async def async_graphql_get_descendantGroups(self, full_path: str, fields: tuple = None):
+        """
+        Asynchroniczny odpowiednik graphql_get_descendantGroups.
+        Zapamiętuje strukturę drzewa grupy, dzięki czemu kolejne zapytania o projekty
+        mogą być wykonywane równolegle dla każdej podgrupy.
+
+        :params full_path: Nazwa (fullPath) grupy w Gitlab
+        :params fields: Potrzebne pola grup (None - wszystkie pola)
+        :return: Lista grup potomnych
+        """
+        fields = None if fields is None else projection('group', fields)
+        paths = self.__cache_get_listing('descendant_groups', full_path, 'group', fields)
+        if paths is None:
             variables = {
-                'after': after,
                 'fullPath': full_path
             }
-            result = self.__graphql.execute(query_get_descendantGroups(), variables)['group']
-            if result != None:
-                for group in result['descendantGroups']['nodes']:
-                    cache_id = f"group:{group['fullPath']}"
-                    if not cache_id in self.__cache:
-                        self.__cache[cache_id] = group
-                        
-                        self.__cache[cache_id]['ciVariables'] = self.__cache[cache_id]["ciVariables"]['nodes']
-                        for i in self.__cache[cache_id]['ciVariables']:
-                            i['id'] = i['id'].replace("gid://gitlab/Ci::GroupVariable/","")
-                        
-                        self.__cache[cache_id]['labels'] = self.__cache[cache_id]["labels"]['nodes']
-                        for i in self.__cache[cache_id]['labels']:
-                            i['id'] = i['id'].replace("gid://gitlab/GroupLabel/","")
-                        
-                        self.__cache[cache_id]['id'] = self.__cache[cache_id]['id'].replace("gid://gitlab/Group/","")
-    
-            if not result['descendantGroups']['pageInfo']['hasNextPage']:
-                break
-    
-            after = result['descendantGroups']['pageInfo']['endCursor']
+            nodes = await self.__graphql_paginate_async(query_get_descendantGroups(fields), variables, 'descendantGroups')
+            groups = [group for group in nodes if self.__held('group', group['fullPath'], fields) is None]
+            await self.__graphql_complete_nested_async('group', groups)
+            for group in groups:
+                self.__cache_set('group', group['fullPath'], GroupRecord.decode(group), fields)
+            paths = [group['fullPath'] for group in nodes]
+            self.__cache_set_listing('descendant_groups', full_path, paths)
+        self.__tree.set_complete(full_path)
+        return self.__tree.descendant_groups(full_path)
 
-        ret = []
-        for k in self.__cache:
-            if k != f"group:{full_path}" and k.startswith(f"group:{full_path}"):
-                ret.append(self.__cache[k])
-        return ret
+    def iter_descendant_groups(self, full_path: str, fields: tuple = None):
+        """
+        Strumieniowy odpowiednik graphql_get_descendantGroups - zwraca grupy potomne strona po stronie,
+        dzięki czemu ich przetwarzanie może zacząć się przed pobraniem całego drzewa.
 
-    def graphql_get_group_projects(self, full_path: str):
+        :params full_path: Nazwa (fullPath) grupy w Gitlab
+        :params fields: Potrzebne pola grup (None - wszystkie pola)
+        :return: Generator grup potomnych
+        """
+        fields = None if fields is None else projection('group', fields)
+        children = self.__tree.children(full_path)
+        known = children is not None and all(
+            self.__held('group', group['fullPath'], fields) is not None for group in self.__tree.descendant_groups(full_path)
+        )
+        if known or self.__cache_get_listing('descendant_groups', full_path, 'group', fields) is not None:
+            self.__tree.set_complete(full_path)
+            yield from self.__tree.descendant_groups(full_path)
+            return
+
+        paths = []
+        pages = self.__graphql_iter_pages(query_get_descendantGroups(fields), {'fullPath': full_path}, 'descendantGroups', 'group', fields)
+        for nodes in pages:
+            for group in nodes:
+                paths.append(group['fullPath'])
+                cached = self.__held('group', group['fullPath'], fields)
+                yield cached if cached is not None else self.__cache_set('group', group['fullPath'], GroupRecord.decode(group), fields)
+        self.__cache_set_listing('descendant_groups', full_path, paths)
+        self.__tree.set_complete(full_path)
+
+    def graphql_get_group_projects(self, full_path: str, fields: tuple = None):
         """
         Wykonuje zapytanie GraphQl, aby pobrać informacje o wszystkich projektach w grupie.
 
         :params group: Nazwa (fullPath) grupy w Gitlab
+        :params fields: Potrzebne pola projektów (None - wszystkie pola), np. ('ciConfigPathOrDefault',)
         :return: Słownik zawierający wyniki zapytań GraphQL
         """
-        after= None
+        return self.__run(self.async_graphql_get_group_projects(full_path, fields))
+
+    async def async_graphql_get_group_projects(self, full_path: str, fields: tuple = None):
+        """
+        Asynchroniczny odpowiednik graphql_get_group_projects.
+        Jeżeli grupy potomne zostały wcześniej pobrane, strony projektów są pobierane
+        równolegle dla każdej bezpośredniej podgrupy (z ograniczeniem GITLAB_MAX_CONCURRENCY).
+
+        :params full_path: Nazwa (fullPath) grupy w Gitlab
+        :params fields: Potrzebne pola projektów (None - wszystkie pola)
+        :return: Lista projektów w grupie i jej podgrupach
+        """
+        fields = None if fields is None else projection('project', fields)
+        query = query_group_projects(fields)
+        children = self.__tree.children(full_path)
+        if self.__cache_get_listing('group_projects', full_path, 'project', fields) is not None:
+            pages = []
+        elif children is None:
+            pages = [
+                await self.__graphql_paginate_async(query, {'fullPath': full_path}, 'projects', RequestScheduler.PRIORITY_PROJECT)
+            ]
+        else:
+            self.__logger.trace(f"  Fetch projects of {full_path} concurrently for {len(children)} subgroups")
+            tasks = [
+                self.__graphql_paginate_async(query, {'fullPath': full_path, 'includeSubgroups': False}, 'projects', RequestScheduler.PRIORITY_PROJECT)
+            ]
+            for child in children:
+                tasks.append(self.__graphql_paginate_async(query, {'fullPath': child}, 'projects', RequestScheduler.PRIORITY_PROJECT))
+            pages = await asyncio.gather(*tasks)
+
+        if pages:
+            projects = [project for nodes in pages for project in nodes if self.__held('project', project['fullPath'], fields) is None]
+            await self.__graphql_complete_nested_async('project', projects)
+            for project in projects:
+                self.__cache_set('project', project['fullPath'], ProjectRecord.decode(project), fields)
+            paths = [project['fullPath'] for nodes in pages for project in nodes]
+            self.__cache_set_listing('group_projects', full_path, paths)
+
+        return self.__tree.projects(full_path)
+
+    def iter_group_projects(self, full_path: str, fields: tuple = None):
+        """
+        Strumieniowy odpowiednik graphql_get_group_projects - zwraca projekty grupy i jej podgrup strona po stronie,
+        dzięki czemu ich przetwarzanie może zacząć się przed pobraniem wszystkich projektów.
+
+        :params full_path: Nazwa (fullPath) grupy w Gitlab
+        :params fields: Potrzebne pola projektów (None - wszystkie pola)
+        :return: Generator projektów
+        """
+        fields = None if fields is None else projection('project', fields)
+        if self.__cache_get_listing('group_projects', full_path, 'project', fields) is not None:
+            yield from self.__tree.projects(full_path)
+            return
+
+        paths = []
+        for nodes in self.__graphql_iter_pages(query_group_projects(fields), {'fullPath': full_path}, 'projects', 'project', fields):
+            for project in nodes:
+                paths.append(project['fullPath'])
+                cached = self.__held('project', project['fullPath'], fields)
+                yield cached if cached is not None else self.__cache_set('project', project['fullPath'], ProjectRecord.decode(project), fields)
+        self.__cache_set_listing('group_projects', full_path, paths)
+
+    def graphql_get_changed_groups(self, full_path: str) -> list:
+        """
+        Pobiera grupę wraz z grupami potomnymi i zwraca te, które zmieniły się od poprzedniego uruchomienia
+        (w porównaniu z trwałym cache). Gitlab nie udostępnia sortowania grup potomnych według daty zmiany,
+        dlatego grupy pobierane są zawsze, a pomijane jest jedynie ponowne generowanie niezmienionych.
+
+        :params full_path: Nazwa (fullPath) grupy w Gitlab
+        :return: Lista zmienionych grup (grupa podana jako pierwsza, jeżeli się zmieniła)
+        """
+        group = self.__graphql_execute(query_get_group(), {'fullPath': full_path})['group']
+        if group is None:
+            return []
+        nodes = self.__run(self.__graphql_paginate_async(query_get_descendantGroups(), {'fullPath': full_path}, 'descendantGroups'))
+        self.__graphql_complete_nested('group', [group] + nodes)
+
+        changed = []
+        for node in [group] + nodes:
+            node = GroupRecord.decode(node)
+            if self.__changed('group', node['fullPath'], node):
+                changed.append(node)
+            self.__cache_set('group', node['fullPath'], node)
+        self.__cache_set_listing('descendant_groups', full_path, [node['fullPath'] for node in nodes])
+        self.__tree.set_complete(full_path)
+        self.__logger.debug(f"🔎  {len(changed)} of {len(nodes) + 1} groups of {full_path} changed")
+        return changed
+
+    def graphql_get_changed_projects(self, full_path: str) -> list:
+        """
+        Zwraca projekty grupy i jej podgrup aktywne (lastActivityAt) od poprzedniej synchronizacji przyrostowej.
+        Projekty pobierane są od ostatnio aktywnych, a stronicowanie kończy się na znaczniku zapisanym
+        w trwałym cache dla grupy. Zmienione projekty zapisywane są w cache, a znacznik jest przesuwany.
+        Bez trwałego cache (lub z opcją --refresh) zwracane są wszystkie projekty.
+
+        :params full_path: Nazwa (fullPath) grupy w Gitlab
+        :return: Lista zmienionych projektów
+        """
+        since = None
+        if self.__store is None:
+            self.__logger.warning("⛔  Incremental sync requires persistent cache (CODEBASE_CACHE_ENABLED), fetching all projects.")
+        elif not self.__refresh:
+            since = (self.__store.get('watermark', full_path) or {}).get('projects')
+        self.__logger.trace(f"  Fetch projects of {full_path} active since {since}")
+
+        nodes = []
+        after = None
         while True:
-            variables = {
-                'after': after,
-                'fullPath': full_path
-            }
-            result = self.__graphql.execute(query_group_projects(), variables)['group']
-            if result != None:
-                for project in result['projects']['nodes']:
-                    cache_id = f"project:{project['fullPath']}"
-                    if not cache_id in self.__cache:
-                        self.__cache[cache_id] = project
-                        self.__cache[cache_id]['branchRules'] = self.__cache[cache_id]["branchRules"]['nodes']
-                        for i in self.__cache[cache_id]['branchRules']:
-                            i['id'] = i['id'].replace("gid://gitlab/Projects::AllBranchesRule/","")
-                            i['id'] = i['id'].replace("gid://gitlab/Projects::BranchRule/","")
-                            if i.get('branchProtection') is not None:
-                                i['branchProtection']['pushAccessLevels'] = i['branchProtection']['pushAccessLevels']['nodes']
-                                i['branchProtection']['mergeAccessLevels'] = i['branchProtection']['mergeAccessLevels']['nodes']
-                        
-                        self.__cache[cache_id]['ciVariables'] = self.__cache[cache_id]["ciVariables"]['nodes']
-                        for i in self.__cache[cache_id]['ciVariables']:
-                            i['id'] = i['id'].replace("gid://gitlab/Ci::Variable/","")
-                        
-                        self.__cache[cache_id]['labels'] = self.__cache[cache_id]["labels"]['nodes']
-                        for i in self.__cache[cache_id]['labels']:
-                            i['id'] = i['id'].replace("gid://gitlab/GroupLabel/","")
-
-                        self.__cache[cache_id]['id'] = self.__cache[cache_id]['id'].replace("gid://gitlab/Project/","")
-            if not result['projects']['pageInfo']['hasNextPage']:
+            result = self.__graphql_execute(query_changed_projects(), {'fullPath': full_path, 'after': after}, RequestScheduler.PRIORITY_PROJECT)['group']
+            if result is None:
                 break
-    
-            after = result['projects']['pageInfo']['endCursor']
+            page = result['projects']
+            fresh = [node for node in page['nodes'] if since is None or (node.get('lastActivityAt') or '') > since]
+            nodes.extend(fresh)
+            if len(fresh) < len(page['nodes']) or not page['pageInfo']['hasNextPage']:
+                break
+            after = page['pageInfo']['endCursor']
+
+        self.__graphql_complete_nested('project', nodes)
+        changed = [self.__cache_set('project', node['fullPath'], ProjectRecord.decode(node)) for node in nodes]
 
-        ret = []
-        for k in self.__cache:
-            if k.startswith(f"project:{full_path}"):
-                ret.append(self.__cache[k])
-        return ret
+        if self.__store is not None:
+            paths = [] if since is None else (self.__store.get('group_projects', full_path) or [])
+            self.__cache_set_listing('group_projects', full_path, list(dict.fromkeys(paths + [node['fullPath'] for node in changed])))
+            latest = max([node.get('lastActivityAt') or '' for node in changed] + [since or ''])
+            if latest:
+                self.__store.set('watermark', full_path, {'projects': latest})
+        self.__logger.debug(f"🔎  {len(changed)} projects of {full_path} changed since {since}")
+        return changed
 
-    def graphql_get_project(self, full_path: str) -> dict:
+    def __changed(self, entity: str, full_path: str, value: dict) -> bool:
+        """
+        Sprawdza, czy obiekt różni się od wpisu w trwałym cache (brak wpisu lub opcja --refresh oznacza zmianę).
+        """
+        if self.__store is None or self.__refresh:
+            return True
+        stored = self.__store.get(entity, full_path)
+        if stored is None:
+            return True
+        stored.pop('projection', None)
+        return stored != self.__redact(value.to_dict())
+
+    def graphql_get_project(self, full_path: str, fields: tuple = None) -> dict:
         """
         Wykonuje zapytanie GraphQL, aby pobrać informacje o projekcie
 
         :param full_path: Nazwa (fullPath) projektu w Gitlab
+        :params fields: Potrzebne pola projektu (None - wszystkie pola), id i fullPath pobierane są zawsze
         :return: Słownik zawierający wyniki zapytań GraphQL
         """
-        cache_id = f"project:{full_path}"
-        if not cache_id in self.__cache:
-            variables = {
-                'fullPath': full_path
-            }
-            if not cache_id in self.__cache:
-                self.__cache[cache_id] = self.__graphql.execute(query_get_project(), variables)['project']
-                self.__cache[cache_id]['branchRules'] = self.__cache[cache_id]["branchRules"]['nodes']
-                for i in self.__cache[cache_id]['branchRules']:
-                    i['id'] = i['id'].replace("gid://gitlab/Projects::AllBranchesRule/","")
-                    i['id'] = i['id'].replace("gid://gitlab/Projects::BranchRule/","")
-                    if i.get('branchProtection') is not None:
-                        i['branchProtection']['pushAccessLevels'] = i['branchProtection']['pushAccessLevels']['nodes']
-                        i['branchProtection']['mergeAccessLevels'] = i['branchProtection']['mergeAccessLevels']['nodes']
-                
-                self.__cache[cache_id]['ciVariables'] = self.__cache[cache_id]["ciVariables"]['nodes']
-                for i in self.__cache[cache_id]['ciVariables']:
-                    i['id'] = i['id'].replace("gid://gitlab/Ci::Variable/","")
-                
-                self.__cache[cache_id]['labels'] = self.__cache[cache_id]["labels"]['nodes']
-                for i in self.__cache[cache_id]['labels']:
-                    i['id'] = i['id'].replace("gid://gitlab/GroupLabel/","")
-
-                self.__cache[cache_id]['id'] = self.__cache[cache_id]['id'].replace("gid://gitlab/Project/","")
-        return self.__cache[cache_id]
+        fields = None if fields is None else projection('project', fields)
+        project = self.__cache_get('project', full_path, fields)
+        if project is None:
+            def fetch():
+                project = self.__held('project', full_path, fields)
+                if project is not None:
+                    return project
+                variables = {
+                    'fullPath': full_path
+                }
+                project = self.__graphql_execute(query_get_project(fields), variables, RequestScheduler.PRIORITY_PROJECT)['project']
+                if project is None:
+                    return None
+                self.__graphql_complete_nested('project', [project])
+                return self.__cache_set('project', full_path, ProjectRecord.decode(project), fields)
+            project = self.__flights.do(('project', full_path, fields), fetch)
+        return project
+
+    async def async_graphql_get_project(self, full_path: str, fields: tuple = None) -> dict:
+        """
+        Asynchroniczny odpowiednik graphql_get_project.
+
+        :param full_path: Nazwa (fullPath) projektu w Gitlab
+        :params fields: Potrzebne pola projektu (None - wszystkie pola)
+        :return: Słownik zawierający wyniki zapytań GraphQL
+        """
+        fields = None if fields is None else projection('project', fields)
+        project = self.__cache_get('project', full_path, fields)
+        if project is None:
+            async def fetch():
+                project = self.__held('project', full_path, fields)
+                if project is not None:
+                    return project
+                variables = {
+                    'fullPath': full_path
+                }
+                project = (await self.__graphql_execute_async(query_get_project(fields), variables, RequestScheduler.PRIORITY_PROJECT))['project']
+                if project is None:
+                    return None
+                await self.__graphql_complete_nested_async('project', [project])
+                return self.__cache_set('project', full_path, ProjectRecord.decode(project), fields)
+            project = await self.__flights.do_async(('project', full_path, fields), fetch)
+        return project
 
 
+    def __graphql_prefetch_ancestors(self, full_path: str) -> set:
+        """
+        Pobiera jednym zapytaniem GraphQL (aliasy group0..groupN) wszystkie niezapisane w cache
+        grupy nadrzędne projektu oraz sam projekt.
+
+        :params full_path: Nazwa (fullPath) projektu w Gitlab
+        :return: Zbiór ścieżek, które nie istnieją w Gitlab (np. przestrzeń nazw użytkownika)
+        """
+        groups = [path for path in self.__tree.ancestors(full_path) if self.__cache_get('group', path) is None]
+        include_project = self.__cache_get('project', full_path) is None
+        if not groups and not include_project:
+            return set()
+
+        variables = {f"group{i}": path for i, path in enumerate(groups)}
+        if include_project:
+            variables['project'] = full_path
+        self.__logger.trace(f"  Fetch {len(variables)} namespaces of {full_path} in one request")
+
+        missing = set()
+        result = self.__graphql_execute(query_get_ancestors(len(groups), include_project), variables)
+        self.__graphql_complete_nested('group', [result[f"group{i}"] for i in range(len(groups)) if result[f"group{i}"] is not None])
+        if include_project and result['project'] is not None:
+            self.__graphql_complete_nested('project', [result['project']])
+        for i, path in enumerate(groups):
+            if result[f"group{i}"] is None:
+                missing.add(path)
+            else:
+                self.__cache_set('group', path, GroupRecord.decode(result[f"group{i}"]))
+        if include_project:
+            if result['project'] is None:
+                missing.add(full_path)
+            else:
+                self.__cache_set('project', full_path, ProjectRecord.decode(result['project']))
+        return missing
+
     def get_project_inherited_variables(self,full_path: str):
-        path = ""
+        """
+        Zwraca zmienne CI/CD projektu wraz ze zmiennymi dziedziczonymi z grup nadrzędnych.
+        Brakujące w cache grupy i projekt są pobierane jednym zapytaniem GraphQL.
+
+        :params full_path: Nazwa (fullPath) projektu w Gitlab
+        :return: Słownik zmiennych (klucz: key:environmentScope:protected)
+        """
         variables_by_key = {}
 
-        for child_path in full_path.split('/'):
-            path = child_path if path == "" else f"{path}/{child_path}"
+        missing = self.__graphql_prefetch_ancestors(full_path)
+        for path in self.__tree.ancestors(full_path) + [full_path]:
+            if path in missing:
+                continue
             if full_path == path:
                 variables = self.graphql_get_project(path)['ciVariables']
             else:
                 variables = self.graphql_get_group(path)['ciVariables']
             for var in variables:
-                key = var["key"] + ":" + var["environmentScope"] + ":" + str(var["protected"])
+                key = self.__variable_key(var)
                 var["path"] = path
                 if (key in variables_by_key and
                     var["environmentScope"] == variables_by_key[key]["environmentScope"] and
@@ -295,4 +1295,70 @@ class GitlabConnector:
                 else:
                     variables_by_key[key] = var
             
-        return variables_by_key
\ No newline at end of file
+        return variables_by_key
+
+    def get_group_effective_variables(self, full_path: str) -> dict:
+        """
+        Zwraca zmienne CI/CD wszystkich projektów grupy i jej podgrup wraz ze zmiennymi dziedziczonymi
+        z grup nadrzędnych. Zmienne wyliczane są jednym przejściem drzewa grup od góry: grupa lub projekt
+        bez własnych zmiennych współdzieli słownik grupy nadrzędnej, a kopia tworzona jest dopiero przy
+        nadpisaniu zmiennej (copy-on-write). Koszt to O(grupy + projekty + zmienne) zamiast
+        O(projekty × głębokość) dla get_project_inherited_variables wywoływanego dla każdego projektu.
+
+        :params full_path: Nazwa (fullPath) grupy w Gitlab
+        :return: Słownik fullPath projektu → słownik zmiennych (klucz: key:environmentScope:protected,
+                 zmienna z dodanym polem path - grupą lub projektem, w którym jest zdefiniowana)
+        """
+        fields = ('ciVariables',)
+        group = self.graphql_get_group(full_path, fields)
+        if group is None:
+            return {}
+
+        inherited = {}
+        for path in self.__tree.ancestors(full_path):
+            ancestor = self.graphql_get_group(path, fields)
+            if ancestor is not None:
+                inherited = self.__merge_variables(inherited, path, ancestor['ciVariables'])
+        effective = {full_path: self.__merge_variables(inherited, full_path, group['ciVariables'])}
+
+        def namespace(path: str) -> dict:
+            # najbliższa grupa nadrzędna o wyliczonych zmiennych (grupa full_path jest wyliczona zawsze)
+            path = path.rsplit('/', 1)[0]
+            while path not in effective:
+                path = path.rsplit('/', 1)[0]
+            return effective[path]
+
+        self.__logger.debug(f"🔎  Compute effective variables of projects in {full_path}")
+        groups = self.graphql_get_descendantGroups(full_path, fields)
+        for subgroup in sorted(groups, key=lambda group: group['fullPath'].count('/')):
+            effective[subgroup['fullPath']] = self.__merge_variables(namespace(subgroup['fullPath']), subgroup['fullPath'], subgroup['ciVariables'])
+
+        return {
+            project['fullPath']: self.__merge_variables(namespace(project['fullPath']), project['fullPath'], project['ciVariables'])
+            for project in sorted(self.graphql_get_group_projects(full_path, fields), key=lambda project: project['fullPath'])
+        }
+
+    @staticmethod
+    def __variable_key(variable) -> str:
+        """
+        Zwraca klucz zmiennej CI/CD, pod którym zmienna grupy podrzędnej lub projektu nadpisuje zmienną dziedziczoną.
+        """
+        return variable["key"] + ":" + variable["environmentScope"] + ":" + str(variable["protected"])
+
+    @staticmethod
+    def __merge_variables(inherited: dict, path: str, variables: list) -> dict:
+        """
+        Nakłada zmienne grupy lub projektu na zmienne dziedziczone. Bez własnych zmiennych zwracany jest
+        ten sam (współdzielony) słownik zmiennych dziedziczonych, dlatego wyniku nie wolno modyfikować.
+
+        :params inherited: Zmienne dziedziczone z grupy nadrzędnej
+        :params path: Nazwa (fullPath) grupy lub projektu
+        :params variables: Zmienne grupy lub projektu
+        :return: Słownik zmiennych (klucz: key:environmentScope:protected)
+        """
+        if not variables:
+            return inherited
+        merged = dict(inherited)
+        for variable in variables:
+            merged[GitlabConnector.__variable_key(variable)] = dict(variable, path=path)
+        return merged
@@ -1,12 +1,20 @@
 from .query_get_group import query_get_group
 from .query_get_descendantGroups import query_get_descendantGroups
 from .query_group_projects import query_group_projects
+from .query_changed_projects import query_changed_projects
 from .query_get_project import query_get_project
+from .query_get_ancestors import query_get_ancestors
+from .query_get_nested_pages import query_get_nested_pages
+from .fragments import projection
 
 
 __all__ = [
     'query_get_group',
     'query_group_projects',
+    'query_changed_projects',
     'query_get_project',
     'query_get_descendantGroups',
+    'query_get_ancestors',
+    'query_get_nested_pages',
+    'projection',
 ]
\ No newline at end of file
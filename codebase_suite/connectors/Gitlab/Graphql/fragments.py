@@ -0,0 +1,136 @@
+import textwrap
+
+import urllib3
+
+urllib3.disable_warnings()
+
+PAGE_INFO = '''\
+pageInfo {
+    endCursor
+    hasNextPage
+}
+'''
+
+LABEL_FIELDS = '''\
+id
+color
+description
+title
+'''
+
+CI_VARIABLE_FIELDS = '''\
+id
+key
+description
+value
+protected
+masked
+environmentScope
+'''
+
+BRANCH_RULE_FIELDS = '''\
+id
+name
+isDefault
+branchProtection {
+    allowForcePush
+    pushAccessLevels {
+        nodes {
+            accessLevel
+            accessLevelDescription
+        }
+    }
+    mergeAccessLevels {
+        nodes {
+            accessLevel
+            accessLevelDescription
+        }
+    }
+}
+'''
+
+NESTED_NODES = {
+    'labels': LABEL_FIELDS,
+    'ciVariables': CI_VARIABLE_FIELDS,
+    'branchRules': BRANCH_RULE_FIELDS,
+}
+
+
+def connection(name: str, arguments: str = "") -> str:
+    """
+    Zwraca selekcję zagnieżdżonego połączenia GraphQL (nodes + pageInfo).
+
+    :params name: Nazwa połączenia (labels, ciVariables, branchRules)
+    :params arguments: Argumenty połączenia (np. first: 100, after: $after0)
+    """
+    arguments = f"({arguments})" if arguments else ""
+    return (
+        f"{name}{arguments} {{\n"
+        + "    nodes {\n"
+        + textwrap.indent(NESTED_NODES[name], ' ' * 8)
+        + "    }\n"
+        + textwrap.indent(PAGE_INFO, ' ' * 4)
+        + "}\n"
+    )
+
+
+FIELDS = {
+    'group': ('id', 'name', 'fullPath', 'description', 'visibility', 'avatarUrl', 'labels', 'ciVariables'),
+    'project': (
+        'id', 'name', 'archived', 'ciConfigPathOrDefault', 'description', 'fullPath', 'visibility', 'avatarUrl',
+        'topics', 'branchRules', 'ciVariables', 'labels'
+    ),
+}
+
+REQUIRED_FIELDS = ('id', 'fullPath')
+
+
+def projection(entity: str, fields = None) -> tuple:
+    """
+    Zwraca projekcję pól grupy lub projektu w stałej kolejności (zawsze z id i fullPath).
+
+    :params entity: Typ obiektu (group lub project)
+    :params fields: Potrzebne pola (None - wszystkie pola)
+    :return: Krotka nazw pól
+    """
+    if fields is None:
+        return FIELDS[entity]
+    unknown = set(fields) - set(FIELDS[entity])
+    if unknown:
+        raise ValueError(f"Unknown {entity} fields: {', '.join(sorted(unknown))}")
+    return tuple(field for field in FIELDS[entity] if field in fields or field in REQUIRED_FIELDS)
+
+
+def selection(entity: str, fields = None) -> str:
+    """
+    Zwraca selekcję pól GraphQL dla projekcji grupy lub projektu.
+
+    :params entity: Typ obiektu (group lub project)
+    :params fields: Potrzebne pola (None - wszystkie pola)
+    """
+    return ''.join(connection(field) if field in NESTED_NODES else f"{field}\n" for field in projection(entity, fields))
+
+
+GROUP_FIELDS = selection('group')
+
+PROJECT_FIELDS = selection('project')
+
+FRAGMENTS = {
+    'GroupFields': ('Group', 'group'),
+    'ProjectFields': ('Project', 'project'),
+}
+
+
+def fragments(*names: str, fields = None) -> str:
+    """
+    Zwraca definicje wskazanych fragmentów GraphQL (GroupFields, ProjectFields).
+    Należy podawać tylko fragmenty użyte w zapytaniu - Gitlab odrzuca zapytania z nieużywanymi fragmentami.
+
+    :params names: Nazwy fragmentów
+    :params fields: Projekcja pól fragmentów (None - wszystkie pola)
+    """
+    ret = ""
+    for name in names:
+        on, entity = FRAGMENTS[name]
+        ret += f"fragment {name} on {on} {{\n" + textwrap.indent(selection(entity, fields), ' ' * 4) + "}\n"
+    return ret
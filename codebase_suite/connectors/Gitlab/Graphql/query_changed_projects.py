@@ -0,0 +1,33 @@
+import functools
+import textwrap
+
+import urllib3
+
+from .fragments import fragments
+
+urllib3.disable_warnings()
+
+@functools.lru_cache
+def query_changed_projects(fields: tuple = None):
+    """
+    Zwraca zapytanie GraphQL pobierające projekty grupy i jej podgrup od ostatnio aktywnych (lastActivityAt),
+    dzięki czemu synchronizacja przyrostowa może zakończyć stronicowanie na znaczniku poprzedniej synchronizacji.
+
+    :params fields: Projekcja pól (wynik fragments.projection, None - wszystkie pola)
+    """
+    return textwrap.dedent('''\
+        query($after: String, $fullPath: ID!){
+            group(fullPath: $fullPath) {
+                projects(first: 100, includeSubgroups: true, after: $after, sort: ACTIVITY_DESC) {
+                    nodes {
+                        lastActivityAt
+                        ...ProjectFields
+                    }
+                    pageInfo {
+                        endCursor
+                        hasNextPage
+                    }
+                }
+            }
+        }
+    ''') + fragments('ProjectFields', fields=fields)
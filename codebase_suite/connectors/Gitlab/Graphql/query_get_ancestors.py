@@ -0,0 +1,29 @@
+import urllib3
+
+from .fragments import fragments
+
+urllib3.disable_warnings()
+
+def query_get_ancestors(groups_count: int, include_project: bool = True):
+    """
+    Buduje jedno zapytanie GraphQL z aliasami group0..groupN (oraz project)
+    pobierające wiele grup i projekt w jednym żądaniu.
+
+    :params groups_count: Liczba grup do pobrania (zmienne $group0..$groupN)
+    :params include_project: Czy pobrać również projekt (zmienna $project)
+    """
+    variables = [f"$group{i}: ID!" for i in range(groups_count)]
+    fields = [f"group{i}: group(fullPath: $group{i}) {{ ...GroupFields }}" for i in range(groups_count)]
+    if include_project:
+        variables.append("$project: ID!")
+        fields.append("project: project(fullPath: $project) { ...ProjectFields }")
+
+    query = f"query({', '.join(variables)}){{\n"
+    for field in fields:
+        query += f"    {field}\n"
+    query += "}\n"
+
+    used = ['GroupFields'] if groups_count else []
+    if include_project:
+        used.append('ProjectFields')
+    return query + fragments(*used)
@@ -1,41 +1,25 @@
+import functools
 import textwrap
 
 import urllib3
 
+from .fragments import fragments
+
 urllib3.disable_warnings()
 
-def query_get_descendantGroups():
+@functools.lru_cache
+def query_get_descendantGroups(fields: tuple = None):
+    """
+    Zwraca zapytanie GraphQL pobierające grupy potomne. Tekst zapytania budowany jest raz dla każdej projekcji.
 
+    :params fields: Projekcja pól (wynik fragments.projection, None - wszystkie pola)
+    """
     return textwrap.dedent('''\
         query($after: String, $fullPath: ID!){
-            group(fullPath: $fullPath) {                        
+            group(fullPath: $fullPath) {
                 descendantGroups(first: 100, includeParentDescendants: true, after: $after, sort: PATH_DESC) {
                     nodes {
-                        id
-                        name
-                        fullPath
-                        description
-                        visibility
-                        avatarUrl
-                        labels {
-                            nodes {
-                                id
-                                color
-                                description
-                                title 
-                            }
-                        }
-                        ciVariables{
-                            nodes {
-                                id
-                                key
-                                description
-                                value
-                                protected
-                                masked
-                                environmentScope
-                            }            
-                        }
+                        ...GroupFields
                     }
                     pageInfo {
                         endCursor
@@ -44,4 +28,4 @@ def query_get_descendantGroups():
                 }
             }
         }
-    ''')
\ No newline at end of file
+    ''') + fragments('GroupFields', fields=fields)
@@ -1,38 +1,23 @@
+import functools
 import textwrap
 
 import urllib3
 
+from .fragments import fragments
+
 urllib3.disable_warnings()
 
-def query_get_group():
+@functools.lru_cache
+def query_get_group(fields: tuple = None):
+    """
+    Zwraca zapytanie GraphQL pobierające grupę. Tekst zapytania budowany jest raz dla każdej projekcji.
+
+    :params fields: Projekcja pól (wynik fragments.projection, None - wszystkie pola)
+    """
     return textwrap.dedent('''\
         query($fullPath: ID!){
             group(fullPath: $fullPath) {
-                id
-                name
-                fullPath
-                description
-                visibility
-                avatarUrl
-                labels {
-                    nodes {
-                        id
-                        color
-                        description
-                        title 
-                    }
-                }
-                ciVariables{
-                    nodes {
-                        id
-                        key
-                        description
-                        value
-                        protected
-                        masked
-                        environmentScope
-                    }            
-                }
+                ...GroupFields
             }
         }
-    ''')
+    ''') + fragments('GroupFields', fields=fields)
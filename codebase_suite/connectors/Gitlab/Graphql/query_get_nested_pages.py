@@ -0,0 +1,25 @@
+import textwrap
+
+import urllib3
+
+from .fragments import connection
+
+urllib3.disable_warnings()
+
+def query_get_nested_pages(entity: str, connections: list):
+    """
+    Buduje jedno zapytanie GraphQL z aliasami page0..pageN pobierające kolejne strony
+    zagnieżdżonych połączeń (labels, ciVariables, branchRules) wielu grup lub projektów.
+
+    :params entity: Typ obiektu (group lub project)
+    :params connections: Nazwy połączeń - dla elementu i zmienne $path{i} oraz $after{i}
+    """
+    variables = []
+    query = ""
+    for i, name in enumerate(connections):
+        variables += [f"$path{i}: ID!", f"$after{i}: String"]
+        query += f"    page{i}: {entity}(fullPath: $path{i}) {{\n"
+        query += textwrap.indent(connection(name, f"first: 100, after: $after{i}"), ' ' * 8)
+        query += "    }\n"
+
+    return f"query({', '.join(variables)}){{\n{query}}}\n"
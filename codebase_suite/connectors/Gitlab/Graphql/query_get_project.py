@@ -1,64 +1,23 @@
+import functools
 import textwrap
 
 import urllib3
 
+from .fragments import fragments
+
 urllib3.disable_warnings()
 
-def query_get_project():
+@functools.lru_cache
+def query_get_project(fields: tuple = None):
+    """
+    Zwraca zapytanie GraphQL pobierające projekt. Tekst zapytania budowany jest raz dla każdej projekcji.
+
+    :params fields: Projekcja pól (wynik fragments.projection, None - wszystkie pola)
+    """
     return textwrap.dedent('''\
         query($fullPath: ID!){
             project(fullPath: $fullPath) {
-                id
-                name
-                archived
-                ciConfigPathOrDefault
-                description
-                fullPath
-                visibility
-                avatarUrl
-                topics
-                branchRules {
-                    nodes {
-                        id
-                        name
-                        isDefault
-                        branchProtection {
-                            allowForcePush
-                            pushAccessLevels {
-                                nodes {
-                                    accessLevel
-                                    accessLevelDescription
-                                }
-                            }
-                            mergeAccessLevels {
-                                nodes {
-                                    accessLevel
-                                    accessLevelDescription
-                                }
-                            }
-                        }
-                    }
-                }
-                ciVariables{
-                    nodes {
-                        id
-                        key
-                        description
-                        value
-                        protected
-                        masked
-                        environmentScope
-                    }            
-                }
-                labels {
-                    nodes {
-                        id
-                        color
-                        description
-                        title 
-                    }
-                }
+                ...ProjectFields
             }
         }
-    ''')
-   
+    ''') + fragments('ProjectFields', fields=fields)
@@ -1,65 +1,25 @@
+import functools
 import textwrap
 
 import urllib3
 
+from .fragments import fragments
+
 urllib3.disable_warnings()
 
-def query_group_projects():
+@functools.lru_cache
+def query_group_projects(fields: tuple = None):
+    """
+    Zwraca zapytanie GraphQL pobierające projekty grupy. Tekst zapytania budowany jest raz dla każdej projekcji.
+
+    :params fields: Projekcja pól (wynik fragments.projection, None - wszystkie pola)
+    """
     return textwrap.dedent('''\
-        query($after: String, $fullPath: ID!){
+        query($after: String, $fullPath: ID!, $includeSubgroups: Boolean = true){
             group(fullPath: $fullPath) {
-                projects(first: 100, includeSubgroups: true, after: $after, sort: PATH_DESC) {
+                projects(first: 100, includeSubgroups: $includeSubgroups, after: $after, sort: PATH_DESC) {
                     nodes {
-                        id
-                        name
-                        archived
-                        ciConfigPathOrDefault
-                        description
-                        fullPath
-                        visibility
-                        avatarUrl
-                        topics
-                        branchRules {
-                            nodes {
-                                id
-                                name
-                                isDefault
-                                branchProtection {
-                                    allowForcePush
-                                    pushAccessLevels {
-                                        nodes {
-                                            accessLevel
-                                            accessLevelDescription
-                                        }
-                                    }
-                                    mergeAccessLevels {
-                                        nodes {
-                                            accessLevel
-                                            accessLevelDescription
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                        ciVariables{
-                            nodes {
-                                id
-                                key
-                                description
-                                value
-                                protected
-                                masked
-                                environmentScope
-                            }            
-                        }
-                        labels {
-                            nodes {
-                                id
-                                color
-                                description
-                                title 
-                            }
-                        }
+                        ...ProjectFields
                     }
                     pageInfo {
                         endCursor
@@ -68,4 +28,4 @@ def query_group_projects():
                 }
             }
         }
-    ''')
\ No newline at end of file
+    ''') + fragments('ProjectFields', fields=fields)
@@ -0,0 +1,131 @@
+import importlib.util
+
+import gitlab.const
+import httpx
+import requests
+
+from requests.adapters import HTTPAdapter
+from singleton_decorator import singleton
+
+from .Scheduler import RequestScheduler
+from ...config import Config
+from ...core import Logger, Metrics, Profiler
+
+
+@singleton
+class HttpPool:
+    """
+    Współdzielona w całym procesie pula połączeń HTTP dla klientów Gitlab REST (requests)
+    oraz GraphQL (httpx). Wszystkie instancje GitlabConnector korzystają z tych samych połączeń,
+    dzięki czemu handshake TCP+TLS wykonywany jest tylko raz dla każdego połączenia w puli.
+    Nagłówki RateLimit-* każdej odpowiedzi przekazywane są do wspólnego planisty zapytań,
+    a rozmiar odpowiedzi doliczany jest do bieżącego pomiaru (opcja --profile) i metryk (opcja --metrics).
+    """
+
+    __logger: Logger
+    __session: requests.Session
+    __client: httpx.Client
+    __scheduler: RequestScheduler
+
+    def __init__(self, config: Config, logger: Logger = None) -> None:
+        """
+        Tworzy sesję requests oraz klienta httpx o wspólnych ustawieniach puli.
+
+        :params config: Konfiguracja aplikacji
+        :params logger: Logger aplikacji
+        """
+        if logger == None:
+            self.__logger = Logger()
+        else:
+            self.__logger = logger
+
+        pool_size = max(1, int(config.http_pool_size))
+        keepalive = max(0.0, float(config.http_keepalive))
+        timeout = None if config.http_timeout is None else float(config.http_timeout)
+        http2 = config.http2
+        if http2 and importlib.util.find_spec('h2') is None:
+            self.__logger.warning("⛔  HTTP/2 requires the 'h2' package (pip install httpx[http2]), falling back to HTTP/1.1.")
+            http2 = False
+
+        self.__scheduler = RequestScheduler(self.__logger)
+
+        self.__session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.__session.mount('https://', adapter)
+        self.__session.mount('http://', adapter)
+        self.__session.headers.update({
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+        })
+        self.__session.hooks['response'].append(
+            lambda response, *args, **kwargs: self.__scheduler.observe(response.status_code, response.headers)
+        )
+        self.__session.hooks['response'].append(
+            lambda response, *args, **kwargs: Profiler.add_bytes(lambda: len(response.content))
+        )
+        self.__session.hooks['response'].append(
+            lambda response, *args, **kwargs: self.__count('rest', response)
+        )
+
+        self.__client = httpx.Client(
+            headers = {
+                'User-Agent': gitlab.const.USER_AGENT,
+                'Authorization': f"Bearer {config.gitlab_token.get_secret_value()}",
+                'Accept-Encoding': 'gzip, deflate',
+            },
+            verify = False,
+            http2 = http2,
+            timeout = timeout,
+            event_hooks = {
+                'response': [
+                    lambda response: self.__scheduler.observe(response.status_code, response.headers),
+                    lambda response: Profiler.add_bytes(lambda: response.num_bytes_downloaded),
+                    lambda response: self.__count('graphql', response)
+                ]
+            },
+            limits = httpx.Limits(
+                max_connections = pool_size,
+                max_keepalive_connections = pool_size,
+                keepalive_expiry = keepalive
+            )
+        )
+
+        self.__logger.trace(f"  Set http pool size: {pool_size}")
+        self.__logger.trace(f"  Set http keep-alive: {keepalive}s")
+        self.__logger.trace(f"  Set http2: {http2}")
+        self.__logger.trace(f"  Set http timeout: {timeout}")
+
+    def __count(self, api: str, response) -> None:
+        """
+        Zlicza odpowiedź Gitlab w metrykach (endpoint bez identyfikatorów i parametrów).
+
+        :params api: Rodzaj API (rest, graphql)
+        :params response: Odpowiedź requests lub httpx
+        """
+        if Metrics.enabled():
+            Metrics.inc('codebase_gitlab_requests_total', api=api, endpoint=Metrics.endpoint(str(response.request.url)), status=response.status_code)
+
+    def session(self) -> requests.Session:
+        """
+        Zwraca współdzieloną sesję requests (klient Gitlab REST).
+        """
+        return self.__session
+
+    def client(self) -> httpx.Client:
+        """
+        Zwraca współdzielonego klienta httpx (klient Gitlab GraphQL).
+        """
+        return self.__client
+
+    def scheduler(self) -> RequestScheduler:
+        """
+        Zwraca współdzielonego planistę zapytań (limit zapytań instancji Gitlab).
+        """
+        return self.__scheduler
+
+    def close(self) -> None:
+        """
+        Zamyka wszystkie połączenia w puli.
+        """
+        self.__session.close()
+        self.__client.close()
@@ -0,0 +1,170 @@
+from collections.abc import MutableMapping
+
+from .Graphql.fragments import FIELDS
+
+
+def parse_gid(value):
+    """
+    Zwraca identyfikator z globalnego id Gitlab (gid://gitlab/<Typ>/<id>), np. gid://gitlab/Group/1 → 1.
+    Wartości bez prefiksu gid zwracane są bez zmian.
+
+    :params value: Globalne id Gitlab
+    :return: Identyfikator obiektu
+    """
+    if isinstance(value, str) and value.startswith('gid://'):
+        return value[value.rindex('/') + 1:]
+    return value
+
+
+class Record(MutableMapping):
+    """
+    Rekord obiektu Gitlab przechowujący pola w slotach. Udostępnia interfejs słownika (record['fullPath'],
+    get, items, porównanie ze słownikiem), dzięki czemu może być używany w szablonach Jinja i poleceniach
+    tak jak odpowiedź GraphQL. Pola spoza FIELDS (np. badges) przechowywane są w osobnym słowniku.
+    """
+
+    __slots__ = ('__extra',)
+
+    FIELDS: tuple = ()
+    NESTED: dict = {}
+
+    def __init__(self, **values) -> None:
+        """
+        :params values: Wartości pól rekordu
+        """
+        self.__extra = None
+        for key, value in values.items():
+            self[key] = value
+
+    @classmethod
+    def decode(cls, node: dict) -> "Record":
+        """
+        Tworzy rekord z węzła odpowiedzi GraphQL (połączenia nodes są spłaszczane, a globalne id zamieniane
+        na identyfikatory) lub z zapisanego wcześniej słownika rekordu. Rekord tego typu zwracany jest bez zmian.
+
+        :params node: Węzeł GraphQL lub słownik rekordu
+        :return: Rekord
+        """
+        if isinstance(node, cls):
+            return node
+        record = cls()
+        for key, value in node.items():
+            if key == 'id':
+                value = parse_gid(value)
+            elif key in cls.NESTED and value is not None:
+                nodes = value['nodes'] if isinstance(value, dict) else value
+                value = [cls.NESTED[key].decode(item) for item in nodes]
+            record[key] = value
+        return record
+
+    def to_dict(self) -> dict:
+        """
+        Zwraca rekord jako słownik (np. do zapisu w trwałym cache).
+        """
+        ret = {}
+        for key, value in self.items():
+            if isinstance(value, list):
+                value = [item.to_dict() if isinstance(item, Record) else item for item in value]
+            ret[key] = value.to_dict() if isinstance(value, Record) else value
+        return ret
+
+    def __getitem__(self, key):
+        if key in self.FIELDS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self.__extra is None or key not in self.__extra:
+            raise KeyError(key)
+        return self.__extra[key]
+
+    def __setitem__(self, key, value) -> None:
+        if key in self.FIELDS:
+            setattr(self, key, value)
+            return
+        if self.__extra is None:
+            self.__extra = {}
+        self.__extra[key] = value
+
+    def __delitem__(self, key) -> None:
+        if key in self.FIELDS:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self.__extra is not None and key in self.__extra:
+            del self.__extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        for key in self.FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self.__extra is not None:
+            yield from self.__extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+class CiVariable(Record):
+    """
+    Zmienna CI/CD grupy lub projektu.
+    """
+
+    FIELDS = ('id', 'key', 'description', 'value', 'protected', 'masked', 'environmentScope')
+    __slots__ = FIELDS
+
+
+class Label(Record):
+    """
+    Etykieta grupy lub projektu.
+    """
+
+    FIELDS = ('id', 'color', 'description', 'title')
+    __slots__ = FIELDS
+
+
+class BranchRule(Record):
+    """
+    Reguła gałęzi projektu (poziomy dostępu branchProtection są spłaszczane do list).
+    """
+
+    FIELDS = ('id', 'name', 'isDefault', 'branchProtection')
+    __slots__ = FIELDS
+
+    @classmethod
+    def decode(cls, node: dict) -> "BranchRule":
+        record = super().decode(node)
+        protection = record.get('branchProtection')
+        if protection is not None:
+            protection = dict(protection)
+            for levels in ('pushAccessLevels', 'mergeAccessLevels'):
+                if isinstance(protection.get(levels), dict):
+                    protection[levels] = protection[levels]['nodes']
+            record['branchProtection'] = protection
+        return record
+
+
+class GroupRecord(Record):
+    """
+    Grupa Gitlab (pola zgodne z fragmentem GraphQL GroupFields).
+    """
+
+    FIELDS = FIELDS['group']
+    NESTED = {'labels': Label, 'ciVariables': CiVariable}
+    __slots__ = FIELDS
+
+
+class ProjectRecord(Record):
+    """
+    Projekt Gitlab (pola zgodne z fragmentem GraphQL ProjectFields).
+    """
+
+    FIELDS = FIELDS['project']
+    NESTED = {'branchRules': BranchRule, 'ciVariables': CiVariable, 'labels': Label}
+    __slots__ = FIELDS
@@ -0,0 +1,141 @@
+import collections
+import contextvars
+import random
+import threading
+import time
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import gitlab.exceptions
+import httpx
+import requests
+
+from .Exceptions import GitlabDeadlineExceededException
+from ...core import Logger, Profiler
+
+
+class RetryPolicy:
+    """
+    Polityka wykonywania odczytów z Gitlab: ponawianie przejściowych błędów (5xx, timeout, zerwane połączenie)
+    z wykładniczym opóźnieniem z losowym rozrzutem, limit czasu całego uruchomienia oraz opcjonalne
+    zapytania zapasowe (hedging) - zapytanie trwające dłużej niż 95. percentyl dotychczasowych
+    zapytań jest wysyłane drugi raz, a wynikiem jest pierwsza odpowiedź.
+    """
+
+    TRANSIENT_CODES = (500, 502, 503, 504)
+    HEDGE_MIN_SAMPLES = 20
+
+    __logger: Logger
+    __executor: ThreadPoolExecutor = None
+
+    def __init__(self, retries: int = 3, backoff: float = 0.5, deadline: float = None, hedge: bool = False,
+                 logger: Logger = None, clock = time.monotonic, sleep = time.sleep) -> None:
+        """
+        :params retries: Maksymalna liczba ponowień zapytania
+        :params backoff: Podstawa opóźnienia ponowienia w sekundach (opóźnienie to losowa wartość z 0..backoff*2^próba)
+        :params deadline: Limit czasu wszystkich zapytań w sekundach, liczony od utworzenia polityki (None - bez limitu)
+        :params hedge: Czy wysyłać zapytania zapasowe dla zapytań dłuższych niż p95
+        :params logger: Logger aplikacji
+        :params clock: Zegar monotoniczny (sekundy)
+        :params sleep: Funkcja oczekiwania (sekundy)
+        """
+        if logger == None:
+            self.__logger = Logger()
+        else:
+            self.__logger = logger
+        self.__retries = max(0, int(retries))
+        self.__backoff = max(0.0, float(backoff))
+        self.__clock = clock
+        self.__sleep = sleep
+        self.__deadline = None if deadline is None else clock() + float(deadline)
+        self.__hedge = hedge
+        self.__latencies = collections.deque(maxlen=200)
+        self.__lock = threading.Lock()
+
+    def call(self, call, *args):
+        """
+        Wykonuje idempotentny odczyt zgodnie z polityką.
+
+        :params call: Funkcja wykonująca zapytanie
+        :params args: Argumenty funkcji
+        :return: Wynik zapytania
+        """
+        attempt = 0
+        while True:
+            self.__check_deadline()
+            try:
+                return self.__hedged(call, *args) if self.__hedge else self.__timed(call, *args)
+            except Exception as e:
+                if not self.transient(e) or attempt >= self.__retries:
+                    raise
+                delay = random.uniform(0, self.__backoff * 2 ** attempt)
+                if self.__deadline is not None:
+                    delay = min(delay, max(0.0, self.__deadline - self.__clock()))
+                attempt += 1
+                Profiler.add_retry()
+                self.__logger.warning(f"⛔  Gitlab request failed ({e}), retry {attempt}/{self.__retries} in {delay:.1f}s")
+                self.__sleep(delay)
+
+    @classmethod
+    def transient(cls, error: Exception) -> bool:
+        """
+        Sprawdza, czy błąd jest przejściowy i zapytanie można ponowić.
+        """
+        if isinstance(error, gitlab.exceptions.GitlabError):
+            return error.response_code in cls.TRANSIENT_CODES
+        return isinstance(error, (httpx.TransportError, requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+    def p95(self):
+        """
+        Zwraca 95. percentyl czasu zapytań (None, jeżeli zebrano za mało pomiarów).
+        """
+        with self.__lock:
+            if len(self.__latencies) < self.HEDGE_MIN_SAMPLES:
+                return None
+            latencies = sorted(self.__latencies)
+        return latencies[int(len(latencies) * 0.95) - 1]
+
+    def __check_deadline(self) -> None:
+        """
+        Zgłasza GitlabDeadlineExceededException po przekroczeniu limitu czasu uruchomienia.
+        """
+        if self.__deadline is not None and self.__clock() >= self.__deadline:
+            self.__logger.error("❌  Gitlab requests deadline exceeded.")
+            raise GitlabDeadlineExceededException()
+
+    def __timed(self, call, *args):
+        """
+        Wykonuje zapytanie i zapamiętuje czas jego trwania.
+        """
+        start = self.__clock()
+        result = call(*args)
+        with self.__lock:
+            self.__latencies.append(self.__clock() - start)
+        return result
+
+    def __hedged(self, call, *args):
+        """
+        Wykonuje zapytanie, a jeżeli nie zakończy się w czasie p95, wysyła je ponownie i zwraca pierwszą odpowiedź.
+        """
+        threshold = self.p95()
+        if threshold is None:
+            return self.__timed(call, *args)
+
+        with self.__lock:
+            if RetryPolicy.__executor is None:
+                RetryPolicy.__executor = ThreadPoolExecutor(thread_name_prefix='gitlab-hedge')
+        pending = {self.__executor.submit(contextvars.copy_context().run, self.__timed, call, *args)}
+        done, pending = wait(pending, timeout=threshold)
+        if not done:
+            self.__logger.trace(f"  Hedge request slower than {threshold:.2f}s")
+            pending.add(self.__executor.submit(contextvars.copy_context().run, self.__timed, call, *args))
+
+        error = None
+        while True:
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+            if not pending:
+                raise error
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
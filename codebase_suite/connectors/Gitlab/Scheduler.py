@@ -0,0 +1,162 @@
+import heapq
+import itertools
+import threading
+import time
+
+from email.utils import parsedate_to_datetime
+
+from ...core import Logger
+
+
+class RequestScheduler:
+    """
+    Planista zapytań do instancji Gitlab. Kubełek tokenów zasilany jest nagłówkami RateLimit-*
+    oraz Retry-After odpowiedzi, a oczekujące zapytania obsługiwane są według priorytetu
+    (grupy przed projektami, projekty przed ustawieniami), dzięki czemu zapytania nie przekraczają
+    limitu instancji zamiast wysyłać serię zapytań i czekać na odblokowanie po 429 Too Many Requests.
+    """
+
+    PRIORITY_GROUP = 0
+    PRIORITY_PROJECT = 1
+    PRIORITY_SETTINGS = 2
+
+    __logger: Logger
+    __rate: float = None
+    __capacity: float = 1.0
+    __tokens: float = 1.0
+    __updated: float
+    __paused_until: float = 0.0
+
+    def __init__(self, logger: Logger = None, clock = time.monotonic) -> None:
+        """
+        Tworzy planistę bez limitu - limit ustalany jest na podstawie nagłówków RateLimit-Limit.
+
+        :params logger: Logger aplikacji
+        :params clock: Zegar monotoniczny (sekundy)
+        """
+        if logger == None:
+            self.__logger = Logger()
+        else:
+            self.__logger = logger
+        self.__clock = clock
+        self.__updated = clock()
+        self.__waiting = []
+        self.__counter = itertools.count()
+        self.__condition = threading.Condition()
+
+    def rate(self) -> float:
+        """
+        Zwraca bieżący limit zapytań na sekundę (None, jeżeli instancja nie zgłosiła limitu).
+        """
+        return self.__rate
+
+    def acquire(self, priority: int = PRIORITY_SETTINGS) -> None:
+        """
+        Czeka, aż zapytanie o podanym priorytecie może zostać wysłane, i pobiera token z kubełka.
+        Zapytania o niższej wartości priorytetu obsługiwane są jako pierwsze.
+
+        :params priority: Priorytet zapytania (PRIORITY_GROUP, PRIORITY_PROJECT lub PRIORITY_SETTINGS)
+        :return: None
+        """
+        with self.__condition:
+            entry = (priority, next(self.__counter))
+            heapq.heappush(self.__waiting, entry)
+            try:
+                while True:
+                    delay = None
+                    if self.__waiting[0] is entry:
+                        delay = self.__delay()
+                        if delay <= 0:
+                            break
+                    self.__condition.wait(delay)
+            except BaseException:
+                self.__waiting.remove(entry)
+                heapq.heapify(self.__waiting)
+                self.__condition.notify_all()
+                raise
+
+            heapq.heappop(self.__waiting)
+            if self.__rate is not None:
+                self.__tokens -= 1
+            self.__condition.notify_all()
+
+    def observe(self, status_code: int, headers) -> None:
+        """
+        Aktualizuje kubełek na podstawie nagłówków odpowiedzi Gitlab.
+
+        :params status_code: Kod odpowiedzi HTTP
+        :params headers: Nagłówki odpowiedzi (bez rozróżniania wielkości liter)
+        :return: None
+        """
+        limit = self.__number(headers.get('RateLimit-Limit'))
+        remaining = self.__number(headers.get('RateLimit-Remaining'))
+        reset = self.__number(headers.get('RateLimit-Reset'))
+
+        with self.__condition:
+            self.__refill()
+            if limit is not None and limit > 0:
+                rate = limit / 60
+                if rate != self.__rate:
+                    self.__logger.trace(f"  Set gitlab rate limit: {limit}/min")
+                    if self.__rate is None:
+                        self.__tokens = max(1.0, rate)
+                    self.__rate = rate
+                    self.__capacity = max(1.0, rate)
+            if remaining is not None and self.__rate is not None:
+                self.__tokens = min(self.__tokens, remaining)
+                if remaining <= 0 and reset is not None:
+                    self.__pause(reset - time.time())
+
+            if status_code == 429:
+                retry_after = self.__retry_after(headers.get('Retry-After'))
+                self.__logger.warning(f"⛔  Gitlab rate limit reached, pausing requests for {retry_after:.0f}s")
+                self.__pause(retry_after)
+            self.__condition.notify_all()
+
+    def __refill(self) -> None:
+        """
+        Dolicza tokeny przybyłe od ostatniej aktualizacji kubełka.
+        """
+        now = self.__clock()
+        if self.__rate is not None:
+            self.__tokens = min(self.__capacity, self.__tokens + (now - self.__updated) * self.__rate)
+        self.__updated = now
+
+    def __delay(self) -> float:
+        """
+        Zwraca czas (sekundy), po którym kolejne zapytanie może zostać wysłane.
+        """
+        self.__refill()
+        if self.__paused_until > self.__updated:
+            return self.__paused_until - self.__updated
+        if self.__rate is None or self.__tokens >= 1:
+            return 0
+        return (1 - self.__tokens) / self.__rate
+
+    def __pause(self, seconds: float) -> None:
+        """
+        Wstrzymuje wysyłanie zapytań na podany czas.
+        """
+        self.__paused_until = max(self.__paused_until, self.__clock() + max(0.0, seconds))
+
+    def __retry_after(self, value) -> float:
+        """
+        Zwraca czas oczekiwania z nagłówka Retry-After (sekundy lub data HTTP), domyślnie 1s.
+        """
+        seconds = self.__number(value)
+        if seconds is not None:
+            return seconds
+        try:
+            return parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return 1.0
+
+    @staticmethod
+    def __number(value):
+        """
+        Zamienia wartość nagłówka na liczbę (None dla braku lub niepoprawnej wartości).
+        """
+        try:
+            return None if value is None else float(value)
+        except ValueError:
+            return None
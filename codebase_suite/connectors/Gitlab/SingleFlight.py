@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import weakref
+
+
+class Flight:
+    """
+    Trwające wywołanie rejestru SingleFlight - wynik lub wyjątek, na który czekają pozostali wywołujący.
+    """
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Rejestr trwających zapytań (singleflight): równoczesne wywołania o tym samym kluczu (np. grupa
+    nadrzędna potrzebna wszystkim projektom) wykonują jedno zapytanie do Gitlab i otrzymują jego wynik
+    lub wyjątek. Wariant do_async działa w obrębie pętli zdarzeń asyncio (wspólne zadanie), a do
+    z wielu wątków (oczekiwanie na zdarzenie). Klucz usuwany jest z rejestru po zakończeniu wywołania,
+    dlatego kolejne wywołania powinny najpierw sprawdzić cache.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__flights = {}
+        self.__tasks = weakref.WeakKeyDictionary()
+
+    def do(self, key, call):
+        """
+        Wykonuje wywołanie lub, jeżeli wywołanie o tym samym kluczu trwa w innym wątku, czeka na jego wynik.
+
+        :params key: Klucz wywołania (np. typ obiektu, fullPath i projekcja pól)
+        :params call: Funkcja bez argumentów wykonująca zapytanie
+        :return: Wynik wywołania
+        """
+        with self.__lock:
+            flight = self.__flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.__flights[key] = Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = call()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self.__lock:
+                del self.__flights[key]
+            flight.done.set()
+        return flight.result
+
+    async def do_async(self, key, call):
+        """
+        Asynchroniczny odpowiednik do - równoczesne wywołania w tej samej pętli zdarzeń czekają na wspólne zadanie.
+        Anulowanie jednego z oczekujących nie przerywa zadania pozostałym.
+
+        :params key: Klucz wywołania
+        :params call: Funkcja bez argumentów zwracająca korutynę wykonującą zapytanie
+        :return: Wynik wywołania
+        """
+        loop = asyncio.get_running_loop()
+        with self.__lock:
+            tasks = self.__tasks.setdefault(loop, {})
+            task = tasks.get(key)
+            if task is None:
+                task = tasks[key] = loop.create_task(call())
+                task.add_done_callback(lambda task: self.__finished(tasks, key, task))
+        return await asyncio.shield(task)
+
+    def __finished(self, tasks: dict, key, task: asyncio.Task) -> None:
+        """
+        Usuwa zakończone zadanie z rejestru (wyjątek odczytywany jest, aby nie był zgłaszany jako nieobsłużony,
+        gdy wszyscy oczekujący zostali anulowani).
+        """
+        with self.__lock:
+            if tasks.get(key) is task:
+                del tasks[key]
+        if not task.cancelled():
+            task.exception()
+
+    def pending(self) -> int:
+        """
+        Zwraca liczbę trwających wywołań (wątki i zadania asyncio).
+        """
+        with self.__lock:
+            return len(self.__flights) + sum(len(tasks) for tasks in self.__tasks.values())
@@ -0,0 +1,134 @@
+import copy
+import gzip
+import json
+import os
+import threading
+import time
+
+from pathlib import Path
+
+from ...core import Logger
+
+
+class GitlabSnapshot:
+    """
+    Migawka drzewa grupy Gitlab (grupy, projekty, zmienne, etykiety, reguły gałęzi, badges, protected tags
+    i mirrory) zapisana w jednym pliku - JSON skompresowany gzip, dostępny tylko dla właściciela (0600).
+    Udostępnia ten sam interfejs co GitlabCache (get, set, invalidate, clear), dzięki czemu konektor
+    uruchomiony z opcją --snapshot obsługuje z niej wszystkie odczyty bez zapytań do Gitlab.
+    """
+
+    FORMAT_VERSION = 1
+
+    __logger: Logger
+    __entries: dict
+
+    def __init__(self, path: Path = None, logger: Logger = None) -> None:
+        """
+        Tworzy pustą migawkę lub wczytuje ją z pliku.
+
+        :params path: Plik migawki (None - pusta migawka)
+        :params logger: Logger aplikacji
+        """
+        if logger == None:
+            self.__logger = Logger()
+        else:
+            self.__logger = logger
+
+        self.__lock = threading.Lock()
+        self.__entries = {}
+        self.__root = None
+        if path is not None:
+            with gzip.open(path, 'rt', encoding='utf-8') as file:
+                document = json.load(file)
+            if document.get('version') != self.FORMAT_VERSION:
+                raise ValueError(f"Unsupported snapshot version: {document.get('version')}")
+            self.__entries = document['entries']
+            self.__root = document['root']
+            self.__logger.trace(f"  Set gitlab snapshot: {path} ({self.__root})")
+
+    def root(self) -> str:
+        """
+        Zwraca nazwę (fullPath) grupy, dla której wykonano migawkę.
+        """
+        return self.__root
+
+    def entries(self, entity: str) -> dict:
+        """
+        Zwraca wszystkie wpisy danego typu.
+
+        :params entity: Typ obiektu (np. group, project, group_badges)
+        :return: Słownik fullPath → wartość
+        """
+        return self.__entries.get(entity, {})
+
+    def get(self, entity: str, full_path: str):
+        """
+        Zwraca wpis z migawki.
+
+        :params entity: Typ obiektu (np. group, project)
+        :params full_path: Nazwa (fullPath) obiektu w Gitlab
+        :return: Kopia zapisanej wartości lub None
+        """
+        with self.__lock:
+            value = self.__entries.get(entity, {}).get(full_path)
+        return copy.deepcopy(value)
+
+    def set(self, entity: str, full_path: str, value) -> None:
+        """
+        Zapisuje wartość w migawce (w pamięci, do pliku zapisuje ją save).
+
+        :params entity: Typ obiektu (np. group, project)
+        :params full_path: Nazwa (fullPath) obiektu w Gitlab
+        :params value: Wartość (serializowalna do JSON)
+        """
+        with self.__lock:
+            self.__entries.setdefault(entity, {})[full_path] = value
+
+    def invalidate(self, prefix: str) -> int:
+        """
+        Usuwa z migawki wszystkie wpisy dla podanej ścieżki i obiektów pod nią.
+
+        :params prefix: Nazwa (fullPath) grupy lub projektu
+        :return: Liczba usuniętych wpisów
+        """
+        prefix = prefix.rstrip('/')
+        removed = 0
+        with self.__lock:
+            for entries in self.__entries.values():
+                for path in [path for path in entries if path == prefix or path.startswith(f"{prefix}/")]:
+                    del entries[path]
+                    removed += 1
+        return removed
+
+    def clear(self) -> int:
+        """
+        Usuwa wszystkie wpisy z migawki.
+
+        :return: Liczba usuniętych wpisów
+        """
+        with self.__lock:
+            removed = sum(len(entries) for entries in self.__entries.values())
+            self.__entries = {}
+        return removed
+
+    def save(self, path: Path, root: str) -> None:
+        """
+        Zapisuje migawkę do pliku.
+
+        :params path: Plik migawki
+        :params root: Nazwa (fullPath) grupy, dla której wykonano migawkę
+        """
+        self.__root = root
+        with self.__lock:
+            document = {
+                'version': self.FORMAT_VERSION,
+                'root': root,
+                'created_at': time.time(),
+                'entries': self.__entries,
+            }
+            descriptor = os.open(path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+            with os.fdopen(descriptor, 'wb') as raw, gzip.open(raw, 'wt', encoding='utf-8') as file:
+                json.dump(document, file, separators=(',', ':'))
+        os.chmod(path, 0o600)
+        self.__logger.trace(f"  Saved gitlab snapshot: {path}")
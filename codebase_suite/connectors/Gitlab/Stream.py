@@ -0,0 +1,118 @@
+import json
+import re
+
+
+_TOKEN = re.compile(r'\s*(?:("(?:[^"\\]|\\.)*")|([{}\[\]:,])|([^\s,:\[\]{}"]+))', re.DOTALL)
+_STRUCTURE = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]]|"', re.DOTALL)
+_ARRAY = object()
+
+
+class JsonStream:
+    """
+    Przyrostowy dekoder dokumentu JSON czytanego fragmentami (np. httpx Response.iter_text).
+    Elementy tablicy wskazanej ścieżką kluczy (np. data.group.projects.nodes) są dekodowane i zwracane
+    pojedynczo, gdy tylko zostaną w całości odczytane - w pamięci jest jednocześnie tylko jeden element.
+    Pozostała część dokumentu (np. pageInfo, errors) dostępna jest po odczytaniu strumienia
+    w document(), z pustą tablicą w miejscu zwróconych elementów.
+    """
+
+    def __init__(self, chunks, path: tuple) -> None:
+        """
+        :params chunks: Iterowalne fragmenty tekstu dokumentu JSON
+        :params path: Ścieżka kluczy do tablicy, której elementy mają być zwracane
+        """
+        self.__chunks = iter(chunks)
+        self.__path = tuple(path)
+        self.__document = None
+
+    def document(self) -> dict:
+        """
+        Zwraca dokument bez elementów zwróconej tablicy (dostępny po odczytaniu strumienia).
+        """
+        return self.__document
+
+    def __iter__(self):
+        buffer = ''
+        pos = 0
+        eof = False
+        skeleton = []
+        keys = []
+        expect_key = False
+        capture = False
+        start = None
+        scan = 0
+        depth = 0
+
+        while True:
+            if start is not None:
+                # wnętrze zwracanego elementu - szukamy jego końca, pomijając napisy
+                match = _STRUCTURE.search(buffer, scan)
+                if match is not None and match.group(0) != '"':
+                    token = match.group(0)
+                    scan = match.end()
+                    if token in '{[':
+                        depth += 1
+                    elif token in '}]':
+                        depth -= 1
+                        if depth == 0:
+                            yield json.loads(buffer[start:scan])
+                            pos = scan
+                            start = None
+                    continue
+                scan = len(buffer) if match is None else match.start()
+                if eof:
+                    raise ValueError("Unexpected end of JSON stream")
+            else:
+                match = _TOKEN.match(buffer, pos)
+                # token na końcu bufora może być ucięty (np. liczba) - czekamy na kolejny fragment
+                if match is not None and (eof or match.end() < len(buffer)):
+                    pos = match.end()
+                    string, punctuation, scalar = match.groups()
+                    if capture:
+                        if punctuation == ']':
+                            skeleton.append(']')
+                            capture = False
+                        elif punctuation in ('{', '['):
+                            start = match.start(2)
+                            scan = pos
+                            depth = 1
+                        elif punctuation is None:
+                            yield json.loads(string if string is not None else scalar)
+                        continue
+
+                    skeleton.append(match.group(0))
+                    if punctuation == '{':
+                        keys.append(None)
+                        expect_key = True
+                    elif punctuation == '[':
+                        if tuple(keys) == self.__path:
+                            capture = True
+                        else:
+                            keys.append(_ARRAY)
+                        expect_key = False
+                    elif punctuation in ('}', ']'):
+                        keys.pop()
+                        expect_key = False
+                    elif punctuation == ',':
+                        expect_key = bool(keys) and keys[-1] is not _ARRAY
+                    elif string is not None and expect_key:
+                        keys[-1] = json.loads(string)
+                        expect_key = False
+                    continue
+                if eof:
+                    if buffer[pos:].strip():
+                        raise ValueError("Unexpected end of JSON stream")
+                    break
+
+            chunk = next(self.__chunks, None)
+            if chunk is None:
+                eof = True
+                continue
+            base = pos if start is None else start
+            buffer = buffer[base:] + chunk
+            pos -= base
+            scan -= base
+            if start is not None:
+                start -= base
+
+        self.__document = json.loads(''.join(skeleton)) if skeleton else None
@@ -0,0 +1,173 @@
+class NamespaceNode:
+    """
+    Węzeł drzewa przestrzeni nazw Gitlab - grupa wraz z podgrupami i projektami.
+    """
+
+    __slots__ = ('full_path', 'parent', 'children', 'group', 'projects', 'complete')
+
+    def __init__(self, full_path: str, parent: "NamespaceNode" = None) -> None:
+        """
+        :params full_path: Nazwa (fullPath) grupy w Gitlab
+        :params parent: Węzeł grupy nadrzędnej (None dla przestrzeni nazw najwyższego poziomu)
+        """
+        self.full_path = full_path
+        self.parent = parent
+        self.children = {}
+        self.group = None
+        self.projects = {}
+        self.complete = False
+
+
+class NamespaceTree:
+    """
+    Drzewo przestrzeni nazw Gitlab (wskaźniki na rodzica, listy podgrup oraz projekty każdej grupy)
+    przechowujące pobrane grupy i projekty. Odczyt obiektu to O(1), pobranie poddrzewa to O(rozmiar poddrzewa),
+    a przejście po grupach nadrzędnych to O(głębokość).
+    """
+
+    __nodes: dict
+
+    def __init__(self) -> None:
+        self.__nodes = {}
+
+    def __node(self, full_path: str) -> NamespaceNode:
+        """
+        Zwraca węzeł o podanej ścieżce, tworząc go (wraz z brakującymi węzłami nadrzędnymi) w razie potrzeby.
+        """
+        node = self.__nodes.get(full_path)
+        if node is not None:
+            return node
+
+        parent = None
+        if '/' in full_path:
+            parent = self.__node(full_path.rsplit('/', 1)[0])
+        node = NamespaceNode(full_path, parent)
+        if parent is not None:
+            parent.children[full_path] = node
+        self.__nodes[full_path] = node
+        return node
+
+    def get(self, entity: str, full_path: str):
+        """
+        Zwraca grupę lub projekt o podanej ścieżce.
+
+        :params entity: Typ obiektu (group lub project)
+        :params full_path: Nazwa (fullPath) obiektu w Gitlab
+        :return: Zapisana wartość lub None
+        """
+        if entity == 'group':
+            node = self.__nodes.get(full_path)
+            return None if node is None else node.group
+
+        if '/' not in full_path:
+            return None
+        node = self.__nodes.get(full_path.rsplit('/', 1)[0])
+        return None if node is None else node.projects.get(full_path)
+
+    def set(self, entity: str, full_path: str, value) -> None:
+        """
+        Zapisuje grupę lub projekt w drzewie.
+
+        :params entity: Typ obiektu (group lub project)
+        :params full_path: Nazwa (fullPath) obiektu w Gitlab
+        :params value: Wartość
+        """
+        if entity == 'group':
+            self.__node(full_path).group = value
+        else:
+            self.__node(full_path.rsplit('/', 1)[0]).projects[full_path] = value
+
+    def set_complete(self, full_path: str) -> None:
+        """
+        Oznacza, że wszystkie grupy potomne grupy zostały pobrane.
+        """
+        self.__node(full_path).complete = True
+
+    def children(self, full_path: str):
+        """
+        Zwraca bezpośrednie podgrupy grupy, jeżeli jej grupy potomne zostały już pobrane.
+
+        :params full_path: Nazwa (fullPath) grupy w Gitlab
+        :return: Lista fullPath podgrup lub None, jeżeli drzewo grupy nie jest znane
+        """
+        node = self.__nodes.get(full_path)
+        if node is None or not node.complete:
+            return None
+        return [path for path, child in node.children.items() if child.group is not None]
+
+    def __walk(self, full_path: str):
+        """
+        Zwraca węzły poddrzewa (łącznie z węzłem o podanej ścieżce) w kolejności DFS.
+        """
+        node = self.__nodes.get(full_path)
+        if node is None:
+            return
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(list(node.children.values())))
+
+    def descendant_groups(self, full_path: str) -> list:
+        """
+        Zwraca wszystkie grupy potomne (bez samej grupy) zapisane w drzewie.
+
+        :params full_path: Nazwa (fullPath) grupy w Gitlab
+        :return: Lista grup
+        """
+        return [node.group for node in self.__walk(full_path) if node.group is not None and node.full_path != full_path]
+
+    def projects(self, full_path: str) -> list:
+        """
+        Zwraca wszystkie projekty grupy i jej podgrup zapisane w drzewie.
+
+        :params full_path: Nazwa (fullPath) grupy w Gitlab
+        :return: Lista projektów
+        """
+        return [project for node in self.__walk(full_path) for project in node.projects.values()]
+
+    def ancestors(self, full_path: str) -> list:
+        """
+        Zwraca ścieżki grup nadrzędnych obiektu, od przestrzeni nazw najwyższego poziomu.
+
+        :params full_path: Nazwa (fullPath) grupy lub projektu w Gitlab
+        :return: Lista fullPath grup nadrzędnych
+        """
+        ret = []
+        path = full_path
+        while '/' in path:
+            path = path.rsplit('/', 1)[0]
+            node = self.__nodes.get(path)
+            if node is not None:
+                while node is not None:
+                    ret.append(node.full_path)
+                    node = node.parent
+                break
+            ret.append(path)
+        ret.reverse()
+        return ret
+
+    def remove(self, full_path: str) -> None:
+        """
+        Usuwa z drzewa obiekt o podanej ścieżce wraz z całym poddrzewem.
+
+        :params full_path: Nazwa (fullPath) grupy lub projektu w Gitlab
+        """
+        if '/' in full_path:
+            parent = self.__nodes.get(full_path.rsplit('/', 1)[0])
+            if parent is not None:
+                parent.projects.pop(full_path, None)
+                parent.children.pop(full_path, None)
+            # drzewo grup nadrzędnych nie jest już kompletne
+            while parent is not None:
+                parent.complete = False
+                parent = parent.parent
+
+        for node in list(self.__walk(full_path)):
+            del self.__nodes[node.full_path]
+
+    def clear(self) -> None:
+        """
+        Usuwa wszystkie obiekty z drzewa.
+        """
+        self.__nodes.clear()
@@ -1,6 +1,29 @@
+from .Cache import GitlabCache
 from .GitlabConnector import GitlabConnector
+from .HttpPool import HttpPool
+from .Records import BranchRule, CiVariable, GroupRecord, Label, ProjectRecord, Record, parse_gid
+from .Retry import RetryPolicy
+from .Scheduler import RequestScheduler
+from .SingleFlight import SingleFlight
+from .Snapshot import GitlabSnapshot
+from .Tree import NamespaceNode, NamespaceTree
 
 
 __all__ = [
-    'GitlabConnector'
+    'BranchRule',
+    'CiVariable',
+    'GitlabCache',
+    'GitlabConnector',
+    'GitlabSnapshot',
+    'GroupRecord',
+    'HttpPool',
+    'Label',
+    'NamespaceNode',
+    'NamespaceTree',
+    'ProjectRecord',
+    'Record',
+    'RequestScheduler',
+    'RetryPolicy',
+    'SingleFlight',
+    'parse_gid'
 ]
\ No newline at end of file
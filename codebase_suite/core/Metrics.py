@@ -0,0 +1,181 @@
+import os
+import tempfile
+import threading
+import time
+
+from .Profiler import Profiler
+
+
+class Metrics:
+    """
+    Metryki uruchomienia w formacie tekstowym Prometheus (opcja --metrics), przeznaczone dla
+    textfile collectora node_exportera w zadaniach uruchamianych z cron/CI. Liczniki zdarzeń
+    (zapytania Gitlab według endpointu i statusu, zapisane i pominięte pliki, zaimportowane zasoby)
+    zbierane są w trakcie działania, a czasy i rozmiary operacji wyliczane na końcu z pomiarów Profiler.
+    """
+
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+    DEFINITIONS = {
+        'codebase_gitlab_requests_total': ('counter', 'Gitlab API responses by api, endpoint and HTTP status'),
+        'codebase_gitlab_request_duration_seconds': ('histogram', 'Gitlab API request duration including retries'),
+        'codebase_gitlab_response_bytes_total': ('counter', 'Bytes downloaded from Gitlab API'),
+        'codebase_gitlab_request_retries_total': ('counter', 'Gitlab API request retries'),
+        'codebase_cache_lookups_total': ('counter', 'Gitlab cache lookups by cache and result'),
+        'codebase_files_total': ('counter', 'Generated terraform files by entity and result (written, skipped)'),
+        'codebase_render_duration_seconds': ('histogram', 'Template rendering duration by output format'),
+        'codebase_render_bytes_total': ('counter', 'Rendered template bytes by output format'),
+        'codebase_command_duration_seconds': ('histogram', 'Terraform and git subprocess duration by command'),
+        'codebase_terraform_resources_imported_total': ('counter', 'Terraform resources imported by resource type and dry-run'),
+        'codebase_run_duration_seconds': ('gauge', 'Duration of the last run'),
+        'codebase_run_timestamp_seconds': ('gauge', 'Unix time of the end of the last run'),
+    }
+
+    __enabled: bool = False
+    __counters: dict = {}
+    __started: float = None
+    __lock = threading.Lock()
+
+    @classmethod
+    def configure(cls, enabled: bool = False) -> None:
+        """
+        Włącza lub wyłącza zbieranie metryk i usuwa zebrane wcześniej (opcja --metrics).
+
+        :params enabled: Czy zbierać metryki
+        :return: None
+        """
+        with cls.__lock:
+            cls.__enabled = enabled
+            cls.__counters = {}
+            cls.__started = time.time()
+
+    @classmethod
+    def enabled(cls) -> bool:
+        """
+        Zwraca informację, czy metryki są zbierane.
+        """
+        return cls.__enabled
+
+    @classmethod
+    def inc(cls, name: str, value: float = 1, **labels) -> None:
+        """
+        Zwiększa licznik.
+
+        :params name: Nazwa metryki (z DEFINITIONS)
+        :params value: Przyrost
+        :params labels: Etykiety metryki
+        """
+        if not cls.__enabled:
+            return
+        key = (name, tuple(sorted((label, str(value)) for label, value in labels.items())))
+        with cls.__lock:
+            cls.__counters[key] = cls.__counters.get(key, 0) + value
+
+    @classmethod
+    def endpoint(cls, path: str) -> str:
+        """
+        Zwraca endpoint Gitlab API bez identyfikatorów i parametrów (ograniczona liczba wartości etykiety),
+        np. /api/v4/projects/root%2Fapp/badges?page=2 → /api/v4/projects/:id/badges.
+
+        :params path: Ścieżka lub adres zapytania
+        """
+        path = path.split('?', 1)[0].split('://', 1)[-1]
+        segments = ('/' + path.split('/', 1)[1] if '/' in path else '/').split('/')
+        for i in range(1, len(segments)):
+            if segments[i - 1] in ('groups', 'projects', 'users') or segments[i].isdigit():
+                segments[i] = ':id'
+        return '/'.join(segments)
+
+    @classmethod
+    def samples(cls) -> dict:
+        """
+        Zwraca wszystkie metryki: liczniki oraz metryki wyliczone z pomiarów Profiler.
+
+        :return: Słownik nazwa → {etykiety: wartość} (dla histogramów: lista czasów)
+        """
+        with cls.__lock:
+            metrics = {}
+            for (name, labels), value in cls.__counters.items():
+                metrics.setdefault(name, {})[labels] = value
+
+        def add(name, value, **labels):
+            series = metrics.setdefault(name, {})
+            key = tuple(sorted(labels.items()))
+            if cls.DEFINITIONS[name][0] == 'histogram':
+                series.setdefault(key, []).append(value)
+            else:
+                series[key] = series.get(key, 0) + value
+
+        for span in Profiler.spans():
+            kind, _, name = span.operation.partition('.')
+            if kind == 'gitlab':
+                add('codebase_gitlab_request_duration_seconds', span.duration, api=name)
+                add('codebase_gitlab_response_bytes_total', span.bytes, api=name)
+                add('codebase_gitlab_request_retries_total', span.retries, api=name)
+            elif kind == 'cache' and span.cache is not None:
+                add('codebase_cache_lookups_total', 1, cache=name, result=span.cache)
+            elif kind == 'render':
+                add('codebase_render_duration_seconds', span.duration, format=name)
+                add('codebase_render_bytes_total', span.bytes, format=name)
+            elif kind in ('terraform', 'git'):
+                add('codebase_command_duration_seconds', span.duration, command=span.operation)
+
+        finished = time.time()
+        add('codebase_run_duration_seconds', finished - cls.__started)
+        add('codebase_run_timestamp_seconds', finished)
+        return metrics
+
+    @classmethod
+    def render(cls) -> str:
+        """
+        Zwraca metryki w formacie tekstowym Prometheus.
+        """
+        lines = []
+        for name, series in sorted(cls.samples().items()):
+            kind, description = cls.DEFINITIONS[name]
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in sorted(series.items()):
+                if kind != 'histogram':
+                    lines.append(f"{name}{cls.__labels(labels)} {cls.__number(value)}")
+                    continue
+                for bucket in cls.BUCKETS:
+                    count = sum(1 for sample in value if sample <= bucket)
+                    lines.append(f"{name}_bucket{cls.__labels(labels + (('le', cls.__number(bucket)),))} {count}")
+                lines.append(f"{name}_bucket{cls.__labels(labels + (('le', '+Inf'),))} {len(value)}")
+                lines.append(f"{name}_sum{cls.__labels(labels)} {cls.__number(sum(value))}")
+                lines.append(f"{name}_count{cls.__labels(labels)} {len(value)}")
+        return '\n'.join(lines) + '\n'
+
+    @classmethod
+    def save(cls, path) -> None:
+        """
+        Zapisuje metryki do pliku atomowo (plik tymczasowy i os.replace), aby textfile collector
+        nigdy nie odczytał niepełnego pliku.
+
+        :params path: Plik metryk (dla textfile collectora z rozszerzeniem .prom)
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary = tempfile.mkstemp(prefix='.metrics-', dir=directory)
+        try:
+            with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+                file.write(cls.render())
+            os.chmod(temporary, 0o644)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    @staticmethod
+    def __labels(labels: tuple) -> str:
+        if not labels:
+            return ''
+        escaped = []
+        for label, value in labels:
+            value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            escaped.append(f'{label}="{value}"')
+        return '{' + ','.join(escaped) + '}'
+
+    @staticmethod
+    def __number(value) -> str:
+        return repr(float(value)) if isinstance(value, float) else str(value)
@@ -0,0 +1,265 @@
+import contextvars
+import json
+import math
+import threading
+import time
+
+
+_current = contextvars.ContextVar('codebase_suite_span', default=None)
+
+
+class Span:
+    """
+    Pomiar czasu jednej operacji (zapytanie GraphQL/REST, polecenie terraform lub git, generowanie plików).
+    Używany jako menedżer kontekstu - w jego trakcie jest bieżącym pomiarem wątku lub zadania asyncio,
+    do którego pula połączeń dolicza pobrane bajty, a polityka zapytań ponowienia.
+    """
+
+    __slots__ = ('operation', 'target', 'start', 'duration', 'bytes', 'cache', 'retries', 'error', '__sizes', '__token')
+
+    def __init__(self, operation: str, target = None) -> None:
+        """
+        :params operation: Rodzaj operacji (np. gitlab.graphql, terraform.plan)
+        :params target: Obiekt operacji (np. fullPath grupy, adres zasobu terraform)
+        """
+        self.operation = operation
+        self.target = None if target is None else str(target)
+        self.start = None
+        self.duration = None
+        self.bytes = 0
+        self.cache = None
+        self.retries = 0
+        self.error = None
+        self.__sizes = []
+        self.__token = None
+
+    def add_bytes(self, size) -> None:
+        """
+        Dolicza rozmiar danych do pomiaru.
+
+        :params size: Liczba bajtów lub funkcja zwracająca ją po zakończeniu operacji (np. po odczycie odpowiedzi)
+        """
+        self.__sizes.append(size)
+
+    def __enter__(self) -> "Span":
+        self.__token = _current.set(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, kind, error, traceback) -> bool:
+        self.duration = time.perf_counter() - self.start
+        _current.reset(self.__token)
+        for size in self.__sizes:
+            try:
+                self.bytes += size() if callable(size) else size
+            except Exception:
+                pass
+        self.__sizes = []
+        if error is not None:
+            self.error = kind.__name__
+        Profiler.record(self)
+        return False
+
+    def to_dict(self) -> dict:
+        """
+        Zwraca pomiar jako słownik (raport --profile).
+        """
+        return {
+            'operation': self.operation,
+            'target': self.target,
+            'duration': self.duration,
+            'bytes': self.bytes,
+            'cache': self.cache,
+            'retries': self.retries,
+            'error': self.error,
+        }
+
+
+class NullSpan:
+    """
+    Pomiar zwracany, gdy profilowanie jest wyłączone - nie mierzy czasu i ignoruje przypisania.
+    """
+
+    __slots__ = ()
+
+    bytes = 0
+    cache = None
+    retries = 0
+    error = None
+
+    def add_bytes(self, size) -> None:
+        pass
+
+    def __setattr__(self, name, value) -> None:
+        pass
+
+    def __enter__(self) -> "NullSpan":
+        return self
+
+    def __exit__(self, kind, error, traceback) -> bool:
+        return False
+
+
+class Profiler:
+    """
+    Zbiera pomiary czasu operacji uruchomienia (opcja --profile) i tworzy z nich raport: łączny czas
+    i percentyle p50/p95/p99 dla każdego rodzaju operacji, najwolniejsze operacje oraz skuteczność cache.
+    Pomiary mogą być zagnieżdżone (np. gitlab.group → gitlab.graphql), dlatego czasy operacji różnych
+    rodzajów nie sumują się do czasu uruchomienia.
+    """
+
+    __enabled: bool = False
+    __spans: list = []
+    __started: float = None
+    __lock = threading.Lock()
+    __null = NullSpan()
+
+    @classmethod
+    def configure(cls, enabled: bool = False) -> None:
+        """
+        Włącza lub wyłącza zbieranie pomiarów i usuwa zebrane wcześniej (opcja --profile).
+
+        :params enabled: Czy zbierać pomiary
+        :return: None
+        """
+        with cls.__lock:
+            cls.__enabled = enabled
+            cls.__spans = []
+            cls.__started = time.time()
+
+    @classmethod
+    def enabled(cls) -> bool:
+        """
+        Zwraca informację, czy pomiary są zbierane.
+        """
+        return cls.__enabled
+
+    @classmethod
+    def span(cls, operation: str, target = None):
+        """
+        Zwraca pomiar operacji do użycia w instrukcji with.
+
+        :params operation: Rodzaj operacji (np. gitlab.graphql, terraform.plan)
+        :params target: Obiekt operacji (np. fullPath grupy)
+        :return: Span lub NullSpan, gdy profilowanie jest wyłączone
+        """
+        if not cls.__enabled:
+            return cls.__null
+        return Span(operation, target)
+
+    @classmethod
+    def current(cls):
+        """
+        Zwraca bieżący (najbardziej zagnieżdżony) pomiar wątku lub zadania asyncio albo None.
+        """
+        return _current.get()
+
+    @classmethod
+    def add_bytes(cls, size) -> None:
+        """
+        Dolicza rozmiar danych do bieżącego pomiaru (jeżeli istnieje).
+
+        :params size: Liczba bajtów lub funkcja zwracająca ją po zakończeniu operacji
+        """
+        span = _current.get()
+        if span is not None:
+            span.add_bytes(size)
+
+    @classmethod
+    def add_retry(cls) -> None:
+        """
+        Dolicza ponowienie zapytania do bieżącego pomiaru (jeżeli istnieje).
+        """
+        span = _current.get()
+        if span is not None:
+            span.retries += 1
+
+    @classmethod
+    def record(cls, span: Span) -> None:
+        """
+        Zapisuje zakończony pomiar.
+        """
+        with cls.__lock:
+            if cls.__enabled:
+                cls.__spans.append(span)
+
+    @classmethod
+    def spans(cls) -> list:
+        """
+        Zwraca zebrane pomiary.
+        """
+        with cls.__lock:
+            return list(cls.__spans)
+
+    @staticmethod
+    def percentile(values: list, q: float):
+        """
+        Zwraca percentyl (metoda najbliższej rangi) posortowanej listy wartości.
+
+        :params values: Posortowane wartości
+        :params q: Percentyl z zakresu 0.0 - 1.0
+        :return: Wartość percentyla lub None dla pustej listy
+        """
+        if not values:
+            return None
+        return values[max(0, math.ceil(q * len(values)) - 1)]
+
+    @classmethod
+    def report(cls, slowest: int = 20) -> dict:
+        """
+        Tworzy raport z zebranych pomiarów.
+
+        :params slowest: Liczba najwolniejszych operacji w raporcie
+        :return: Słownik raportu (operations, slowest, cache)
+        """
+        spans = cls.spans()
+        operations = {}
+        for span in spans:
+            operations.setdefault(span.operation, []).append(span)
+
+        summary = {}
+        for operation, items in sorted(operations.items()):
+            durations = sorted(span.duration for span in items)
+            hits = sum(1 for span in items if span.cache == 'hit')
+            misses = sum(1 for span in items if span.cache == 'miss')
+            summary[operation] = {
+                'count': len(items),
+                'total': sum(durations),
+                'p50': cls.percentile(durations, 0.50),
+                'p95': cls.percentile(durations, 0.95),
+                'p99': cls.percentile(durations, 0.99),
+                'max': durations[-1],
+                'bytes': sum(span.bytes for span in items),
+                'retries': sum(span.retries for span in items),
+                'errors': sum(1 for span in items if span.error is not None),
+                'cache_hits': hits,
+                'cache_misses': misses,
+            }
+
+        hits = sum(operation['cache_hits'] for operation in summary.values())
+        misses = sum(operation['cache_misses'] for operation in summary.values())
+        return {
+            'started_at': cls.__started,
+            'duration': None if cls.__started is None else time.time() - cls.__started,
+            'spans': len(spans),
+            'operations': summary,
+            'slowest': [span.to_dict() for span in sorted(spans, key=lambda span: span.duration, reverse=True)[:slowest]],
+            'cache': {
+                'hits': hits,
+                'misses': misses,
+                'hit_ratio': hits / (hits + misses) if hits + misses else None,
+            },
+        }
+
+    @classmethod
+    def save(cls, path) -> dict:
+        """
+        Zapisuje raport do pliku JSON.
+
+        :params path: Plik raportu
+        :return: Zapisany raport
+        """
+        report = cls.report()
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        return report
@@ -0,0 +1,113 @@
+import json
+import sys
+import threading
+import time
+
+
+class SamplingProfiler:
+    """
+    Profiler próbkujący (opcja --sample-profile): wątek w tle co `interval` sekund odczytuje stosy
+    wywołań wszystkich wątków procesu (sys._current_frames) i zapisuje je w formacie speedscope
+    (https://www.speedscope.app) - osobny profil dla każdego wątku. Narzut nie zależy od liczby
+    wywołań funkcji, dlatego profil można zebrać także dla długich importów i generowania plików.
+    """
+
+    SCHEMA = 'https://www.speedscope.app/file-format-schema.json'
+
+    def __init__(self, interval: float = 0.005) -> None:
+        """
+        :params interval: Odstęp między próbkami w sekundach
+        """
+        self.__interval = interval
+        self.__frames = {}
+        self.__profiles = {}
+        self.__stop = threading.Event()
+        self.__thread = None
+        self.__started = None
+        self.__stopped = None
+
+    def start(self) -> "SamplingProfiler":
+        """
+        Uruchamia próbkowanie w wątku w tle.
+        """
+        self.__started = time.perf_counter()
+        self.__thread = threading.Thread(target=self.__run, name='codebase-suite-sampler', daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Zatrzymuje próbkowanie.
+        """
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join()
+        self.__stopped = time.perf_counter()
+
+    def samples(self) -> int:
+        """
+        Zwraca liczbę zebranych próbek (we wszystkich wątkach).
+        """
+        return sum(len(profile['samples']) for profile in self.__profiles.values())
+
+    def __run(self) -> None:
+        own = threading.get_ident()
+        last = self.__started
+        while not self.__stop.wait(self.__interval):
+            now = time.perf_counter()
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(self.__frame(frame.f_code))
+                    frame = frame.f_back
+                stack.reverse()
+                profile = self.__profiles.setdefault(ident, {'name': names.get(ident, str(ident)), 'samples': [], 'weights': []})
+                profile['samples'].append(stack)
+                profile['weights'].append(now - last)
+            last = now
+
+    def __frame(self, code) -> int:
+        """
+        Zwraca indeks ramki (funkcji) we wspólnej tabeli ramek profilu.
+        """
+        key = (code.co_name, code.co_filename, code.co_firstlineno)
+        index = self.__frames.get(key)
+        if index is None:
+            index = self.__frames[key] = len(self.__frames)
+        return index
+
+    def save(self, path, name: str = 'codebase-suite') -> dict:
+        """
+        Zapisuje profil do pliku JSON w formacie speedscope.
+
+        :params path: Plik profilu
+        :params name: Nazwa profilu
+        :return: Zapisany dokument
+        """
+        end = (self.__stopped or time.perf_counter()) - self.__started
+        document = {
+            '$schema': self.SCHEMA,
+            'name': name,
+            'exporter': 'codebase-suite',
+            'shared': {
+                'frames': [{'name': key[0], 'file': key[1], 'line': key[2]} for key in self.__frames],
+            },
+            'profiles': [
+                {
+                    'type': 'sampled',
+                    'name': profile['name'],
+                    'unit': 'seconds',
+                    'startValue': 0,
+                    'endValue': end,
+                    'samples': profile['samples'],
+                    'weights': profile['weights'],
+                }
+                for profile in self.__profiles.values()
+            ],
+        }
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(document, file)
+        return document
@@ -1,9 +1,16 @@
 from .Context import Context
 from .Logger import Logger, LogLevel
+from .Metrics import Metrics
+from .Profiler import Profiler, Span
+from .Sampler import SamplingProfiler
 
 
 __all__ = [
     'Context',
     'Logger',
     'LogLevel',
+    'Metrics',
+    'Profiler',
+    'SamplingProfiler',
+    'Span',
 ]
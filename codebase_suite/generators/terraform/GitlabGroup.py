@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Union
 
 from ...config import Config
-from ...core import Logger
+from ...core import Logger, Metrics, Profiler
 
 class GitlabGroup:
     """ 
@@ -53,13 +53,16 @@ class GitlabGroup:
 
         if os.path.exists(dest_tf) and not self.__force:
             self.__logger.warning(f"⛔  File {dest_tf} already exists, skipping. Use --force to overwrite.")
+            Metrics.inc('codebase_files_total', entity='group', result='skipped')
         elif os.path.exists(dest_tf_json) and not self.__force:
             self.__logger.warning(f"⛔  File {dest_tf_json} already exists, skipping. Use --force to overwrite.")
+            Metrics.inc('codebase_files_total', entity='group', result='skipped')
         else:
             dest = dest_tf_json if is_json else dest_tf
             with open(dest, "w") as f:
                 f.write(body) if isinstance(body, str) else json.dump(body, f, indent=2)
             self.__logger.success(f"📝  Generated: {dest} module definition.")
+            Metrics.inc('codebase_files_total', entity='group', result='written')
 
     def __save_another_files(self, dest: str, body: Union[str,dict], is_json: bool = False) -> None:
         dest_tf = dest if str(dest).endswith(".tf") else str(dest)[:-5]
@@ -71,12 +74,15 @@ class GitlabGroup:
 
         if os.path.exists(dest_tf) and not self.__force:
             self.__logger.warning(f"⛔  File {dest_tf} already exists, skipping. Use --force to overwrite.")
+            Metrics.inc('codebase_files_total', entity='group', result='skipped')
         elif os.path.exists(dest_tf_json) and not self.__force:
             self.__logger.warning(f"⛔  File {dest_tf_json} already exists, skipping. Use --force to overwrite.")
+            Metrics.inc('codebase_files_total', entity='group', result='skipped')
         else:
             with open(dest, "w") as f:
                 f.write(body) if isinstance(body, str) else json.dump(body, f, indent=2)
             self.__logger.success(f"📝  Generated: {dest} module definition.")
+            Metrics.inc('codebase_files_total', entity='group', result='written')
 
     def generate_hcl(self, force: bool=False) -> None:
         self.__force = force
@@ -90,11 +96,13 @@ class GitlabGroup:
             template_name = j2_path.name
             
             template = template_env.get_template(name=template_name)
-            rendered = template.render({
-                "group": self.__group,
-                "module_name": self.__sanitized_group_name,
-                'source': self.tf_module_gitlab_group_source
-            })
+            with Profiler.span('render.hcl', f"{self.__group['fullPath']}/{template_name}") as span:
+                rendered = template.render({
+                    "group": self.__group,
+                    "module_name": self.__sanitized_group_name,
+                    'source': self.tf_module_gitlab_group_source
+                })
+                span.add_bytes(len(rendered))
 
             if template_name == 'module.tf.j2':
                 self.__save_module(body=rendered, is_json=False)
@@ -114,11 +122,13 @@ class GitlabGroup:
             template_name = j2_path.name
             
             template = template_env.get_template(name=template_name)
-            rendered = template.render({
-                "group": self.__group,
-                "module_name": self.__sanitized_group_name,
-                'source': self.tf_module_gitlab_group_source
-            })
+            with Profiler.span('render.json', f"{self.__group['fullPath']}/{template_name}") as span:
+                rendered = template.render({
+                    "group": self.__group,
+                    "module_name": self.__sanitized_group_name,
+                    'source': self.tf_module_gitlab_group_source
+                })
+                span.add_bytes(len(rendered))
 
             if template_name == 'module.tf.json.j2':
                 self.__save_module(body=json.loads(rendered), is_json=True)
@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Union
 
 from ...config import Config
-from ...core import Logger
+from ...core import Logger, Metrics, Profiler
 
 class GitlabProject:
     """ 
@@ -52,13 +52,16 @@ class GitlabProject:
 
         if os.path.exists(dest_tf) and not self.__force:
             self.__logger.warning(f"⛔  File {dest_tf} already exists, skipping. Use --force to overwrite.")
+            Metrics.inc('codebase_files_total', entity='project', result='skipped')
         elif os.path.exists(dest_tf_json) and not self.__force:
             self.__logger.warning(f"⛔  File {dest_tf_json} already exists, skipping. Use --force to overwrite.")
+            Metrics.inc('codebase_files_total', entity='project', result='skipped')
         else:
             dest = dest_tf_json if is_json else dest_tf
             with open(dest, "w") as f:
                 f.write(body) if isinstance(body, str) else json.dump(body, f, indent=2)
             self.__logger.success(f"📝  Generated: {dest} module definition.")
+            Metrics.inc('codebase_files_total', entity='project', result='written')
 
     def __save_another_files(self, dest: str, body: Union[str,dict], is_json: bool = False) -> None:
         dest_tf = dest if str(dest).endswith(".tf") else str(dest)[:-5]
@@ -70,12 +73,15 @@ class GitlabProject:
 
         if os.path.exists(dest_tf) and not self.__force:
             self.__logger.warning(f"⛔  File {dest_tf} already exists, skipping. Use --force to overwrite.")
+            Metrics.inc('codebase_files_total', entity='project', result='skipped')
         elif os.path.exists(dest_tf_json) and not self.__force:
             self.__logger.warning(f"⛔  File {dest_tf_json} already exists, skipping. Use --force to overwrite.")
+            Metrics.inc('codebase_files_total', entity='project', result='skipped')
         else:
             with open(dest, "w") as f:
                 f.write(body) if isinstance(body, str) else json.dump(body, f, indent=2)
             self.__logger.success(f"📝  Generated: {dest} module definition.")
+            Metrics.inc('codebase_files_total', entity='project', result='written')
 
     def generate_hcl(self, force: bool=False) -> None:
         self.__force = force
@@ -89,11 +95,13 @@ class GitlabProject:
             template_name = j2_path.name
             
             template = template_env.get_template(name=template_name)
-            rendered = template.render({
-                "project": self.__project,
-                "module_name": self.__sanitized_group_name,
-                'source': self.tf_module_gitlab_project_source
-            })
+            with Profiler.span('render.hcl', f"{self.__project['fullPath']}/{template_name}") as span:
+                rendered = template.render({
+                    "project": self.__project,
+                    "module_name": self.__sanitized_group_name,
+                    'source': self.tf_module_gitlab_project_source
+                })
+                span.add_bytes(len(rendered))
 
             if template_name == 'module.tf.j2':
                 self.__save_module(body=rendered, is_json=False)
@@ -113,11 +121,13 @@ class GitlabProject:
             template_name = j2_path.name
             
             template = template_env.get_template(name=template_name)
-            rendered = template.render({
-                "project": self.__project,
-                "module_name": self.__sanitized_group_name,
-                'source': self.tf_module_gitlab_project_source
-            })
+            with Profiler.span('render.json', f"{self.__project['fullPath']}/{template_name}") as span:
+                rendered = template.render({
+                    "project": self.__project,
+                    "module_name": self.__sanitized_group_name,
+                    'source': self.tf_module_gitlab_project_source
+                })
+                span.add_bytes(len(rendered))
 
             if template_name == 'module.tf.json.j2':
                 self.__save_module(body=json.loads(rendered), is_json=True)
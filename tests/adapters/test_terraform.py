@@ -428,3 +428,14 @@ def test_get_terraform_plan_json_file_not_found(mock_exists, mock_logger, fake_p
     with pytest.raises(SystemExit):
         tf.get_terraform_plan_json()
     mock_logger.error.assert_called()
+
+
+@pytest.mark.parametrize("address, resource_type", [
+    ('gitlab_group.app', 'gitlab_group'),
+    ('gitlab_project_variable.app["KEY.NAME"]', 'gitlab_project_variable'),
+    ('module.groups.gitlab_group_label.bug', 'gitlab_group_label'),
+    ('module.a["x"].module.b.gitlab_branch_protection.main', 'gitlab_branch_protection'),
+    ('data.gitlab_group.root', 'gitlab_group'),
+])
+def test_resource_type(address, resource_type):
+    assert Terraform.resource_type(address) == resource_type
@@ -0,0 +1,57 @@
+from unittest.mock import MagicMock
+from click.testing import CliRunner
+
+from codebase_suite.commands.gitlab.cache import cache
+from codebase_suite.connectors.Gitlab import GitlabCache
+
+
+INSTANCE = GitlabCache.fingerprint("https://gitlab.example.com", "secret-token")
+
+
+def make_ctx_obj(tmp_path):
+    config = MagicMock()
+    config.cache_dir = tmp_path
+    config.cache_ttl = 3600
+    config.gitlab_url = "https://gitlab.example.com"
+    config.gitlab_token.get_secret_value.return_value = "secret-token"
+
+    ctx_obj = MagicMock()
+    ctx_obj.get_config.return_value = config
+    return ctx_obj
+
+
+def test_clear_with_full_path(tmp_path):
+    store = GitlabCache(tmp_path, 3600, MagicMock(), INSTANCE)
+    store.set("group", "pl.rachuna-net/app", {})
+    store.set("group", "pl.rachuna-net/infrastructure", {})
+    ctx_obj = make_ctx_obj(tmp_path)
+
+    runner = CliRunner()
+    result = runner.invoke(cache, ['clear', '--full-path', 'pl.rachuna-net/app'], obj=ctx_obj)
+
+    assert result.exit_code == 0
+    ctx_obj.logger.return_value.success.assert_called_once_with("🧹  Removed 1 cache entries.")
+    assert store.get("group", "pl.rachuna-net/infrastructure") == {}
+
+
+def test_clear_all(tmp_path):
+    store = GitlabCache(tmp_path, 3600, MagicMock(), INSTANCE)
+    store.set("group", "pl.rachuna-net/app", {})
+    ctx_obj = make_ctx_obj(tmp_path)
+
+    runner = CliRunner()
+    result = runner.invoke(cache, ['clear'], obj=ctx_obj)
+
+    assert result.exit_code == 0
+    assert store.get("group", "pl.rachuna-net/app") is None
+
+
+def test_clear_keeps_other_instances(tmp_path):
+    other = GitlabCache(tmp_path, 3600, MagicMock(), GitlabCache.fingerprint("https://other.example.com", "secret-token"))
+    other.set("group", "pl.rachuna-net/app", {})
+    ctx_obj = make_ctx_obj(tmp_path)
+
+    result = CliRunner().invoke(cache, ['clear'], obj=ctx_obj)
+
+    assert result.exit_code == 0
+    assert other.get("group", "pl.rachuna-net/app") == {}
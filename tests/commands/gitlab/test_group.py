@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest.mock import patch, MagicMock
 from click.testing import CliRunner
@@ -92,7 +93,7 @@ def test_list_ci_command(mock_console_class, mock_gitlab_connector_class):
 
     # Assertions
     mock_gitlab_connector_class.assert_called_once_with(mock_logger)
-    mock_gl_instance.graphql_get_group_projects.assert_called_once_with('pl.rachuna-net/app')
+    mock_gl_instance.graphql_get_group_projects.assert_called_once_with('pl.rachuna-net/app', fields=('ciConfigPathOrDefault',))
     assert result.exit_code == 0
 
     assert mock_console.print.called
@@ -146,7 +147,7 @@ def test_list_labels_command(mock_console_class, mock_gitlab_connector_class):
 
     # Assertions
     mock_gitlab_connector_class.assert_called_once_with(mock_logger)
-    mock_gl_instance.graphql_get_group.assert_called_once_with('pl.rachuna-net/app')
+    mock_gl_instance.graphql_get_group.assert_called_once_with('pl.rachuna-net/app', fields=('labels',))
     assert result.exit_code == 0
 
     assert mock_console.print.called
@@ -216,7 +217,7 @@ def test_list_vars_command(mock_console_class, mock_gitlab_connector_class):
 
     # Assertions
     mock_gitlab_connector_class.assert_called_once_with(mock_logger)
-    mock_gl_instance.graphql_get_group.assert_called_once_with('pl.rachuna-net/app')
+    mock_gl_instance.graphql_get_group.assert_called_once_with('pl.rachuna-net/app', fields=('ciVariables',))
     assert result.exit_code == 0
 
     assert mock_console.print.called
@@ -235,4 +236,57 @@ def test_list_vars_command(mock_console_class, mock_gitlab_connector_class):
     assert "true" in output
     assert "Enable debug" in output
     assert "FOO" in output
-    assert "bar" in output
\ No newline at end of file
+    assert "bar" in output
+
+EFFECTIVE_VARIABLES = {
+    "pl.rachuna-net/app/api": {
+        "TOKEN:*:True": {"key": "TOKEN", "value": "t0k3n", "protected": True, "masked": True, "environmentScope": "*", "path": "pl.rachuna-net"},
+        "DEBUG:*:False": {"key": "DEBUG", "value": "true", "protected": False, "masked": False, "environmentScope": "*", "path": "pl.rachuna-net/app/api"},
+    },
+    "pl.rachuna-net/app/web": {
+        "TOKEN:*:True": {"key": "TOKEN", "value": "t0k3n", "protected": True, "masked": True, "environmentScope": "*", "path": "pl.rachuna-net"},
+    },
+}
+
+
+@patch("codebase_suite.commands.gitlab.group.GitlabConnector")
+@patch("codebase_suite.commands.gitlab.group.Console")
+def test_effective_vars_command_table(mock_console_class, mock_gitlab_connector_class):
+    ctx_obj = MagicMock()
+    mock_gitlab_connector_class.return_value.get_group_effective_variables.return_value = EFFECTIVE_VARIABLES
+
+    runner = CliRunner()
+    result = runner.invoke(group, ['effective-vars', '--full-path', 'pl.rachuna-net/app'], obj=ctx_obj)
+
+    mock_gitlab_connector_class.return_value.get_group_effective_variables.assert_called_once_with('pl.rachuna-net/app')
+    assert result.exit_code == 0
+
+    string_io = StringIO()
+    console = Console(file=string_io, force_terminal=True, width=160)
+    console.print(mock_console_class.return_value.print.call_args[0][0])
+    output = string_io.getvalue()
+
+    assert "pl.rachuna-net/app/web" in output
+    assert "TOKEN" in output
+    assert "t0k3n" in output
+
+
+@patch("codebase_suite.commands.gitlab.group.GitlabConnector")
+def test_effective_vars_command_ndjson(mock_gitlab_connector_class):
+    ctx_obj = MagicMock()
+    mock_gitlab_connector_class.return_value.get_group_effective_variables.return_value = EFFECTIVE_VARIABLES
+
+    runner = CliRunner()
+    result = runner.invoke(group, ['effective-vars', '-p', 'pl.rachuna-net/app', '--format', 'ndjson'], obj=ctx_obj)
+
+    assert result.exit_code == 0
+    rows = [json.loads(line) for line in result.output.splitlines()]
+    assert [(row['project'], row['key'], row['source']) for row in rows] == [
+        ("pl.rachuna-net/app/api", "DEBUG", "pl.rachuna-net/app/api"),
+        ("pl.rachuna-net/app/api", "TOKEN", "pl.rachuna-net"),
+        ("pl.rachuna-net/app/web", "TOKEN", "pl.rachuna-net"),
+    ]
+    assert rows[1] == {
+        "project": "pl.rachuna-net/app/api", "key": "TOKEN", "environmentScope": "*", "source": "pl.rachuna-net",
+        "value": "t0k3n", "protected": True, "masked": True,
+    }
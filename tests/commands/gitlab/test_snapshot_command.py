@@ -0,0 +1,19 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from click.testing import CliRunner
+
+from codebase_suite.commands.gitlab.snapshot import snapshot
+
+
+@patch("codebase_suite.commands.gitlab.snapshot.GitlabConnector")
+def test_export(GitlabConnectorMock):
+    gl = GitlabConnectorMock.return_value
+    gl.export_snapshot.return_value.entries.side_effect = lambda entity: {"group": {"root": {}}, "project": {"root/p": {}, "root/q": {}}}[entity]
+    ctx_obj = MagicMock()
+
+    runner = CliRunner()
+    result = runner.invoke(snapshot, ['export', '-p', 'root', '-o', 'tree.snap'], obj=ctx_obj)
+
+    assert result.exit_code == 0
+    gl.export_snapshot.assert_called_once_with("root", Path("tree.snap"))
+    ctx_obj.logger.return_value.success.assert_called_once_with("✔️  Saved snapshot of root (1 groups, 2 projects) to tree.snap.")
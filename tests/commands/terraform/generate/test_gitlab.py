@@ -8,7 +8,8 @@ from codebase_suite.commands.terraform.generate.gitlab import (
     gitlab,
     generate_group,
     generate_project,
-    groups
+    groups,
+    prefetch_rest_settings
 )
 
 # === Fixtures ===
@@ -136,8 +137,8 @@ def test_generate_project_json(GitlabConnectorMock, GitlabProjectMock, ctx_mock,
 @patch("codebase_suite.commands.terraform.generate.gitlab.GitlabConnector")
 def test_groups_command(GitlabConnectorMock, generate_group_mock, generate_project_mock, fake_group, fake_project):
     gl = GitlabConnectorMock.return_value
-    gl.graphql_get_descendantGroups.return_value = [fake_group]
-    gl.graphql_get_group_projects.return_value = [fake_project]
+    gl.iter_descendant_groups.return_value = iter([fake_group])
+    gl.iter_group_projects.return_value = iter([fake_project])
 
     runner = CliRunner()
     result = runner.invoke(
@@ -248,3 +249,95 @@ def test_group_command_calls_generate_group(mock_gitlab_connector, mock_generate
     assert args[5] is False                                    # force
     assert args[6] is True                                     # json
 
+
+
+@patch("codebase_suite.commands.terraform.generate.gitlab.generate_project")
+@patch("codebase_suite.commands.terraform.generate.gitlab.generate_group")
+@patch("codebase_suite.commands.terraform.generate.gitlab.GitlabConnector")
+def test_groups_command_incremental(GitlabConnectorMock, generate_group_mock, generate_project_mock, fake_group, fake_project):
+    gl = GitlabConnectorMock.return_value
+    gl.graphql_get_changed_groups.return_value = [fake_group]
+    gl.graphql_get_changed_projects.return_value = [fake_project]
+
+    runner = CliRunner()
+    result = runner.invoke(
+        gitlab,
+        [
+            "groups",
+            "-p", "pl.rachuna-net/group",
+            "-r", "/repo",
+            "--incremental"
+        ],
+        obj=MagicMock()
+    )
+
+    assert result.exit_code == 0
+    gl.iter_descendant_groups.assert_not_called()
+    generate_group_mock.assert_called_once_with(ANY, gl, fake_group["fullPath"], Path("/repo"), None, True, False)
+    generate_project_mock.assert_called_once_with(ANY, gl, fake_project["fullPath"], Path("/repo"), None, True, False)
+
+
+def test_prefetch_rest_settings_keeps_order_and_attaches_results():
+    import threading
+    import time
+
+    gl = MagicMock()
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def badges(full_path):
+        with lock:
+            active.append(full_path)
+            peak.append(len(active))
+        time.sleep(0.01 if full_path.endswith("0") else 0.001)
+        with lock:
+            active.remove(full_path)
+        return [{"name": full_path}]
+
+    gl.get_project_badges.side_effect = badges
+    gl.get_project_protected_tags.side_effect = lambda full_path: [{"name": "v*"}]
+    projects = ({"fullPath": f"root/p{i}"} for i in range(10))
+
+    result = list(prefetch_rest_settings(gl, projects, "project", 3))
+
+    assert [project["fullPath"] for project in result] == [f"root/p{i}" for i in range(10)]
+    assert result[4]["badges"] == [{"name": "root/p4"}]
+    assert result[4]["protected_tags"] == [{"name": "v*"}]
+    assert 1 < max(peak) <= 3
+    gl.get_group_badges.assert_not_called()
+
+
+def test_prefetch_rest_settings_raises_error_of_entity():
+    gl = MagicMock()
+    gl.get_group_badges.side_effect = RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        list(prefetch_rest_settings(gl, [{"fullPath": "root/a"}], "group", 2))
+
+
+@patch("codebase_suite.commands.terraform.generate.gitlab.generate_project")
+@patch("codebase_suite.commands.terraform.generate.gitlab.generate_group")
+@patch("codebase_suite.commands.terraform.generate.gitlab.GitlabConnector")
+def test_groups_command_prefetches_rest_settings(GitlabConnectorMock, generate_group_mock, generate_project_mock, fake_group, fake_project):
+    gl = GitlabConnectorMock.return_value
+    gl.iter_descendant_groups.return_value = iter([dict(fake_group)])
+    gl.iter_group_projects.return_value = iter([dict(fake_project)])
+
+    runner = CliRunner()
+    result = runner.invoke(
+        gitlab,
+        [
+            "groups",
+            "-p", "pl.rachuna-net/group",
+            "-r", "/repo",
+            "--workers", "4"
+        ],
+        obj=MagicMock()
+    )
+
+    assert result.exit_code == 0
+    gl.get_group_badges.assert_called_once_with(fake_group["fullPath"])
+    gl.get_project_badges.assert_called_once_with(fake_project["fullPath"])
+    gl.get_project_protected_tags.assert_called_once_with(fake_project["fullPath"])
+    assert generate_project_mock.call_count == 1
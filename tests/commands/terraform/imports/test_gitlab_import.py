@@ -596,6 +596,59 @@ def test_gitlab_import_project_settings(
 
     assert tf_instance.terraform_import.call_count >= 6
 
+    # tylko ustawienia wymagane przez plan (bez badges/mirrors dla projektu z samym tag protection itp.)
+    gl_instance.prefetch_rest_settings.assert_called_once_with([
+        ("project_protected_tags", gl_instance.get_project_full_path.return_value),
+        ("project_badges", gl_instance.get_project_full_path.return_value),
+        ("project_mirrors", gl_instance.get_project_full_path.return_value),
+    ])
+
+
+@patch("codebase_suite.commands.terraform.import_tf.GitlabConnector")
+@patch("codebase_suite.commands.terraform.import_tf.Terraform")
+@patch("codebase_suite.commands.terraform.import_tf.Config")
+def test_gitlab_import_prefetch_skips_unknown_owners(
+    mock_config,
+    mock_terraform,
+    mock_gitlab_connector,
+    ctx_mock
+):
+    runner = CliRunner()
+
+    # terraform pomija w "after" wartości nieznane przed apply
+    fake_plan = {
+        "resource_changes": [
+            {
+                "address": "gitlab_project_badge.badge1",
+                "type": "gitlab_project_badge",
+                "change": {"actions": ["create"], "after": {"name": "badge-name"}}
+            },
+            {
+                "address": "gitlab_group_badge.badge1",
+                "type": "gitlab_group_badge",
+                "change": {"actions": ["create"], "after": {"name": "badge-name"}}
+            },
+            {
+                "address": "gitlab_project_badge.badge2",
+                "type": "gitlab_project_badge",
+                "change": {"actions": ["create"], "after": {"project": 42, "name": "badge-name"}}
+            }
+        ]
+    }
+
+    gl_instance = mock_gitlab_connector.return_value
+    gl_instance.get_project_full_path.return_value = "group/project"
+    gl_instance.get_project_badges.return_value = []
+
+    tf_instance = mock_terraform.return_value
+    tf_instance.get_terraform_plan_json.return_value = fake_plan
+    mock_config.return_value.tf_state_name_iac_gitlab = "iac-gitlab"
+
+    result = runner.invoke(gitlab, ["--repository-path", "/repo", "--dry"], obj=ctx_mock)
+
+    assert result.exit_code == 0
+    gl_instance.prefetch_rest_settings.assert_called_once_with([("project_badges", "group/project")])
+
 
 @patch("codebase_suite.commands.terraform.import_tf.print_progress_bar")
 @patch("codebase_suite.commands.terraform.import_tf.GitlabConnector")
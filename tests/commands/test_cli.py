@@ -1,7 +1,11 @@
+import json
+import pstats
 import pytest
 import click
+from unittest.mock import patch
 from click.testing import CliRunner
 from codebase_suite.commands import commands  # zakładam, że tak importujesz ten moduł
+from codebase_suite.core import Metrics, Profiler
 
 
 def test_commands_help():
@@ -45,4 +49,93 @@ def test_commands_verbose_and_no_color_flags_sets_context():
     assert res.exit_code == 0
 
     res = invoke_and_check(verbose_count=2, no_color_flag=True)
-    assert res.exit_code == 0
\ No newline at end of file
+    assert res.exit_code == 0
+
+def test_commands_request_policy_options():
+    runner = CliRunner()
+
+    @commands.command()
+    def dummy():
+        pass
+
+    with patch("codebase_suite.commands.GitlabConnector.configure_requests") as configure_requests:
+        result = runner.invoke(commands, ['--retries', '1', '--deadline', '30', '--hedge', '--stream-json', 'dummy'])
+    commands.commands.pop('dummy')
+
+    assert result.exit_code == 0
+    configure_requests.assert_called_once_with(retries=1, deadline=30.0, hedge=True, stream=True)
+
+
+def test_commands_snapshot_option(tmp_path):
+    runner = CliRunner()
+    (tmp_path / "tree.snap").write_bytes(b"")
+
+    @commands.command()
+    def dummy():
+        pass
+
+    with patch("codebase_suite.commands.GitlabConnector.configure_snapshot") as configure_snapshot:
+        result = runner.invoke(commands, ['--snapshot', str(tmp_path / "tree.snap"), 'dummy'])
+        missing = runner.invoke(commands, ['--snapshot', str(tmp_path / "missing.snap"), 'dummy'])
+    commands.commands.pop('dummy')
+
+    assert result.exit_code == 0
+    configure_snapshot.assert_called_once_with(tmp_path / "tree.snap")
+    assert missing.exit_code == 2
+
+
+def test_commands_profile_option(tmp_path):
+    runner = CliRunner()
+
+    @commands.command()
+    def dummy():
+        with Profiler.span('terraform.plan', '/repo'):
+            pass
+
+    result = runner.invoke(commands, ['--profile', str(tmp_path / "report.json"), 'dummy'])
+    commands.commands.pop('dummy')
+    Profiler.configure()
+
+    assert result.exit_code == 0
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert report['operations']['terraform.plan']['count'] == 1
+
+
+def test_commands_metrics_option(tmp_path):
+    runner = CliRunner()
+
+    @commands.command()
+    def dummy():
+        Metrics.inc('codebase_files_total', entity='group', result='written')
+        with Profiler.span('terraform.plan', '/repo'):
+            pass
+
+    result = runner.invoke(commands, ['--metrics', str(tmp_path / "codebase.prom"), 'dummy'])
+    commands.commands.pop('dummy')
+    Profiler.configure()
+    Metrics.configure()
+
+    assert result.exit_code == 0
+    metrics = (tmp_path / "codebase.prom").read_text().splitlines()
+    assert 'codebase_files_total{entity="group",result="written"} 1' in metrics
+    assert 'codebase_command_duration_seconds_count{command="terraform.plan"} 1' in metrics
+
+
+def test_commands_cpu_and_sample_profile_options(tmp_path):
+    runner = CliRunner()
+
+    @commands.command()
+    def dummy():
+        sum(range(100000))
+
+    result = runner.invoke(commands, [
+        '--cpu-profile', str(tmp_path / "out.pstats"),
+        '--sample-profile', str(tmp_path / "out.speedscope.json"),
+        'dummy'
+    ])
+    commands.commands.pop('dummy')
+
+    assert result.exit_code == 0
+    stats = pstats.Stats(str(tmp_path / "out.pstats"))
+    assert any(function[2] == 'dummy' for function in stats.stats)
+    assert json.loads((tmp_path / "out.speedscope.json").read_text())['exporter'] == 'codebase-suite'
@@ -0,0 +1,111 @@
+import pytest
+from unittest.mock import MagicMock
+
+from codebase_suite.connectors.Gitlab import GitlabConnector
+from codebase_suite.core import Metrics, Profiler
+
+
+def reset_gitlab_connector_state():
+    GitlabConnector._GitlabConnector__tree.clear()
+    GitlabConnector._GitlabConnector__indexed_roots.clear()
+    GitlabConnector._GitlabConnector__rest_cache.clear()
+    for index in (GitlabConnector._GitlabConnector__paths, GitlabConnector._GitlabConnector__ids, GitlabConnector._GitlabConnector__projections):
+        for entity in index.values():
+            entity.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_gitlab_connector_cache():
+    """Czyści współdzielony cache GitlabConnector, aby testy nie wpływały na siebie nawzajem."""
+    GitlabConnector.configure_cache(enabled=False)
+    GitlabConnector.configure_requests()
+    GitlabConnector.configure_snapshot()
+    Profiler.configure()
+    Metrics.configure()
+    reset_gitlab_connector_state()
+    yield
+    GitlabConnector.configure_cache(enabled=False)
+    GitlabConnector.configure_requests()
+    GitlabConnector.configure_snapshot()
+    Profiler.configure()
+    Metrics.configure()
+    reset_gitlab_connector_state()
+
+
+@pytest.fixture
+def mock_logger():
+    return MagicMock()
+
+@pytest.fixture
+def mock_config():
+    mock = MagicMock()
+    mock.gitlab_url = "https://gitlab.example.com"
+    mock.gitlab_token.get_secret_value.return_value = "secret-token"
+    mock.ssl_verify = False
+    mock.api_version = "4"
+    mock.gitlab_max_concurrency = 4
+    return mock
+
+
+def gitlab_connection(nodes, cursor=None):
+    return {"nodes": nodes, "pageInfo": {"endCursor": cursor, "hasNextPage": cursor is not None}}
+
+def gitlab_variable(gid, key, value="v", kind="Ci::GroupVariable"):
+    return {
+        "id": f"gid://gitlab/{kind}/{gid}",
+        "key": key,
+        "description": "",
+        "value": value,
+        "protected": False,
+        "masked": False,
+        "environmentScope": "*",
+    }
+
+def gitlab_group(full_path, gid, variables=None, labels=None):
+    return {
+        "id": f"gid://gitlab/Group/{gid}",
+        "name": full_path.split('/')[-1],
+        "fullPath": full_path,
+        "description": "",
+        "visibility": "private",
+        "avatarUrl": None,
+        "labels": {"nodes": labels or []},
+        "ciVariables": {"nodes": variables or []},
+    }
+
+def gitlab_project(full_path, gid, variables=None, labels=None):
+    return {
+        "id": f"gid://gitlab/Project/{gid}",
+        "name": full_path.split('/')[-1],
+        "archived": False,
+        "ciConfigPathOrDefault": ".gitlab-ci.yml",
+        "description": "",
+        "fullPath": full_path,
+        "visibility": "private",
+        "avatarUrl": None,
+        "topics": [],
+        "branchRules": {"nodes": []},
+        "ciVariables": {"nodes": variables or []},
+        "labels": {"nodes": labels or []},
+    }
+
+
+@pytest.fixture
+def make_connection():
+    """Fabryka połączenia GraphQL (nodes + pageInfo)."""
+    return gitlab_connection
+
+@pytest.fixture
+def make_variable():
+    """Fabryka zmiennej CI/CD w formacie odpowiedzi GraphQL."""
+    return gitlab_variable
+
+@pytest.fixture
+def make_group():
+    """Fabryka grupy w formacie odpowiedzi GraphQL."""
+    return gitlab_group
+
+@pytest.fixture
+def make_project():
+    """Fabryka projektu w formacie odpowiedzi GraphQL."""
+    return gitlab_project
@@ -0,0 +1,153 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from codebase_suite.connectors.Gitlab import GitlabConnector
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_group_projects_fetched_per_subgroup_when_tree_is_known(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, make_group, make_project, make_connection):
+    mock_config_class.return_value = mock_config
+    graphql_mock = MagicMock()
+    mock_graphql_class.return_value = graphql_mock
+
+    def page(connection, nodes):
+        return {"group": {connection: make_connection(nodes)}}
+
+    label = {"id": "gid://gitlab/ProjectLabel/9", "color": "#fff", "description": "", "title": "bug"}
+    responses = {
+        ("root", True): page("descendantGroups", [
+            make_group("root/a", 1),
+            make_group("root/b", 2),
+            make_group("root/a/nested", 3),
+        ]),
+        ("root", False): page("projects", [make_project("root/p0", 10, labels=[label])]),
+        ("root/a", True): page("projects", [make_project("root/a/p1", 11), make_project("root/a/nested/p2", 12)]),
+        ("root/b", True): page("projects", [make_project("root/b/p3", 13)]),
+    }
+
+    def execute(query, variables):
+        if "descendantGroups" in query:
+            return responses[(variables['fullPath'], True)]
+        return responses[(variables['fullPath'], variables.get('includeSubgroups', True))]
+
+    graphql_mock.execute.side_effect = execute
+
+    connector = GitlabConnector(logger=mock_logger)
+    groups = connector.graphql_get_descendantGroups("root")
+    projects = connector.graphql_get_group_projects("root")
+
+    assert len(groups) == 3
+    assert sorted(p["fullPath"] for p in projects) == ["root/a/nested/p2", "root/a/p1", "root/b/p3", "root/p0"]
+    assert projects[0]["labels"][0]["id"] == "9"
+
+    # 1x descendantGroups + 1x projekty grupy root + po jednym zapytaniu dla każdej bezpośredniej podgrupy
+    assert graphql_mock.execute.call_count == 4
+    queried = [call.args[1]['fullPath'] for call in graphql_mock.execute.call_args_list[1:]]
+    assert sorted(queried) == ["root", "root/a", "root/b"]
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_concurrency_is_bounded(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, make_project):
+    mock_config.gitlab_max_concurrency = 2
+    mock_config_class.return_value = mock_config
+    graphql_mock = MagicMock()
+    mock_graphql_class.return_value = graphql_mock
+
+    lock = threading.Lock()
+    state = {"running": 0, "max": 0}
+
+    def execute(query, variables):
+        with lock:
+            state["running"] += 1
+            state["max"] = max(state["max"], state["running"])
+        time.sleep(0.02)
+        with lock:
+            state["running"] -= 1
+        return {"project": make_project(variables['fullPath'], 1)}
+
+    graphql_mock.execute.side_effect = execute
+
+    connector = GitlabConnector(logger=mock_logger)
+
+    async def fetch_all():
+        return await asyncio.gather(*[
+            connector.async_graphql_get_project(f"root/p{i}") for i in range(6)
+        ])
+
+    projects = asyncio.run(fetch_all())
+
+    assert len(projects) == 6
+    assert graphql_mock.execute.call_count == 6
+    assert state["max"] == 2
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_async_graphql_get_group_uses_cache(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, make_group):
+    mock_config_class.return_value = mock_config
+    graphql_mock = MagicMock()
+    graphql_mock.execute.return_value = {"group": make_group("root", 5)}
+    mock_graphql_class.return_value = graphql_mock
+
+    connector = GitlabConnector(logger=mock_logger)
+    group = asyncio.run(connector.async_graphql_get_group("root"))
+
+    assert group["id"] == "5"
+    assert connector.graphql_get_group("root") is group
+    assert graphql_mock.execute.call_count == 1
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_not_found_returns_none(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config):
+    mock_config_class.return_value = mock_config
+    graphql_mock = MagicMock()
+    graphql_mock.execute.return_value = {"group": None, "project": None}
+    mock_graphql_class.return_value = graphql_mock
+
+    connector = GitlabConnector(logger=mock_logger)
+
+    assert connector.graphql_get_project("missing/project") is None
+    assert connector.graphql_get_group("missing") is None
+    assert asyncio.run(connector.async_graphql_get_project("missing/project")) is None
+    assert asyncio.run(connector.async_graphql_get_group("missing")) is None
+    assert connector.graphql_get_descendantGroups("missing") == []
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_group_projects_after_invalidating_subgroup(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, make_group, make_project, make_connection):
+    mock_config_class.return_value = mock_config
+    graphql_mock = MagicMock()
+    mock_graphql_class.return_value = graphql_mock
+
+    def execute(query, variables):
+        if "descendantGroups" in query:
+            return {"group": {"descendantGroups": make_connection([make_group("root/a", 1), make_group("root/b", 2)])}}
+        projects = {
+            ("root", False): [make_project("root/p0", 10)],
+            ("root", True): [make_project("root/p0", 10), make_project("root/a/p1", 11), make_project("root/b/p2", 12)],
+            ("root/a", True): [make_project("root/a/p1", 11)],
+            ("root/b", True): [make_project("root/b/p2", 12)],
+        }[(variables['fullPath'], variables.get('includeSubgroups', True))]
+        return {"group": {"projects": make_connection(projects)}}
+
+    graphql_mock.execute.side_effect = execute
+
+    connector = GitlabConnector(logger=mock_logger)
+    connector.graphql_get_descendantGroups("root")
+    connector.invalidate_cache("root/a")
+    projects = connector.graphql_get_group_projects("root")
+
+    assert sorted(p["fullPath"] for p in projects) == ["root/a/p1", "root/b/p2", "root/p0"]
@@ -0,0 +1,158 @@
+import asyncio
+import pytest
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from codebase_suite.connectors.Gitlab import GitlabConnector, HttpPool
+from codebase_suite.core import Profiler
+
+from support.fake_gitlab import FakeGitlab, ReplayGitlab, SyntheticTree
+from support.recorder import SessionRecorder
+
+
+@pytest.fixture
+def serve(mock_config, mock_logger):
+    """Uruchamia konektor na lokalnym zastępniku Gitlab (świeża pula połączeń dla każdego serwera)."""
+    pools = []
+
+    def serve(server):
+        mock_config.gitlab_url = server.url
+        mock_config.http_pool_size = 4
+        mock_config.http_keepalive = 5
+        mock_config.http_timeout = 5
+        mock_config.http2 = False
+        pool = HttpPool.__wrapped__(mock_config, mock_logger)
+        pools.append(pool)
+        patch("codebase_suite.connectors.Gitlab.GitlabConnector.HttpPool", return_value=pool).start()
+        patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config", return_value=mock_config).start()
+        return pool
+
+    yield serve
+    patch.stopall()
+    for pool in pools:
+        pool.close()
+
+
+def test_synthetic_tree_size():
+    tree = SyntheticTree(depth=2, width=3, projects=2)
+
+    assert len(tree.groups) == 1 + 3 + 9
+    assert len(tree.projects) == 2 * 13
+    assert tree.find("projects", str(tree.projects["root/group-1/project-0"]["id"]))["fullPath"] == "root/group-1/project-0"
+
+
+def test_connector_reads_fake_gitlab(serve, mock_logger):
+    tree = SyntheticTree(depth=2, width=2, projects=3, variables=5, badges=2, protected_tags=1, mirrors=1)
+    with FakeGitlab(tree, page_size=4) as fake:
+        serve(fake)
+        connector = GitlabConnector(logger=mock_logger)
+
+        assert connector.graphql_get_group("root")["id"] == str(tree.groups["root"]["id"])
+        assert len(connector.graphql_get_descendantGroups("root")) == 6
+        projects = connector.graphql_get_group_projects("root")
+        assert len(projects) == 21
+        # zagnieżdżone połączenia (5 zmiennych, strony po 4) są dopobierane
+        assert [variable["key"] for variable in projects[0]["ciVariables"]] == [f"VARIABLE_{i}" for i in range(5)]
+
+        assert len(connector.get_group_badges("root/group-0")) == 2
+        assert [tag["name"] for tag in connector.get_project_protected_tags("root/project-0")] == ["v0.*"]
+        assert connector.get_project_mirrors("root/project-0")[0].url == tree.projects["root/project-0"]["remote_mirrors"][0]["url"]
+        assert connector.get_project_full_path(tree.projects["root/group-1/project-2"]["id"]) == "root/group-1/project-2"
+
+
+
+def test_connector_profile_spans(serve, mock_logger):
+    with FakeGitlab(SyntheticTree(depth=1, width=1, projects=1)) as fake:
+        serve(fake)
+        Profiler.configure(enabled=True)
+        connector = GitlabConnector(logger=mock_logger)
+        connector.graphql_get_group("root")
+        connector.graphql_get_group("root")
+        connector.get_project_badges("root/project-0")
+        connector.get_project_badges("root/project-0")
+        report = Profiler.report()
+        Profiler.configure()
+
+    operations = report['operations']
+    assert (operations['cache.group']['cache_hits'], operations['cache.group']['cache_misses']) == (1, 1)
+    assert (operations['cache.project_badges']['cache_hits'], operations['cache.project_badges']['cache_misses']) == (1, 1)
+    assert operations['gitlab.graphql']['count'] == 1
+    assert operations['gitlab.graphql']['bytes'] > 0
+    assert operations['gitlab.rest']['count'] == 1
+    assert operations['gitlab.rest']['bytes'] > 0
+    assert report['cache']['hit_ratio'] == 0.5
+
+def test_group_effective_variables_match_inherited_variables(serve, mock_logger):
+    tree = SyntheticTree(depth=2, width=2, projects=2, variables=2)
+    tree.groups["root/group-0"]["ciVariables"] = []
+    tree.projects["root/group-0/group-1/project-0"]["ciVariables"] = []
+    tree.projects["root/group-0/group-1/project-1"]["ciVariables"] = []
+    with FakeGitlab(tree) as fake:
+        serve(fake)
+        effective = GitlabConnector(logger=mock_logger).get_group_effective_variables("root/group-0")
+        requests = len(fake.requests)
+        expected = {
+            path: GitlabConnector(logger=mock_logger).get_project_inherited_variables(path)
+            for path in tree.projects if path.startswith("root/group-0/")
+        }
+
+    # grupa, grupa nadrzędna, grupy potomne oraz projekty grupy i każdej z 2 podgrup - niezależnie od liczby projektów
+    assert requests == 6
+    assert sorted(effective) == sorted(expected)
+    for path, variables in effective.items():
+        assert {key: (var["path"], var["value"]) for key, var in variables.items()} == \
+               {key: (var["path"], var["value"]) for key, var in expected[path].items()}
+    assert effective["root/group-0/project-0"]["VARIABLE_0:*:False"]["path"] == "root/group-0/project-0"
+    assert effective["root/group-0/group-1/project-1"]["VARIABLE_1:*:False"]["path"] == "root/group-0/group-1"
+    # projekty bez własnych zmiennych współdzielą słownik zmiennych grupy
+    assert effective["root/group-0/group-1/project-0"] is effective["root/group-0/group-1/project-1"]
+
+
+def test_concurrent_group_fetches_share_one_request(serve, mock_logger):
+    with FakeGitlab(SyntheticTree(depth=0, projects=1), latency=0.05) as fake:
+        serve(fake)
+        connector = GitlabConnector(logger=mock_logger)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            groups = list(executor.map(lambda _: connector.graphql_get_group("root"), range(8)))
+        threaded = len(fake.requests)
+
+        async def fetch():
+            return await asyncio.gather(*[connector.async_graphql_get_project("root/project-0") for _ in range(8)])
+        projects = asyncio.run(fetch())
+
+    assert threaded == 1
+    assert all(group is groups[0] for group in groups)
+    assert len(fake.requests) == 2
+    assert all(project is projects[0] for project in projects)
+
+
+def test_fake_gitlab_faults(serve, mock_logger):
+    with FakeGitlab(SyntheticTree(depth=0, projects=1), error_rate=0.5, rate_limit=600, seed=1) as fake:
+        pool = serve(fake)
+        GitlabConnector.configure_requests(retries=10)
+
+        assert GitlabConnector(logger=mock_logger).graphql_get_group("root")["fullPath"] == "root"
+        assert len(fake.requests) > 1
+        assert pool.scheduler().rate() == 10
+
+
+def test_record_and_replay_session(serve, mock_logger, tmp_path):
+    with FakeGitlab(SyntheticTree(depth=1, width=2, projects=2), page_size=2) as fake:
+        pool = serve(fake)
+        recorder = SessionRecorder(fake.url).attach(pool)
+        connector = GitlabConnector(logger=mock_logger)
+        expected = [project["fullPath"] for project in connector.graphql_get_group_projects("root")]
+        badges = connector.get_project_badges("root/project-0")
+        recorder.save(tmp_path / "session.json")
+    patch.stopall()
+    GitlabConnector._GitlabConnector__tree.clear()
+    GitlabConnector._GitlabConnector__rest_cache.clear()
+
+    with ReplayGitlab(SessionRecorder.load(tmp_path / "session.json")) as replay:
+        serve(replay)
+        connector = GitlabConnector(logger=mock_logger)
+
+        assert [project["fullPath"] for project in connector.graphql_get_group_projects("root")] == expected
+        assert connector.get_project_badges("root/project-0") == badges
+        assert replay.missing == []
@@ -0,0 +1,115 @@
+import re
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from codebase_suite.connectors.Gitlab import GitlabConnector
+from codebase_suite.connectors.Gitlab.Graphql import (
+    projection,
+    query_get_group,
+    query_group_projects
+)
+
+
+def projected(node: dict, query: str) -> dict:
+    """Zwraca tylko pola węzła wymienione w zapytaniu (tak jak Gitlab)."""
+    return {key: value for key, value in node.items() if re.search(rf"\b{key}\b", query)}
+
+
+@pytest.fixture
+def graphql_mock(mock_config):
+    with patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config") as mock_config_class, \
+         patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab"), \
+         patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL") as mock_graphql_class:
+        mock_config_class.return_value = mock_config
+        graphql = MagicMock()
+        mock_graphql_class.return_value = graphql
+        yield graphql
+
+
+def test_projection_keeps_order_and_required_fields():
+    assert projection('project', ['ciConfigPathOrDefault']) == ('id', 'ciConfigPathOrDefault', 'fullPath')
+    assert projection('group', None) == projection('group')
+    assert 'labels' in projection('group')
+
+    with pytest.raises(ValueError, match="Unknown project fields: unknown"):
+        projection('project', ['unknown'])
+
+
+def test_query_is_built_once_per_projection():
+    fields = projection('project', ['ciConfigPathOrDefault'])
+    query = query_group_projects(fields)
+
+    assert query is query_group_projects(fields)
+    assert "ciConfigPathOrDefault" in query
+    for heavy in ("branchRules", "ciVariables", "labels", "topics"):
+        assert heavy not in query
+    assert "branchRules" in query_group_projects()
+
+
+def test_group_projects_with_projection(graphql_mock, mock_logger, make_project, make_connection):
+    graphql_mock.execute.side_effect = lambda query, variables: {
+        "group": {"projects": make_connection([projected(make_project("root/p1", 11), query)])}
+    }
+
+    connector = GitlabConnector(logger=mock_logger)
+    projects = connector.graphql_get_group_projects("root", fields=('ciConfigPathOrDefault',))
+
+    assert projects == [{"id": "11", "ciConfigPathOrDefault": ".gitlab-ci.yml", "fullPath": "root/p1"}]
+
+    # węższa projekcja korzysta z cache
+    connector.graphql_get_group_projects("root", fields=('ciConfigPathOrDefault',))
+    assert connector.graphql_get_project("root/p1", fields=('ciConfigPathOrDefault',))["id"] == "11"
+    assert graphql_mock.execute.call_count == 2
+
+
+def test_richer_request_upgrades_cache_entry(graphql_mock, mock_logger, make_group, make_variable):
+    label = {"id": "gid://gitlab/GroupLabel/7", "color": "#fff", "description": "", "title": "bug"}
+    group = lambda: make_group("root", 1, variables=[make_variable(5, "KEY")], labels=[label])
+    graphql_mock.execute.side_effect = lambda query, variables: {"group": projected(group(), query)}
+
+    connector = GitlabConnector(logger=mock_logger)
+    labels = connector.graphql_get_group("root", fields=('labels',))
+    assert "ciVariables" not in labels
+    assert "ciVariables" not in graphql_mock.execute.call_args.args[0]
+
+    variables = connector.graphql_get_group("root", fields=('ciVariables',))
+    assert "labels" not in graphql_mock.execute.call_args.args[0]
+    assert variables["labels"][0]["id"] == "7"
+    assert variables["ciVariables"][0]["id"] == "5"
+
+    # wpis zawiera teraz obie projekcje
+    connector.graphql_get_group("root", fields=('labels', 'ciVariables'))
+    assert graphql_mock.execute.call_count == 2
+
+    full = connector.graphql_get_group("root")
+    assert full["visibility"] == "private"
+    assert graphql_mock.execute.call_count == 3
+    connector.graphql_get_group("root", fields=('labels',))
+    assert graphql_mock.execute.call_count == 3
+
+
+def test_projection_is_kept_in_persistent_cache(graphql_mock, mock_logger, mock_config, tmp_path, make_project, make_connection):
+    mock_config.cache_enabled = True
+    mock_config.cache_dir = tmp_path
+    mock_config.cache_ttl = 3600
+    mock_config.cache_secrets = False
+    graphql_mock.execute.side_effect = lambda query, variables: {
+        "group": {"projects": make_connection([projected(make_project("root/p1", 11), query)])},
+        "project": projected(make_project("root/p1", 11), query),
+    }
+
+    GitlabConnector.configure_cache(enabled=True)
+    GitlabConnector(logger=mock_logger).graphql_get_group_projects("root", fields=('ciConfigPathOrDefault',))
+
+    # nowe uruchomienie aplikacji - pusty cache w pamięci
+    GitlabConnector._GitlabConnector__tree.clear()
+    GitlabConnector._GitlabConnector__projections['project'].clear()
+    connector = GitlabConnector(logger=mock_logger)
+
+    connector.graphql_get_group_projects("root", fields=('ciConfigPathOrDefault',))
+    assert graphql_mock.execute.call_count == 1
+
+    project = connector.graphql_get_project("root/p1")
+    assert project["branchRules"] == []
+    assert graphql_mock.execute.call_count == 2
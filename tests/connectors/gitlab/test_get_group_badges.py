@@ -74,5 +74,5 @@ def test_get_group_badges(mock_config_class, mock_gitlab_class, mock_logger, moc
     result = connector.get_group_badges("mygroup")
 
     assert result == expected_badges
-    mock_gitlab_client.groups.get.assert_called_once_with("mygroup")
-    mock_badges.list.assert_called_once_with(all=True)
+    mock_gitlab_client.groups.get.assert_called_once_with("mygroup", lazy=True)
+    mock_badges.list.assert_called_once_with(all=True, per_page=100)
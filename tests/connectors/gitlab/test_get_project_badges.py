@@ -75,5 +75,5 @@ def test_get_project_badges(mock_config_class, mock_gitlab_class, mock_logger, m
     result = connector.get_project_badges("mygroup/myproject")
 
     assert result == expected_badges
-    mock_gitlab_client.projects.get.assert_called_once_with("mygroup/myproject")
-    mock_badges.list.assert_called_once_with(all=True)
\ No newline at end of file
+    mock_gitlab_client.projects.get.assert_called_once_with("mygroup/myproject", lazy=True)
+    mock_badges.list.assert_called_once_with(all=True, per_page=100)
\ No newline at end of file
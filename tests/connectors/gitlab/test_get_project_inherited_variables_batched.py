@@ -0,0 +1,105 @@
+import graphql
+import pytest
+from unittest.mock import patch, MagicMock
+
+from codebase_suite.connectors.Gitlab import GitlabConnector
+from codebase_suite.connectors.Gitlab.Graphql import (
+    query_get_ancestors,
+    query_get_descendantGroups,
+    query_get_group,
+    query_get_project,
+    query_group_projects
+)
+from codebase_suite.connectors.Gitlab.Graphql.fragments import fragments
+
+
+def test_query_get_ancestors_is_valid_graphql():
+    document = graphql.parse(query_get_ancestors(3))
+    operation = document.definitions[0]
+
+    assert [s.alias.value for s in operation.selection_set.selections] == ["group0", "group1", "group2", "project"]
+    assert len(document.definitions) == 3
+
+    document = graphql.parse(query_get_ancestors(1, include_project=False))
+    assert len(document.definitions) == 2
+
+
+def fragment_names(query):
+    document = graphql.parse(query)
+    defined = {d.name.value for d in document.definitions if isinstance(d, graphql.FragmentDefinitionNode)}
+    spreads = set()
+
+    class Visitor(graphql.Visitor):
+        def enter_fragment_spread(self, node, *args):
+            spreads.add(node.name.value)
+
+    graphql.visit(document, Visitor())
+    return defined, spreads
+
+
+def test_query_get_ancestors_emits_only_used_fragments():
+    # wszystkie grupy nadrzędne są w cache - tylko projekt
+    defined, spreads = fragment_names(query_get_ancestors(0, include_project=True))
+    assert defined == spreads == {"ProjectFields"}
+
+    defined, spreads = fragment_names(query_get_ancestors(2, include_project=False))
+    assert defined == spreads == {"GroupFields"}
+
+
+def test_queries_share_field_selections():
+    queries = [query_get_group(), query_get_project(), query_get_descendantGroups(), query_group_projects(), query_get_ancestors(1)]
+    for query in queries:
+        defined, spreads = fragment_names(query)
+        assert defined == spreads
+
+    assert query_get_group().endswith(fragments('GroupFields'))
+    assert query_get_project().endswith(fragments('ProjectFields'))
+    assert query_get_ancestors(1) == query_get_ancestors(1).split("fragment")[0] + fragments('GroupFields', 'ProjectFields')
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_inherited_variables_in_one_request(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, make_group, make_project, make_variable):
+    mock_config_class.return_value = mock_config
+    graphql_mock = MagicMock()
+    graphql_mock.execute.return_value = {
+        "group0": make_group("a", 1, [make_variable(10, "TOKEN", "a"), make_variable(11, "ROOT", "r")]),
+        "group1": None,
+        "group2": make_group("a/b/c", 3, [make_variable(12, "TOKEN", "c")]),
+        "project": make_project("a/b/c/proj", 4, [make_variable(13, "LOCAL", "p", "Ci::Variable")]),
+    }
+    mock_graphql_class.return_value = graphql_mock
+
+    connector = GitlabConnector(logger=mock_logger)
+    variables = connector.get_project_inherited_variables("a/b/c/proj")
+
+    graphql_mock.execute.assert_called_once()
+    assert graphql_mock.execute.call_args.args[1] == {
+        "group0": "a",
+        "group1": "a/b",
+        "group2": "a/b/c",
+        "project": "a/b/c/proj",
+    }
+    assert variables["TOKEN:*:False"]["value"] == "c"
+    assert variables["TOKEN:*:False"]["path"] == "a/b/c"
+    assert variables["ROOT:*:False"]["path"] == "a"
+    assert variables["LOCAL:*:False"]["id"] == "13"
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_inherited_variables_skip_request_when_cached(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config):
+    mock_config_class.return_value = mock_config
+    graphql_mock = MagicMock()
+    mock_graphql_class.return_value = graphql_mock
+
+    tree = GitlabConnector._GitlabConnector__tree
+    tree.set("group", "a", {"ciVariables": []})
+    tree.set("project", "a/proj", {"ciVariables": []})
+
+    connector = GitlabConnector(logger=mock_logger)
+
+    assert connector.get_project_inherited_variables("a/proj") == {}
+    graphql_mock.execute.assert_not_called()
@@ -50,5 +50,5 @@ def test_get_project_mirrors(mock_config_class, mock_gitlab_class, mock_logger,
 
     # Assert
     assert result == expected_mirrors
-    mock_gitlab_client.projects.get.assert_called_once_with(project_path)
+    mock_gitlab_client.projects.get.assert_called_once_with(project_path, lazy=True)
     mock_project.remote_mirrors.list.assert_called_once()
\ No newline at end of file
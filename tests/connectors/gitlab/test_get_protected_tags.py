@@ -72,5 +72,5 @@ def test_get_project_protected_tags(mock_config_class, mock_gitlab_class, mock_c
 
     # Assercje
     assert result == expected_tags
-    mock_gitlab_client.projects.get.assert_called_once_with("mygroup/myproject")
-    mock_protectedtags.list.assert_called_once_with(all=True)
\ No newline at end of file
+    mock_gitlab_client.projects.get.assert_called_once_with("mygroup/myproject", lazy=True)
+    mock_protectedtags.list.assert_called_once_with(all=True, per_page=100)
\ No newline at end of file
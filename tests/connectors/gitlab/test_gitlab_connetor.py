@@ -58,11 +58,11 @@ def test_init_success(mock_config_class, mock_gitlab_class, mock_graphql_class,
     mock_gitlab_class.return_value = mock_gitlab_client
     mock_graphql_class.return_value = mock_graphql
 
-    connector = GitlabConnector(logger=mock_logger)
+    connector = GitlabConnector(logger=mock_logger, check_auth=True)
 
     assert connector._GitlabConnector__client == mock_gitlab_client
     assert connector._GitlabConnector__graphql == mock_graphql
-    mock_logger.debug.assert_called_with("✔️  Authorization in Gitlab GRAPHQL successful.")
+    mock_logger.debug.assert_called_with("✔️  Gitlab GRAPHQL client created.")
 
 @patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
 @patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
@@ -75,7 +75,7 @@ def test_init_auth_fail(mock_config_class, mock_gitlab_class, mock_graphql_class
     mock_graphql_class.return_value = MagicMock()
 
     with pytest.raises(GitlabInstanceUnavailableException):
-        GitlabConnector(logger=mock_logger)
+        GitlabConnector(logger=mock_logger, check_auth=True)
 
 @patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
 @patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
@@ -92,7 +92,7 @@ def test_init_graphql_fail(mock_config_class, mock_gitlab_class, mock_graphql_cl
     mock_graphql_class.side_effect = Exception("GraphQL error")
 
     with pytest.raises(GitlabGraphQLUnavailableException) as exc_info:
-        GitlabConnector(logger=mock_logger)
+        GitlabConnector(logger=mock_logger, check_auth=True)
 
     assert "GraphQL error" in str(exc_info.value)
     mock_logger.error.assert_called_with("❌  Authorization Gitlab GRAPHQL failed. Please check your configuration.") 
@@ -124,3 +124,98 @@ def test_init_default_logger_used(
     mock_logger_class.assert_called_once()
     assert connector._GitlabConnector__logger == mock_logger_instance
 
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_init_is_lazy(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, mock_gitlab_client, mock_graphql):
+    mock_config_class.return_value = mock_config
+    mock_gitlab_class.return_value = mock_gitlab_client
+    mock_graphql.execute.return_value = {"project": None}
+    mock_graphql_class.return_value = mock_graphql
+
+    connector = GitlabConnector(logger=mock_logger)
+
+    mock_gitlab_class.assert_not_called()
+    mock_graphql_class.assert_not_called()
+
+    connector.graphql_get_project("mygroup/myproject")
+
+    mock_gitlab_class.assert_not_called()
+    mock_gitlab_client.auth.assert_not_called()
+    mock_graphql_class.assert_called_once()
+
+    connector.get_project_by_id(123)
+    connector.get_group_by_id(456)
+
+    mock_gitlab_class.assert_called_once()
+    mock_gitlab_client.auth.assert_not_called()
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_lazy_auth_fail_on_first_response(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, mock_graphql):
+    mock_config_class.return_value = mock_config
+    mock_graphql.execute.side_effect = gitlab.exceptions.GitlabAuthenticationError("401 Unauthorized")
+    mock_graphql_class.return_value = mock_graphql
+
+    connector = GitlabConnector(logger=mock_logger)
+
+    with pytest.raises(GitlabInstanceUnavailableException):
+        connector.graphql_get_group("mygroup")
+    mock_logger.error.assert_called_with("❌  Authorization Gitlab GRAPHQL failed. Please check your configuration.")
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+@pytest.mark.parametrize("error", [
+    gitlab.exceptions.GitlabAuthenticationError("401 Unauthorized"),
+    gitlab.exceptions.GitlabGetError("401 Unauthorized", response_code=401),
+])
+def test_lazy_auth_fail_on_first_rest_response(mock_config_class, mock_gitlab_class, mock_graphql_class, error, mock_logger, mock_config, mock_gitlab_client):
+    mock_config_class.return_value = mock_config
+    mock_gitlab_client.groups.get.side_effect = error
+    mock_gitlab_client.projects.get.side_effect = error
+    mock_gitlab_class.return_value = mock_gitlab_client
+
+    connector = GitlabConnector(logger=mock_logger)
+
+    for call in (
+        lambda: connector.get_group_by_id(1),
+        lambda: connector.get_project_by_id(1),
+        lambda: connector.get_group_badges("mygroup"),
+        lambda: connector.get_project_badges("mygroup/project"),
+        lambda: connector.get_project_mirrors("mygroup/project"),
+        lambda: connector.get_project_protected_tags("mygroup/project"),
+    ):
+        with pytest.raises(GitlabInstanceUnavailableException):
+            call()
+    mock_logger.error.assert_called_with("❌  Authorization Gitlab API failed. Please check your configuration.")
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_rest_errors_other_than_auth_are_not_mapped(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, mock_gitlab_client):
+    mock_config_class.return_value = mock_config
+    mock_gitlab_client.groups.get.side_effect = gitlab.exceptions.GitlabGetError("404 Not Found", response_code=404)
+    mock_gitlab_class.return_value = mock_gitlab_client
+
+    with pytest.raises(gitlab.exceptions.GitlabGetError):
+        GitlabConnector(logger=mock_logger).get_group_by_id(1)
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_configure_auth_enables_eager_check(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, mock_gitlab_client):
+    mock_config_class.return_value = mock_config
+    mock_gitlab_class.return_value = mock_gitlab_client
+
+    GitlabConnector.configure_auth(check_auth=True)
+    try:
+        GitlabConnector(logger=mock_logger)
+    finally:
+        GitlabConnector.configure_auth(check_auth=False)
+
+    mock_gitlab_client.auth.assert_called_once()
+    mock_graphql_class.assert_called_once()
@@ -0,0 +1,71 @@
+import httpx
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+
+from codebase_suite.connectors.Gitlab import GitlabConnector, HttpPool
+
+
+@pytest.fixture
+def mock_config(mock_config):
+    mock_config.http_pool_size = 4
+    mock_config.http_keepalive = 15
+    mock_config.http2 = False
+    mock_config.http_timeout = None
+    return mock_config
+
+
+def test_http_pool_settings(mock_config, mock_logger):
+    pool = HttpPool.__wrapped__(mock_config, mock_logger)
+
+    session = pool.session()
+    assert isinstance(session, requests.Session)
+    assert session.get_adapter("https://gitlab.example.com")._pool_maxsize == 4
+    assert session.headers['Accept-Encoding'] == 'gzip, deflate'
+
+    client = pool.client()
+    assert isinstance(client, httpx.Client)
+    assert client.headers['Authorization'] == "Bearer secret-token"
+    assert client.headers['Accept-Encoding'] == 'gzip, deflate'
+
+    # tak jak gitlab.GraphQL bez własnego klienta - brak limitu czasu
+    assert client.timeout == httpx.Timeout(None)
+
+    pool.close()
+    assert client.is_closed
+
+
+def test_http_pool_timeout(mock_config, mock_logger):
+    mock_config.http_timeout = 120
+
+    client = HttpPool.__wrapped__(mock_config, mock_logger).client()
+
+    assert client.timeout == httpx.Timeout(120.0)
+
+
+@patch("codebase_suite.connectors.Gitlab.HttpPool.importlib.util.find_spec", return_value=None)
+def test_http_pool_http2_without_h2_falls_back(mock_find_spec, mock_config, mock_logger):
+    mock_config.http2 = True
+
+    HttpPool.__wrapped__(mock_config, mock_logger)
+
+    mock_logger.warning.assert_called_once()
+    mock_logger.trace.assert_any_call("  Set http2: False")
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_connectors_share_http_pool(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config):
+    mock_config_class.return_value = mock_config
+
+    GitlabConnector(logger=mock_logger, check_auth=True)
+    GitlabConnector(logger=mock_logger, check_auth=True)
+
+    first, second = mock_gitlab_class.call_args_list
+    assert first.kwargs['session'] is second.kwargs['session']
+    assert first.kwargs['session'] is HttpPool(mock_config).session()
+
+    first, second = mock_graphql_class.call_args_list
+    assert first.kwargs['client'] is second.kwargs['client']
+    assert first.kwargs['client'] is HttpPool(mock_config).client()
@@ -0,0 +1,135 @@
+import pytest
+from unittest.mock import patch, MagicMock
+
+from codebase_suite.connectors.Gitlab import GitlabConnector
+
+
+@pytest.fixture
+def execute(make_group, make_project, make_connection):
+    def execute(query, variables):
+        if "descendantGroups" in query:
+            nodes = {
+                "root": [make_group("root/a", 2), make_group("root/b", 3)],
+            }.get(variables['fullPath'], [])
+            return {"group": {"descendantGroups": make_connection(nodes)}}
+        if "projects(" in query:
+            nodes = {
+                "root": [make_project("root/p", 10)],
+                "root/a": [make_project("root/a/p", 11)],
+                "root/b": [],
+            }[variables['fullPath']]
+            return {"group": {"projects": make_connection(nodes)}}
+        return {"group": make_group(variables['fullPath'], 1)}
+    return execute
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_index_populated_from_bulk_results(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, execute):
+    mock_config_class.return_value = mock_config
+    mock_graphql_class.return_value.execute.side_effect = execute
+    rest = mock_gitlab_class.return_value
+
+    connector = GitlabConnector(logger=mock_logger)
+    connector.graphql_get_descendantGroups("root")
+    connector.graphql_get_group_projects("root")
+
+    assert connector.get_group_full_path(2) == "root/a"
+    assert connector.get_group_full_path("3") == "root/b"
+    assert connector.get_project_full_path(11) == "root/a/p"
+    assert connector.get_group_id("root/a") == "2"
+    assert connector.get_project_id("root/p") == "10"
+    assert connector.get_project_id("root/unknown") is None
+    rest.groups.get.assert_not_called()
+    rest.projects.get.assert_not_called()
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_index_miss_falls_back_to_rest_once(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, execute):
+    mock_config_class.return_value = mock_config
+    graphql_mock = mock_graphql_class.return_value
+    graphql_mock.execute.side_effect = execute
+    rest = mock_gitlab_class.return_value
+    rest.projects.get.return_value = MagicMock(path_with_namespace="root/a/p")
+
+    connector = GitlabConnector(logger=mock_logger)
+
+    assert connector.get_project_full_path(11) == "root/a/p"
+    rest.projects.get.assert_called_once_with(id="11")
+    graphql_mock.execute.assert_not_called()
+
+    # kolejne odwołanie korzysta z indeksu
+    assert connector.get_project_full_path("11") == "root/a/p"
+    assert rest.projects.get.call_count == 1
+    assert connector.get_project_id("root/a/p") == "11"
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_index_namespace_covers_only_subtree(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, execute):
+    mock_config_class.return_value = mock_config
+    graphql_mock = mock_graphql_class.return_value
+    graphql_mock.execute.side_effect = execute
+
+    connector = GitlabConnector(logger=mock_logger)
+    connector.graphql_index_namespace("root/a")
+
+    queried = {call.args[1]['fullPath'] for call in graphql_mock.execute.call_args_list}
+    assert queried == {"root/a"}
+    assert connector.get_project_id("root/a/p") == "11"
+    assert connector.get_project_id("root/p") is None
+
+    # poddrzewo już zindeksowanej grupy nie jest pobierane ponownie
+    requests = graphql_mock.execute.call_count
+    connector.graphql_index_namespace("root/a")
+    connector.graphql_index_namespace("root/a/nested")
+    assert graphql_mock.execute.call_count == requests
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_invalidate_cache_clears_index(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, execute):
+    mock_config_class.return_value = mock_config
+    graphql_mock = mock_graphql_class.return_value
+    graphql_mock.execute.side_effect = execute
+    rest = mock_gitlab_class.return_value
+
+    connector = GitlabConnector(logger=mock_logger)
+    connector.graphql_index_namespace("root")
+    connector.get_project_badges("root/a/p")
+    connector.get_group_badges("root/b")
+
+    connector.invalidate_cache("root/a")
+
+    assert connector.get_project_id("root/a/p") is None
+    assert connector.get_group_id("root/a") is None
+    assert connector.get_group_id("root/b") == "3"
+    assert connector.get_project_id("root/p") == "10"
+
+    connector.get_project_badges("root/a/p")
+    connector.get_group_badges("root/b")
+    assert rest.projects.get.call_count == 2
+    assert rest.groups.get.call_count == 1
+
+    # po unieważnieniu poddrzewo może zostać ponownie zindeksowane
+    requests = graphql_mock.execute.call_count
+    connector.invalidate_cache("root")
+    connector.graphql_index_namespace("root")
+    assert graphql_mock.execute.call_count > requests
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_full_path_is_passed_through(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config):
+    mock_config_class.return_value = mock_config
+
+    connector = GitlabConnector(logger=mock_logger)
+
+    assert connector.get_group_full_path("root/a") == "root/a"
+    mock_gitlab_class.assert_not_called()
@@ -0,0 +1,112 @@
+import pytest
+from unittest.mock import patch, MagicMock
+
+from codebase_suite.connectors.Gitlab import GitlabConnector
+
+
+@pytest.fixture
+def mock_config(mock_config, tmp_path):
+    mock_config.cache_enabled = True
+    mock_config.cache_dir = tmp_path / "cache"
+    mock_config.cache_ttl = 3600
+    mock_config.cache_secrets = False
+    return mock_config
+
+
+@pytest.fixture
+def graphql_mock(mock_config):
+    with patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config") as mock_config_class, \
+         patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab"), \
+         patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL") as mock_graphql_class:
+        mock_config_class.return_value = mock_config
+        graphql = MagicMock()
+        mock_graphql_class.return_value = graphql
+        yield graphql
+
+
+def new_run(mock_logger) -> GitlabConnector:
+    """Symuluje nowe uruchomienie aplikacji - pusty cache w pamięci, ten sam trwały cache."""
+    GitlabConnector._GitlabConnector__tree.clear()
+    return GitlabConnector(logger=mock_logger)
+
+
+def active(project: dict, last_activity_at: str) -> dict:
+    project["lastActivityAt"] = last_activity_at
+    return project
+
+
+def test_changed_projects_stop_at_watermark(graphql_mock, mock_logger, make_project, make_connection):
+    pages = {
+        None: make_connection([
+            active(make_project("root/a/p1", 1), "2024-03-01T00:00:00Z"),
+            active(make_project("root/p2", 2), "2024-02-01T00:00:00Z"),
+        ], "c1"),
+        "c1": make_connection([active(make_project("root/p3", 3), "2024-01-01T00:00:00Z")]),
+    }
+    graphql_mock.execute.side_effect = lambda query, variables: {"group": {"projects": pages[variables['after']]}}
+
+    GitlabConnector.configure_cache(enabled=True)
+    first = GitlabConnector(logger=mock_logger).graphql_get_changed_projects("root")
+    assert [project["fullPath"] for project in first] == ["root/a/p1", "root/p2", "root/p3"]
+    assert "ACTIVITY_DESC" in graphql_mock.execute.call_args.args[0]
+
+    pages[None] = make_connection([
+        active(make_project("root/p4", 4), "2024-04-01T00:00:00Z"),
+        active(make_project("root/a/p1", 1), "2024-03-01T00:00:00Z"),
+    ], "c1")
+    graphql_mock.execute.reset_mock()
+    connector = new_run(mock_logger)
+
+    changed = connector.graphql_get_changed_projects("root")
+
+    assert [project["fullPath"] for project in changed] == ["root/p4"]
+    assert graphql_mock.execute.call_count == 1
+
+    # lista projektów grupy w cache zawiera nowe i wcześniej pobrane projekty
+    projects = connector.graphql_get_group_projects("root")
+    assert sorted(project["fullPath"] for project in projects) == ["root/a/p1", "root/p2", "root/p3", "root/p4"]
+    assert graphql_mock.execute.call_count == 1
+
+    graphql_mock.execute.reset_mock()
+    assert new_run(mock_logger).graphql_get_changed_projects("root") == []
+
+
+def test_changed_projects_without_persistent_cache(graphql_mock, mock_logger, make_project, make_connection):
+    graphql_mock.execute.return_value = {"group": {"projects": make_connection([active(make_project("root/p1", 1), None)])}}
+
+    changed = GitlabConnector(logger=mock_logger).graphql_get_changed_projects("root")
+
+    assert [project["fullPath"] for project in changed] == ["root/p1"]
+    mock_logger.warning.assert_called_once()
+
+
+def test_changed_groups_compares_with_persistent_cache(graphql_mock, mock_logger, make_group, make_variable, make_connection):
+    groups = {
+        "root": make_group("root", 1),
+        "root/a": make_group("root/a", 2, variables=[make_variable(5, "KEY", "secret")]),
+        "root/b": make_group("root/b", 3),
+    }
+
+    def execute(query, variables):
+        if "descendantGroups" in query:
+            return {"group": {"descendantGroups": make_connection([dict(groups["root/a"]), dict(groups["root/b"])])}}
+        return {"group": dict(groups[variables['fullPath']])}
+
+    graphql_mock.execute.side_effect = execute
+    GitlabConnector.configure_cache(enabled=True)
+
+    first = GitlabConnector(logger=mock_logger).graphql_get_changed_groups("root")
+    assert [group["fullPath"] for group in first] == ["root", "root/a", "root/b"]
+
+    # wartości zmiennych nie są zapisywane w cache - niezmieniona grupa ze zmiennymi nie jest zgłaszana
+    groups["root/a"] = make_group("root/a", 2, variables=[make_variable(5, "KEY", "secret")])
+    groups["root/b"] = make_group("root/b", 3, labels=[{"id": "gid://gitlab/GroupLabel/9", "color": "#fff", "description": "", "title": "bug"}])
+    changed = new_run(mock_logger).graphql_get_changed_groups("root")
+
+    assert [group["fullPath"] for group in changed] == ["root/b"]
+
+
+def test_changed_groups_missing_group(graphql_mock, mock_logger):
+    graphql_mock.execute.return_value = {"group": None}
+
+    assert GitlabConnector(logger=mock_logger).graphql_get_changed_groups("missing") == []
@@ -0,0 +1,90 @@
+import pytest
+from unittest.mock import patch, MagicMock
+
+from codebase_suite.connectors.Gitlab import GitlabConnector
+
+
+@pytest.fixture
+def graphql_mock(mock_config):
+    with patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config") as mock_config_class, \
+         patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab"), \
+         patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL") as mock_graphql_class:
+        mock_config_class.return_value = mock_config
+        graphql = MagicMock()
+        mock_graphql_class.return_value = graphql
+        yield graphql
+
+
+def paged(connection, pages, make_connection):
+    """Zwraca funkcję execute odpowiadającą kolejnymi stronami połączenia (cursor c1, c2, ...)."""
+    def execute(query, variables):
+        index = 0 if variables['after'] is None else int(variables['after'][1:])
+        cursor = f"c{index + 1}" if index + 1 < len(pages) else None
+        return {"group": {connection: make_connection(pages[index], cursor)}}
+    return execute
+
+
+def test_iter_descendant_groups_yields_page_by_page(graphql_mock, mock_logger, make_group, make_connection):
+    graphql_mock.execute.side_effect = paged("descendantGroups", [
+        [make_group("root/a", 1), make_group("root/b", 2)],
+        [make_group("root/a/nested", 3)],
+    ], make_connection)
+
+    connector = GitlabConnector(logger=mock_logger)
+    groups = connector.iter_descendant_groups("root")
+
+    first = next(groups)
+    assert first["fullPath"] == "root/a"
+    assert first["id"] == "1"
+
+    rest = [group["fullPath"] for group in groups]
+    assert rest == ["root/b", "root/a/nested"]
+    assert graphql_mock.execute.call_count == 2
+    assert connector.get_group_id("root/a/nested") == "3"
+
+
+def test_iter_descendant_groups_uses_known_tree(graphql_mock, mock_logger, make_group, make_connection):
+    graphql_mock.execute.side_effect = paged("descendantGroups", [[make_group("root/a", 1)]], make_connection)
+
+    connector = GitlabConnector(logger=mock_logger)
+    assert [group["fullPath"] for group in connector.iter_descendant_groups("root")] == ["root/a"]
+    assert [group["fullPath"] for group in connector.iter_descendant_groups("root")] == ["root/a"]
+    assert graphql_mock.execute.call_count == 1
+
+
+def test_iter_descendant_groups_abandoned_does_not_mark_tree_complete(graphql_mock, mock_logger, make_group, make_connection):
+    graphql_mock.execute.side_effect = paged("descendantGroups", [
+        [make_group("root/a", 1)],
+        [make_group("root/b", 2)],
+    ], make_connection)
+
+    connector = GitlabConnector(logger=mock_logger)
+    groups = connector.iter_descendant_groups("root")
+    next(groups)
+    groups.close()
+
+    assert [group["fullPath"] for group in connector.iter_descendant_groups("root")] == ["root/a", "root/b"]
+
+
+def test_iter_group_projects_yields_all_pages(graphql_mock, mock_logger, make_project, make_connection):
+    graphql_mock.execute.side_effect = paged("projects", [
+        [make_project("root/p0", 10)],
+        [make_project("root/a/p1", 11)],
+        [make_project("root/b/p2", 12)],
+    ], make_connection)
+
+    connector = GitlabConnector(logger=mock_logger)
+    projects = list(connector.iter_group_projects("root"))
+
+    assert [project["fullPath"] for project in projects] == ["root/p0", "root/a/p1", "root/b/p2"]
+    assert [project["id"] for project in projects] == ["10", "11", "12"]
+    assert [call.args[1]["after"] for call in graphql_mock.execute.call_args_list] == [None, "c1", "c2"]
+    assert connector.graphql_get_project("root/a/p1")["id"] == "11"
+
+
+def test_iter_group_projects_missing_group(graphql_mock, mock_logger):
+    graphql_mock.execute.return_value = {"group": None}
+
+    connector = GitlabConnector(logger=mock_logger)
+
+    assert list(connector.iter_group_projects("missing")) == []
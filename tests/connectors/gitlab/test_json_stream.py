@@ -0,0 +1,111 @@
+import json
+
+import httpx
+import pytest
+from gql.transport.exceptions import TransportQueryError
+from unittest.mock import patch, MagicMock
+
+from codebase_suite.connectors.Gitlab import GitlabConnector, ProjectRecord
+from codebase_suite.connectors.Gitlab.Exceptions import GitlabInstanceUnavailableException
+from codebase_suite.connectors.Gitlab.Stream import JsonStream
+
+
+PATH = ('data', 'group', 'projects', 'nodes')
+
+
+def chunked(text: str, size: int) -> list:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 64, 100000])
+def test_json_stream_yields_nodes_across_chunks(size, make_project, make_connection):
+    nodes = [make_project(f"root/p{i}", i) for i in range(5)]
+    nodes[2]["description"] = 'quote " and brackets }]{[ \\ é'
+    document = {"data": {"group": {"projects": make_connection(nodes, "c1")}}}
+    stream = JsonStream(chunked(json.dumps(document, indent=2, ensure_ascii=False), size), PATH)
+
+    assert list(stream) == nodes
+    assert stream.document() == {"data": {"group": {"projects": make_connection([], "c1")}}}
+
+
+def test_json_stream_yields_nodes_before_document_is_read(make_project):
+    head = '{"data": {"group": {"projects": {"nodes": [' + json.dumps(make_project("root/p1", 1)) + ','
+
+    def chunks():
+        yield head
+        raise AssertionError("read past the first node")
+
+    assert next(iter(JsonStream(chunks(), PATH)))["fullPath"] == "root/p1"
+
+
+def test_json_stream_scalars_and_missing_path():
+    stream = JsonStream(['{"a": [1, "x", [2], null], "b": {"c": 3}}'], ('a',))
+    assert list(stream) == [1, "x", [2], None]
+    assert stream.document() == {"a": [], "b": {"c": 3}}
+
+    stream = JsonStream(['{"data": {"group": null}}'], PATH)
+    assert list(stream) == []
+    assert stream.document() == {"data": {"group": None}}
+
+
+def test_json_stream_truncated_document():
+    with pytest.raises(ValueError, match="Unexpected end of JSON stream"):
+        list(JsonStream(['{"data": {"group": {"projects": {"nodes": [{"id": 1'], PATH))
+
+
+@pytest.fixture
+def http_mock(mock_config):
+    responses = []
+    requests = []
+
+    def handler(request):
+        requests.append(json.loads(request.content))
+        status, body = responses.pop(0)
+        return httpx.Response(status, content=chunked(json.dumps(body).encode(), 16))
+
+    pool = MagicMock()
+    pool.client.return_value = httpx.Client(transport=httpx.MockTransport(handler))
+    with patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config") as mock_config_class, \
+         patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab"), \
+         patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL") as mock_graphql_class, \
+         patch("codebase_suite.connectors.Gitlab.GitlabConnector.HttpPool", return_value=pool):
+        mock_config_class.return_value = mock_config
+        GitlabConnector.configure_requests(retries=0, stream=True)
+        yield responses, requests, mock_graphql_class.return_value
+
+
+def test_streamed_group_projects(http_mock, mock_logger, make_project, make_connection):
+    responses, requests, graphql = http_mock
+    responses.append((200, {"data": {"group": {"projects": make_connection([make_project("root/p1", 1)], "c1")}}}))
+    responses.append((200, {"data": {"group": {"projects": make_connection([make_project("root/p2", 2)])}}}))
+
+    projects = GitlabConnector(logger=mock_logger).graphql_get_group_projects("root")
+
+    assert [project["fullPath"] for project in projects] == ["root/p1", "root/p2"]
+    assert all(isinstance(project, ProjectRecord) for project in projects)
+    assert projects[0]["id"] == "1"
+    assert [request["variables"]["after"] for request in requests] == [None, "c1"]
+    graphql.execute.assert_not_called()
+
+
+def test_streamed_page_completes_nested_connections(http_mock, mock_logger, make_project, make_connection, make_variable):
+    responses, requests, graphql = http_mock
+    project = make_project("root/p1", 1)
+    project["ciVariables"] = make_connection([make_variable(5, "A", kind="Ci::Variable")], "v1")
+    responses.append((200, {"data": {"group": {"projects": make_connection([project])}}}))
+    graphql.execute.return_value = {"page0": {"ciVariables": make_connection([make_variable(6, "B", kind="Ci::Variable")])}}
+
+    projects = list(GitlabConnector(logger=mock_logger).iter_group_projects("root"))
+
+    assert [variable["key"] for variable in projects[0]["ciVariables"]] == ["A", "B"]
+
+
+def test_streamed_page_errors(http_mock, mock_logger):
+    responses, requests, graphql = http_mock
+    responses.append((200, {"errors": [{"message": "boom"}], "data": None}))
+    with pytest.raises(TransportQueryError, match="boom"):
+        GitlabConnector(logger=mock_logger).graphql_get_group_projects("root")
+
+    responses.append((401, {"message": "401 Unauthorized"}))
+    with pytest.raises(GitlabInstanceUnavailableException):
+        GitlabConnector(logger=mock_logger).graphql_get_group_projects("other")
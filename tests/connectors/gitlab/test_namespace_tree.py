@@ -0,0 +1,95 @@
+from codebase_suite.connectors.Gitlab import NamespaceTree
+
+
+def build_tree():
+    tree = NamespaceTree()
+    tree.set('group', 'root', {"fullPath": "root"})
+    tree.set('group', 'root/app', {"fullPath": "root/app"})
+    tree.set('group', 'root/app-legacy', {"fullPath": "root/app-legacy"})
+    tree.set('group', 'root/app/nested', {"fullPath": "root/app/nested"})
+    tree.set('project', 'root/p0', {"fullPath": "root/p0"})
+    tree.set('project', 'root/app/p1', {"fullPath": "root/app/p1"})
+    tree.set('project', 'root/app/nested/p2', {"fullPath": "root/app/nested/p2"})
+    tree.set('project', 'root/app-legacy/p3', {"fullPath": "root/app-legacy/p3"})
+    return tree
+
+
+def test_get_and_set():
+    tree = build_tree()
+
+    assert tree.get('group', 'root/app') == {"fullPath": "root/app"}
+    assert tree.get('project', 'root/app/p1') == {"fullPath": "root/app/p1"}
+    assert tree.get('group', 'root/missing') is None
+    assert tree.get('project', 'root/missing/p') is None
+    assert tree.get('project', 'root') is None
+
+
+def test_subtree_does_not_match_sibling_with_common_prefix():
+    tree = build_tree()
+
+    assert [g["fullPath"] for g in tree.descendant_groups('root/app')] == ["root/app/nested"]
+    assert [p["fullPath"] for p in tree.projects('root/app')] == ["root/app/p1", "root/app/nested/p2"]
+    assert [p["fullPath"] for p in tree.projects('root')] == [
+        "root/p0", "root/app/p1", "root/app/nested/p2", "root/app-legacy/p3"
+    ]
+    assert tree.projects('unknown') == []
+
+
+def test_children_known_only_when_complete():
+    tree = build_tree()
+
+    assert tree.children('root') is None
+    assert tree.children('unknown') is None
+
+    tree.set_complete('root')
+    assert tree.children('root') == ["root/app", "root/app-legacy"]
+
+
+def test_ancestors():
+    tree = build_tree()
+
+    assert tree.ancestors('root/app/nested/p2') == ["root", "root/app", "root/app/nested"]
+    assert tree.ancestors('other/group/project') == ["other", "other/group"]
+    assert tree.ancestors('root') == []
+
+
+def test_ancestors_does_not_create_nodes():
+    tree = NamespaceTree()
+    tree.set_complete('root')
+
+    assert tree.ancestors('user/namespace/project') == ["user", "user/namespace"]
+    assert tree.ancestors('root/missing/project') == ["root", "root/missing"]
+    assert tree.get('group', 'user') is None
+    tree.remove('user')
+    assert tree.children('root') == []
+
+
+def test_remove_marks_ancestors_incomplete():
+    tree = build_tree()
+    tree.set_complete('root')
+    tree.set_complete('root/app')
+
+    tree.remove('root/app/nested')
+
+    assert tree.children('root') is None
+    assert tree.children('root/app') is None
+
+
+def test_remove_subtree_and_project():
+    tree = build_tree()
+
+    tree.remove('root/app')
+    assert tree.get('group', 'root/app') is None
+    assert tree.get('group', 'root/app/nested') is None
+    assert tree.get('project', 'root/app/nested/p2') is None
+    assert tree.get('group', 'root/app-legacy') is not None
+
+    tree.remove('root/p0')
+    assert tree.get('project', 'root/p0') is None
+    assert [p["fullPath"] for p in tree.projects('root')] == ["root/app-legacy/p3"]
+
+    tree.remove('root')
+    assert tree.get('group', 'root') is None
+
+    tree.clear()
+    assert tree.get('group', 'root/app-legacy') is None
@@ -0,0 +1,87 @@
+import pytest
+from unittest.mock import patch, MagicMock
+
+from codebase_suite.connectors.Gitlab import GitlabConnector
+
+
+def label(title, gid):
+    return {"id": f"gid://gitlab/ProjectLabel/{gid}", "color": "#fff", "description": "", "title": title}
+
+def branch_rule(name, gid):
+    return {"id": f"gid://gitlab/Projects::BranchRule/{gid}", "name": name, "isDefault": False, "branchProtection": None}
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_remaining_nested_pages_are_merged(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, make_connection, make_variable):
+    mock_config_class.return_value = mock_config
+    graphql_mock = MagicMock()
+    mock_graphql_class.return_value = graphql_mock
+
+    def execute(query, variables):
+        if "page0" not in query:
+            return {"project": {
+                "id": "gid://gitlab/Project/1",
+                "fullPath": "root/p",
+                "branchRules": make_connection([branch_rule("main", 1)], "b1"),
+                "ciVariables": make_connection([make_variable(1, "A", kind="Ci::Variable")], "v1"),
+                "labels": make_connection([label("bug", 1)]),
+            }}
+        pages = {}
+        for i in range(2):
+            if f"after{i}" not in variables:
+                break
+            cursor = variables[f"after{i}"]
+            if cursor == "v1":
+                pages[f"page{i}"] = {"ciVariables": make_connection([make_variable(2, "B", kind="Ci::Variable")], "v2")}
+            elif cursor == "v2":
+                pages[f"page{i}"] = {"ciVariables": make_connection([make_variable(3, "C", kind="Ci::Variable")])}
+            elif cursor == "b1":
+                pages[f"page{i}"] = {"branchRules": make_connection([branch_rule("develop", 2)])}
+        return pages
+
+    graphql_mock.execute.side_effect = execute
+
+    connector = GitlabConnector(logger=mock_logger)
+    project = connector.graphql_get_project("root/p")
+
+    assert [v["key"] for v in project["ciVariables"]] == ["A", "B", "C"]
+    assert [v["id"] for v in project["ciVariables"]] == ["1", "2", "3"]
+    assert [r["name"] for r in project["branchRules"]] == ["main", "develop"]
+    assert [l["title"] for l in project["labels"]] == ["bug"]
+
+    # zapytanie o projekt + jedna paczka (ciVariables i branchRules) + druga strona ciVariables
+    assert graphql_mock.execute.call_count == 3
+    batch_query, batch_variables = graphql_mock.execute.call_args_list[1].args
+    assert "branchRules(first: 100, after: $after0)" in batch_query
+    assert "ciVariables(first: 100, after: $after1)" in batch_query
+    assert batch_variables == {"path0": "root/p", "after0": "b1", "path1": "root/p", "after1": "v1"}
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_nested_page_of_missing_object_stops_pagination(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, make_connection):
+    mock_config_class.return_value = mock_config
+    graphql_mock = MagicMock()
+    mock_graphql_class.return_value = graphql_mock
+
+    def execute(query, variables):
+        if "page0" in query:
+            return {"page0": None}
+        return {"group": {
+            "id": "gid://gitlab/Group/1",
+            "fullPath": "root",
+            "labels": make_connection([label("bug", 1)], "l1"),
+            "ciVariables": make_connection([]),
+        }}
+
+    graphql_mock.execute.side_effect = execute
+
+    connector = GitlabConnector(logger=mock_logger)
+    group = connector.graphql_get_group("root")
+
+    assert [l["title"] for l in group["labels"]] == ["bug"]
+    assert graphql_mock.execute.call_count == 2
+    mock_logger.warning.assert_called_once_with("⛔  group root not found while fetching labels")
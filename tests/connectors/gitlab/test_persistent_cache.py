@@ -0,0 +1,210 @@
+import os
+import sqlite3
+import stat
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from codebase_suite.connectors.Gitlab import GitlabCache, GitlabConnector
+
+
+@pytest.fixture
+def mock_config(mock_config, tmp_path):
+    mock_config.cache_enabled = True
+    mock_config.cache_dir = tmp_path / "cache"
+    mock_config.cache_ttl = 3600
+    mock_config.cache_secrets = False
+    return mock_config
+
+
+def test_cache_set_get_and_ttl(tmp_path, mock_logger):
+    store = GitlabCache(tmp_path, 60, mock_logger)
+    store.set("group", "root", {"id": "1"})
+
+    assert store.get("group", "root") == {"id": "1"}
+    assert store.get("project", "root") is None
+
+    with patch("codebase_suite.connectors.Gitlab.Cache.time.time", return_value=10**10):
+        assert store.get("group", "root") is None
+
+
+def test_cache_invalidate_respects_path_boundaries(tmp_path, mock_logger):
+    store = GitlabCache(tmp_path, 60, mock_logger)
+    store.set("group", "root/app", {})
+    store.set("project", "root/app/project", {})
+    store.set("group", "root/app-legacy", {})
+    store.set("group", "root", {})
+
+    assert store.invalidate("root/app/") == 2
+    assert store.get("group", "root/app-legacy") == {}
+    assert store.get("group", "root") == {}
+    assert store.clear() == 2
+
+
+def test_cache_files_are_private(tmp_path, mock_logger):
+    GitlabCache(tmp_path / "cache", 60, mock_logger)
+
+    assert stat.S_IMODE(os.stat(tmp_path / "cache").st_mode) == 0o700
+    assert stat.S_IMODE(os.stat(tmp_path / "cache" / GitlabCache.FILENAME).st_mode) == 0o600
+
+
+def test_cache_entries_are_scoped_to_instance(tmp_path, mock_logger):
+    first = GitlabCache(tmp_path, 60, mock_logger, GitlabCache.fingerprint("https://gitlab.example.com/", "token-a"))
+    same = GitlabCache(tmp_path, 60, mock_logger, GitlabCache.fingerprint("https://gitlab.example.com", "token-a"))
+    other_token = GitlabCache(tmp_path, 60, mock_logger, GitlabCache.fingerprint("https://gitlab.example.com", "token-b"))
+    first.set("group", "root", {"id": "1"})
+
+    assert same.get("group", "root") == {"id": "1"}
+    assert other_token.get("group", "root") is None
+    assert other_token.invalidate("root") == 0
+    assert other_token.clear() == 0
+    assert first.get("group", "root") == {"id": "1"}
+
+
+def test_cache_drops_entries_of_old_schema(tmp_path, mock_logger):
+    connection = sqlite3.connect(tmp_path / GitlabCache.FILENAME)
+    connection.execute("CREATE TABLE entries (entity TEXT, full_path TEXT, payload TEXT, updated_at REAL)")
+    connection.execute("INSERT INTO entries VALUES ('group', 'root', '{}', 0)")
+    connection.commit()
+    connection.close()
+
+    store = GitlabCache(tmp_path, 60, mock_logger)
+    store.set("group", "root", {"id": "1"})
+    assert store.get("group", "root") == {"id": "1"}
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_connector_reads_persistent_cache(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, make_group):
+    mock_config_class.return_value = mock_config
+    graphql_mock = MagicMock()
+    graphql_mock.execute.side_effect = lambda query, variables: {"group": make_group("root", 1)}
+    mock_graphql_class.return_value = graphql_mock
+
+    GitlabConnector.configure_cache(enabled=True)
+    GitlabConnector(logger=mock_logger).graphql_get_group("root")
+
+    # nowe uruchomienie aplikacji - pusty cache w pamięci
+    GitlabConnector._GitlabConnector__tree.clear()
+    group = GitlabConnector(logger=mock_logger).graphql_get_group("root")
+
+    assert group["id"] == "1"
+    assert graphql_mock.execute.call_count == 1
+
+    # --refresh pomija odczyt z trwałego cache
+    GitlabConnector.configure_cache(enabled=True, refresh=True)
+    GitlabConnector._GitlabConnector__tree.clear()
+    GitlabConnector(logger=mock_logger).graphql_get_group("root")
+    assert graphql_mock.execute.call_count == 2
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_connector_reads_cached_listing_and_invalidates(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, make_group):
+    mock_config_class.return_value = mock_config
+    graphql_mock = MagicMock()
+    graphql_mock.execute.side_effect = lambda query, variables: {
+        "group": {
+            "descendantGroups": {
+                "nodes": [make_group("root/a", 2), make_group("root/b", 3)],
+                "pageInfo": {"endCursor": None, "hasNextPage": False},
+            }
+        }
+    }
+    mock_graphql_class.return_value = graphql_mock
+
+    GitlabConnector.configure_cache(enabled=True)
+    GitlabConnector(logger=mock_logger).graphql_get_descendantGroups("root")
+
+    GitlabConnector._GitlabConnector__tree.clear()
+    connector = GitlabConnector(logger=mock_logger)
+    groups = connector.graphql_get_descendantGroups("root")
+
+    assert sorted(g["fullPath"] for g in groups) == ["root/a", "root/b"]
+    assert graphql_mock.execute.call_count == 1
+
+    # grupa root/a oraz lista grup root jest nieaktualna po unieważnieniu
+    assert connector.invalidate_cache("root/a") == 1
+    assert GitlabConnector._GitlabConnector__tree.get("group", "root/a") is None
+    connector.invalidate_cache("root")
+    connector.graphql_get_descendantGroups("root")
+    assert graphql_mock.execute.call_count == 2
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_connector_without_persistent_cache(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config):
+    mock_config_class.return_value = mock_config
+    mock_graphql_class.return_value = MagicMock()
+
+    GitlabConnector.configure_cache(enabled=False)
+    connector = GitlabConnector(logger=mock_logger)
+
+    assert GitlabConnector._GitlabConnector__store is None
+    assert connector.invalidate_cache("root") == 0
+    assert not mock_config.cache_dir.exists()
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_connector_refetches_listing_with_stale_member(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, make_project):
+    mock_config_class.return_value = mock_config
+    graphql_mock = MagicMock()
+    graphql_mock.execute.side_effect = lambda query, variables: {
+        "group": {
+            "projects": {
+                "nodes": [make_project("root/p", 7)],
+                "pageInfo": {"endCursor": None, "hasNextPage": False},
+            }
+        }
+    }
+    mock_graphql_class.return_value = graphql_mock
+
+    GitlabConnector.configure_cache(enabled=True)
+    GitlabConnector(logger=mock_logger).graphql_get_group_projects("root")
+
+    GitlabConnector._GitlabConnector__tree.clear()
+    connector = GitlabConnector(logger=mock_logger)
+    assert [p["id"] for p in connector.graphql_get_group_projects("root")] == ["7"]
+    assert graphql_mock.execute.call_count == 1
+
+    GitlabConnector._GitlabConnector__tree.clear()
+    GitlabConnector._GitlabConnector__store.invalidate("root/p")
+    connector.graphql_get_group_projects("root")
+    assert graphql_mock.execute.call_count == 2
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_connector_does_not_persist_variable_values(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config, make_group, make_variable):
+    mock_config_class.return_value = mock_config
+    graphql_mock = MagicMock()
+    graphql_mock.execute.side_effect = lambda query, variables: {"group": make_group(variables['fullPath'], 1, [make_variable(2, "TOKEN", "s3cr3t")])}
+    mock_graphql_class.return_value = graphql_mock
+
+    GitlabConnector.configure_cache(enabled=True)
+    assert GitlabConnector(logger=mock_logger).graphql_get_group("root")["ciVariables"][0]["value"] == "s3cr3t"
+
+    database = (mock_config.cache_dir / GitlabCache.FILENAME).read_bytes()
+    assert b"s3cr3t" not in database
+
+    # wpis bez wartości zmiennych nie jest używany - grupa pobierana jest ponownie
+    GitlabConnector._GitlabConnector__tree.clear()
+    group = GitlabConnector(logger=mock_logger).graphql_get_group("root")
+    assert group["ciVariables"][0]["value"] == "s3cr3t"
+    assert graphql_mock.execute.call_count == 2
+
+    # CODEBASE_CACHE_SECRETS=true - wartości zmiennych zapisywane są w cache
+    mock_config.cache_secrets = True
+    GitlabConnector.configure_cache(enabled=True)
+    GitlabConnector._GitlabConnector__tree.clear()
+    GitlabConnector(logger=mock_logger).graphql_get_group("root")
+    GitlabConnector._GitlabConnector__tree.clear()
+    group = GitlabConnector(logger=mock_logger).graphql_get_group("root")
+    assert group["ciVariables"][0]["value"] == "s3cr3t"
+    assert graphql_mock.execute.call_count == 3
@@ -0,0 +1,78 @@
+import gitlab
+import pytest
+from unittest.mock import patch, MagicMock
+
+from codebase_suite.connectors.Gitlab import GitlabConnector
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_rest_settings_are_memoized_per_owner(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config):
+    mock_config_class.return_value = mock_config
+    rest = mock_gitlab_class.return_value
+    rest.projects.get.return_value.badges.list.return_value = [MagicMock(attributes={"id": 1})]
+
+    connector = GitlabConnector(logger=mock_logger)
+    connector._GitlabConnector__cache_set('project', 'root/p', {"id": "10", "fullPath": "root/p"})
+
+    assert connector.get_project_badges("root/p") == [{"id": 1}]
+    # id projektu wskazuje na ten sam wpis co fullPath
+    assert connector.get_project_badges(10) == [{"id": 1}]
+    assert connector.get_project_badges("10") == [{"id": 1}]
+
+    rest.projects.get.assert_called_once_with("root/p", lazy=True)
+    rest.projects.get.return_value.badges.list.assert_called_once_with(all=True, per_page=100)
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_prefetch_rest_settings(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config):
+    mock_config_class.return_value = mock_config
+    rest = mock_gitlab_class.return_value
+
+    connector = GitlabConnector(logger=mock_logger)
+    connector.prefetch_rest_settings([
+        ("group_badges", "root"),
+        ("project_badges", "root/p0"),
+        ("project_badges", "root/p0"),
+        ("project_protected_tags", "root/p1"),
+        ("project_mirrors", "root/p2"),
+        ("unknown_setting", "root/p3"),
+    ])
+
+    assert rest.groups.get.call_count == 1
+    assert rest.projects.get.call_count == 3
+    rest.projects.get.return_value.badges.list.assert_called_once()
+    rest.projects.get.return_value.protectedtags.list.assert_called_once()
+    rest.projects.get.return_value.remote_mirrors.list.assert_called_once()
+
+    connector.get_group_badges("root")
+    connector.get_project_badges("root/p0")
+    connector.get_project_protected_tags("root/p1")
+    connector.get_project_mirrors("root/p2")
+
+    assert rest.groups.get.call_count == 1
+    assert rest.projects.get.call_count == 3
+    mock_logger.trace.assert_any_call("  Skip prefetch of unknown setting: unknown_setting")
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_prefetch_failure_is_not_fatal(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config):
+    mock_config_class.return_value = mock_config
+    rest = mock_gitlab_class.return_value
+    forbidden = gitlab.exceptions.GitlabListError("403 Forbidden", response_code=403)
+    rest.projects.get.return_value.remote_mirrors.list.side_effect = forbidden
+
+    connector = GitlabConnector(logger=mock_logger)
+    connector.prefetch_rest_settings([("project_mirrors", "root/p"), ("project_badges", "root/p")])
+
+    mock_logger.trace.assert_any_call("  Prefetch of project_mirrors for root/p failed: 403: 403 Forbidden")
+    assert connector.get_project_badges("root/p") == []
+
+    # błąd zgłaszany jest przy właściwym odczycie ustawienia
+    with pytest.raises(gitlab.exceptions.GitlabListError):
+        connector.get_project_mirrors("root/p")
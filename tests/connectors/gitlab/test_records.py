@@ -0,0 +1,83 @@
+from jinja2 import Environment
+
+from codebase_suite.connectors.Gitlab import BranchRule, CiVariable, GroupRecord, Label, ProjectRecord, parse_gid
+
+
+def test_parse_gid():
+    assert parse_gid("gid://gitlab/Group/1") == "1"
+    assert parse_gid("gid://gitlab/Ci::GroupVariable/25") == "25"
+    assert parse_gid("42") == "42"
+    assert parse_gid(None) is None
+
+
+def test_group_record_decoded_from_graphql(make_group, make_variable):
+    label = {"id": "gid://gitlab/GroupLabel/7", "color": "#fff", "description": "", "title": "bug"}
+    group = GroupRecord.decode(make_group("root/a", 2, variables=[make_variable(5, "KEY")], labels=[label]))
+
+    assert group["id"] == "2"
+    assert group.fullPath == "root/a"
+    assert isinstance(group["labels"][0], Label)
+    assert isinstance(group["ciVariables"][0], CiVariable)
+    assert group["ciVariables"][0]["id"] == "5"
+    assert group == {
+        **make_group("root/a", 2),
+        "id": "2",
+        "labels": [{**label, "id": "7"}],
+        "ciVariables": [{**make_variable(5, "KEY"), "id": "5"}],
+    }
+
+
+def test_record_round_trip_through_dict(make_project):
+    project = ProjectRecord.decode(make_project("root/p1", 11))
+    stored = project.to_dict()
+
+    assert type(stored) is dict
+    assert ProjectRecord.decode(stored) == project
+
+
+def test_record_is_dict_compatible():
+    variable = CiVariable(key="KEY", value="v")
+
+    assert variable.get("id") is None
+    assert "id" not in variable
+    assert dict(variable) == {"key": "KEY", "value": "v"}
+    assert len(variable) == 2
+
+    # pola spoza FIELDS przechowywane są w osobnym słowniku
+    variable["raw"] = True
+    assert variable["raw"] is True
+    assert list(variable) == ["key", "value", "raw"]
+
+    variable.update({"value": "w"})
+    del variable["raw"]
+    assert variable == {"key": "KEY", "value": "w"}
+
+
+def test_branch_rule_flattens_access_levels(make_project):
+    node = make_project("root/p1", 11)
+    node["branchRules"] = {"nodes": [{
+        "id": "gid://gitlab/Projects::BranchRule/3",
+        "name": "main",
+        "isDefault": True,
+        "branchProtection": {
+            "allowForcePush": False,
+            "pushAccessLevels": {"nodes": [{"accessLevel": 40}]},
+            "mergeAccessLevels": {"nodes": [{"accessLevel": 30}]},
+        },
+    }]}
+
+    rule = ProjectRecord.decode(node)["branchRules"][0]
+
+    assert isinstance(rule, BranchRule)
+    assert rule["id"] == "3"
+    assert rule["branchProtection"]["pushAccessLevels"] == [{"accessLevel": 40}]
+    assert rule["branchProtection"]["mergeAccessLevels"] == [{"accessLevel": 30}]
+
+
+def test_record_in_jinja_template(make_group, make_variable):
+    group = GroupRecord.decode(make_group("root", 1, variables=[make_variable(5, "A"), make_variable(6, "B")]))
+    template = Environment().from_string(
+        "{{ group.fullPath }}:{{ group['id'] }}:{{ group.ciVariables | map(attribute='key') | join(',') }}"
+    )
+
+    assert template.render(group=group) == "root:1:A,B"
@@ -0,0 +1,94 @@
+import threading
+import time
+
+import httpx
+import pytest
+import requests
+from unittest.mock import MagicMock
+
+from codebase_suite.connectors.Gitlab import HttpPool, RequestScheduler
+
+
+@pytest.fixture
+def scheduler(mock_logger):
+    return RequestScheduler(mock_logger)
+
+
+def elapsed(call) -> float:
+    start = time.monotonic()
+    call()
+    return time.monotonic() - start
+
+
+def test_scheduler_without_limit_does_not_wait(scheduler):
+    assert scheduler.rate() is None
+    assert elapsed(lambda: [scheduler.acquire() for _ in range(100)]) < 0.05
+
+
+def test_scheduler_rate_from_headers(scheduler):
+    scheduler.observe(200, {'RateLimit-Limit': '600', 'RateLimit-Remaining': '590'})
+
+    assert scheduler.rate() == 10
+    # kubełek mieści zapytania z jednej sekundy, kolejne czekają na nowy token
+    assert elapsed(lambda: [scheduler.acquire() for _ in range(10)]) < 0.05
+    assert elapsed(scheduler.acquire) >= 0.08
+
+
+def test_scheduler_remaining_limits_tokens(scheduler):
+    scheduler.observe(200, {'RateLimit-Limit': '600', 'RateLimit-Remaining': '0', 'RateLimit-Reset': str(time.time() + 0.2)})
+
+    assert elapsed(scheduler.acquire) >= 0.15
+
+
+def test_scheduler_pauses_on_retry_after(scheduler, mock_logger):
+    scheduler.observe(429, {'Retry-After': '0.2'})
+
+    assert elapsed(scheduler.acquire) >= 0.15
+    mock_logger.warning.assert_called_once()
+
+
+def test_scheduler_invalid_retry_after_defaults(scheduler):
+    scheduler.observe(429, {'Retry-After': 'soon', 'RateLimit-Limit': 'n/a'})
+
+    assert scheduler.rate() is None
+    assert elapsed(scheduler.acquire) >= 0.9
+
+
+def test_scheduler_serves_higher_priority_first(scheduler):
+    order = []
+    scheduler.observe(429, {'Retry-After': '0.3'})
+
+    def worker(priority):
+        scheduler.acquire(priority)
+        order.append(priority)
+
+    threads = []
+    for priority in (RequestScheduler.PRIORITY_SETTINGS, RequestScheduler.PRIORITY_PROJECT, RequestScheduler.PRIORITY_GROUP):
+        threads.append(threading.Thread(target=worker, args=(priority,)))
+        threads[-1].start()
+        time.sleep(0.05)
+    for thread in threads:
+        thread.join()
+
+    assert order == [RequestScheduler.PRIORITY_GROUP, RequestScheduler.PRIORITY_PROJECT, RequestScheduler.PRIORITY_SETTINGS]
+
+
+def test_http_pool_feeds_scheduler(mock_config, mock_logger):
+    mock_config.http_pool_size = 4
+    mock_config.http_keepalive = 15
+    mock_config.http2 = False
+    mock_config.http_timeout = None
+    pool = HttpPool.__wrapped__(mock_config, mock_logger)
+
+    response = requests.Response()
+    response.status_code = 200
+    response.headers['RateLimit-Limit'] = '120'
+    for hook in pool.session().hooks['response']:
+        hook(response)
+    assert pool.scheduler().rate() == 2
+
+    for hook in pool.client().event_hooks['response']:
+        hook(httpx.Response(200, headers={'ratelimit-limit': '300'}))
+    assert pool.scheduler().rate() == 5
+
+    pool.close()
@@ -0,0 +1,173 @@
+import threading
+import time
+
+import gitlab.exceptions
+import httpx
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+
+from codebase_suite.connectors.Gitlab import GitlabConnector, RetryPolicy
+from codebase_suite.connectors.Gitlab.Exceptions import GitlabDeadlineExceededException
+from codebase_suite.core import Profiler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def failing(errors, result="ok"):
+    """Zwraca funkcję zgłaszającą kolejno podane błędy, a następnie zwracającą wynik."""
+    errors = list(errors)
+
+    def call():
+        if errors:
+            raise errors.pop(0)
+        return result
+    return call
+
+
+def test_transient_errors():
+    assert RetryPolicy.transient(gitlab.exceptions.GitlabHttpError(response_code=502))
+    assert RetryPolicy.transient(gitlab.exceptions.GitlabListError(response_code=503))
+    assert RetryPolicy.transient(httpx.ReadTimeout("timeout"))
+    assert RetryPolicy.transient(requests.exceptions.ConnectionError())
+    assert not RetryPolicy.transient(gitlab.exceptions.GitlabHttpError(response_code=404))
+    assert not RetryPolicy.transient(gitlab.exceptions.GitlabAuthenticationError(response_code=401))
+    assert not RetryPolicy.transient(ValueError())
+
+
+def test_retry_with_jittered_backoff(mock_logger):
+    clock = FakeClock()
+    policy = RetryPolicy(retries=3, backoff=1, logger=mock_logger, clock=clock, sleep=clock.sleep)
+    errors = [gitlab.exceptions.GitlabHttpError(response_code=502), httpx.ConnectError("reset")]
+
+    with patch("codebase_suite.connectors.Gitlab.Retry.random.uniform", side_effect=lambda a, b: b) as uniform:
+        assert policy.call(failing(errors)) == "ok"
+
+    assert [call.args for call in uniform.call_args_list] == [(0, 1), (0, 2)]
+    assert clock.now == 3
+    assert mock_logger.warning.call_count == 2
+
+
+def test_retry_gives_up(mock_logger):
+    clock = FakeClock()
+    policy = RetryPolicy(retries=1, logger=mock_logger, clock=clock, sleep=clock.sleep)
+
+    with pytest.raises(gitlab.exceptions.GitlabHttpError):
+        policy.call(failing([gitlab.exceptions.GitlabHttpError(response_code=502)] * 2))
+
+    with pytest.raises(gitlab.exceptions.GitlabHttpError):
+        policy.call(failing([gitlab.exceptions.GitlabHttpError(response_code=404)]))
+    assert mock_logger.warning.call_count == 1
+
+
+def test_deadline(mock_logger):
+    clock = FakeClock()
+    policy = RetryPolicy(retries=5, backoff=10, deadline=4, logger=mock_logger, clock=clock, sleep=clock.sleep)
+
+    with patch("codebase_suite.connectors.Gitlab.Retry.random.uniform", side_effect=lambda a, b: b):
+        with pytest.raises(GitlabDeadlineExceededException):
+            policy.call(failing([gitlab.exceptions.GitlabHttpError(response_code=503)] * 5))
+
+    # oczekiwanie na ponowienie nie przekracza limitu czasu
+    assert clock.now == 4
+    mock_logger.error.assert_called_once()
+
+
+def test_hedge_straggling_request(mock_logger):
+    policy = RetryPolicy(hedge=True, logger=mock_logger)
+    for _ in range(RetryPolicy.HEDGE_MIN_SAMPLES):
+        policy.call(lambda: None)
+    assert policy.p95() < 0.05
+
+    calls = []
+    lock = threading.Lock()
+
+    def straggler():
+        with lock:
+            calls.append(len(calls))
+            first = len(calls) == 1
+        if first:
+            time.sleep(0.5)
+            return "slow"
+        return "fast"
+
+    start = time.monotonic()
+    assert policy.call(straggler) == "fast"
+    assert time.monotonic() - start < 0.4
+    assert len(calls) == 2
+
+
+def test_hedge_uses_other_response_on_error(mock_logger):
+    policy = RetryPolicy(retries=0, hedge=True, logger=mock_logger)
+    for _ in range(RetryPolicy.HEDGE_MIN_SAMPLES):
+        policy.call(lambda: None)
+
+    calls = []
+
+    def call():
+        calls.append(None)
+        if len(calls) == 1:
+            time.sleep(0.2)
+            raise ValueError("first")
+        time.sleep(0.3)
+        return "second"
+
+    assert policy.call(call) == "second"
+
+    with pytest.raises(ValueError):
+        policy.call(failing([ValueError("only")]))
+
+
+@patch("codebase_suite.connectors.Gitlab.Retry.random.uniform", return_value=0)
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_connector_retries_transient_errors(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_uniform, mock_logger, mock_config, make_group):
+    mock_config_class.return_value = mock_config
+    graphql_mock = MagicMock()
+    graphql_mock.execute.side_effect = [gitlab.exceptions.GitlabHttpError(response_code=502), {"group": make_group("root", 1)}]
+    mock_graphql_class.return_value = graphql_mock
+    client = mock_gitlab_class.return_value
+    client.groups.get.side_effect = [requests.exceptions.ReadTimeout(), MagicMock(full_path="root")]
+
+    connector = GitlabConnector(logger=mock_logger)
+
+    assert connector.graphql_get_group("root")["id"] == "1"
+    assert connector.get_group_by_id(1).full_path == "root"
+    assert graphql_mock.execute.call_count == 2
+    assert client.groups.get.call_count == 2
+
+
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab")
+@patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config")
+def test_connector_deadline(mock_config_class, mock_gitlab_class, mock_graphql_class, mock_logger, mock_config):
+    mock_config_class.return_value = mock_config
+
+    GitlabConnector.configure_requests(deadline=0)
+
+    with pytest.raises(GitlabDeadlineExceededException):
+        GitlabConnector(logger=mock_logger).graphql_get_group("root")
+    mock_graphql_class.return_value.execute.assert_not_called()
+
+
+def test_retries_are_counted_in_profile_span():
+    clock = FakeClock()
+    policy = RetryPolicy(retries=3, logger=MagicMock(), clock=clock, sleep=clock.sleep)
+    Profiler.configure(enabled=True)
+
+    with Profiler.span('gitlab.rest', 'root') as span:
+        result = policy.call(failing([gitlab.exceptions.GitlabHttpError(response_code=503)] * 2))
+    Profiler.configure()
+
+    assert result == "ok"
+    assert span.retries == 2
@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import pytest
+
+from codebase_suite.connectors.Gitlab.SingleFlight import SingleFlight
+
+
+def test_do_shares_one_call_between_threads():
+    flights = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def call():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {'fullPath': 'root'}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flights.do(('group', 'root'), call)))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(flights.do(('group', 'root'), call))) for _ in range(4)]
+    for thread in followers:
+        thread.start()
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 5
+    assert all(result is results[0] for result in results)
+    assert flights.pending() == 0
+
+
+def test_do_shares_error_and_forgets_key():
+    flights = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise ValueError("failed")
+
+    errors = []
+
+    def run():
+        try:
+            flights.do('key', fail)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run)]
+    threads[0].start()
+    started.wait(5)
+    threads.append(threading.Thread(target=run))
+    threads[1].start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(errors) == 2
+    assert flights.do('key', lambda: 'retried') == 'retried'
+
+
+def test_do_async_shares_one_task():
+    flights = SingleFlight()
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 'group'
+
+    async def main():
+        return await asyncio.gather(*[flights.do_async('root', call) for _ in range(5)])
+
+    assert asyncio.run(main()) == ['group'] * 5
+    assert len(calls) == 1
+    assert flights.pending() == 0
+
+
+def test_do_async_cancelled_waiter_does_not_cancel_call():
+    flights = SingleFlight()
+
+    async def call():
+        await asyncio.sleep(0.02)
+        return 'group'
+
+    async def main():
+        first = asyncio.ensure_future(flights.do_async('root', call))
+        second = asyncio.ensure_future(flights.do_async('root', call))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(main()) == 'group'
@@ -0,0 +1,112 @@
+import gzip
+import json
+import os
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from codebase_suite.connectors.Gitlab import GitlabConnector, GitlabSnapshot
+from codebase_suite.connectors.Gitlab.Exceptions import GitlabSnapshotMissException
+
+
+@pytest.fixture
+def gitlab_mock(mock_config):
+    with patch("codebase_suite.connectors.Gitlab.GitlabConnector.Config") as mock_config_class, \
+         patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.Gitlab") as mock_gitlab_class, \
+         patch("codebase_suite.connectors.Gitlab.GitlabConnector.gitlab.GraphQL") as mock_graphql_class:
+        mock_config_class.return_value = mock_config
+        yield mock_gitlab_class.return_value, mock_graphql_class.return_value
+
+
+def new_run() -> None:
+    """Symuluje nowe uruchomienie aplikacji - pusty cache w pamięci."""
+    GitlabConnector._GitlabConnector__tree.clear()
+    GitlabConnector._GitlabConnector__rest_cache.clear()
+    for index in (GitlabConnector._GitlabConnector__paths, GitlabConnector._GitlabConnector__ids):
+        for entity in index.values():
+            entity.clear()
+
+
+def test_snapshot_store(tmp_path, mock_logger):
+    snapshot = GitlabSnapshot(logger=mock_logger)
+    snapshot.set("group", "root", {"id": "1"})
+    snapshot.set("group", "root/a", {"id": "2"})
+    snapshot.set("group_projects", "root/a", ["root/a/p"])
+    snapshot.save(tmp_path / "tree.snap", "root")
+
+    assert oct(os.stat(tmp_path / "tree.snap").st_mode & 0o777) == "0o600"
+    loaded = GitlabSnapshot(tmp_path / "tree.snap", mock_logger)
+    assert loaded.root() == "root"
+    assert loaded.get("group", "root/a") == {"id": "2"}
+
+    # odczyt zwraca kopię wpisu
+    loaded.get("group", "root")["id"] = "changed"
+    assert loaded.get("group", "root") == {"id": "1"}
+
+    assert loaded.invalidate("root/a") == 2
+    assert loaded.get("group", "root/a") is None
+    assert loaded.clear() == 1
+
+
+def test_snapshot_unsupported_version(tmp_path, mock_logger):
+    with gzip.open(tmp_path / "tree.snap", "wt") as file:
+        json.dump({"version": 99, "root": "root", "entries": {}}, file)
+
+    with pytest.raises(ValueError, match="Unsupported snapshot version: 99"):
+        GitlabSnapshot(tmp_path / "tree.snap", mock_logger)
+
+
+def test_export_and_serve_from_snapshot(gitlab_mock, mock_logger, tmp_path, make_group, make_project, make_variable, make_connection):
+    rest, graphql = gitlab_mock
+
+    def execute(query, variables):
+        if "descendantGroups" in query:
+            return {"group": {"descendantGroups": make_connection([make_group("root/a", 2)])}}
+        if "projects" in query:
+            return {"group": {"projects": make_connection([
+                make_project("root/p1", 11, variables=[make_variable(5, "KEY", "secret", kind="Ci::Variable")]),
+                make_project("root/a/p2", 12),
+            ])}}
+        return {"group": make_group("root", 1)}
+
+    graphql.execute.side_effect = execute
+    rest.groups.get.return_value.badges.list.return_value = [MagicMock(attributes={"id": 1, "name": "coverage"})]
+    rest.projects.get.return_value.badges.list.return_value = []
+    rest.projects.get.return_value.protectedtags.list.return_value = [MagicMock(attributes={"name": "v*"})]
+    rest.projects.get.return_value.remote_mirrors.list.return_value = [MagicMock(attributes={"id": 3, "url": "https://mirror"})]
+
+    exported = GitlabConnector(logger=mock_logger).export_snapshot("root", tmp_path / "tree.snap")
+    assert sorted(exported.entries("project")) == ["root/a/p2", "root/p1"]
+
+    new_run()
+    graphql.reset_mock()
+    rest.reset_mock()
+    GitlabConnector.configure_snapshot(tmp_path / "tree.snap")
+    connector = GitlabConnector(logger=mock_logger)
+
+    assert connector.graphql_get_group("root")["id"] == "1"
+    assert [group["fullPath"] for group in connector.graphql_get_descendantGroups("root")] == ["root/a"]
+    assert [project["fullPath"] for project in connector.graphql_get_group_projects("root/a")] == ["root/a/p2"]
+    assert connector.graphql_get_project("root/p1")["ciVariables"][0]["value"] == "secret"
+    assert connector.get_group_badges("root") == [{"id": 1, "name": "coverage"}]
+    assert connector.get_project_protected_tags(11) == [{"name": "v*"}]
+    assert connector.get_project_mirrors("root/p1")[0].url == "https://mirror"
+    assert connector.get_project_full_path("12") == "root/a/p2"
+    graphql.execute.assert_not_called()
+    rest.projects.get.assert_not_called()
+
+    # odczyt spoza migawki nie trafia do Gitlab
+    with pytest.raises(GitlabSnapshotMissException):
+        connector.graphql_get_project("other/p")
+    with pytest.raises(GitlabSnapshotMissException):
+        connector.get_project_full_path("99")
+    graphql.execute.assert_not_called()
+
+
+def test_export_missing_group(gitlab_mock, mock_logger, tmp_path):
+    rest, graphql = gitlab_mock
+    graphql.execute.return_value = {"group": None}
+
+    with pytest.raises(GitlabSnapshotMissException):
+        GitlabConnector(logger=mock_logger).export_snapshot("missing", tmp_path / "tree.snap")
+    assert not (tmp_path / "tree.snap").exists()
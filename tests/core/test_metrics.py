@@ -0,0 +1,92 @@
+import os
+import pytest
+
+from codebase_suite.core import Metrics, Profiler, Span
+
+
+@pytest.fixture(autouse=True)
+def metrics():
+    Profiler.configure(enabled=True)
+    Metrics.configure(enabled=True)
+    yield Metrics
+    Profiler.configure()
+    Metrics.configure()
+
+
+def test_inc_disabled_is_not_recorded():
+    Metrics.configure(enabled=False)
+
+    Metrics.inc('codebase_files_total', entity='group', result='written')
+
+    assert 'codebase_files_total' not in Metrics.samples()
+
+
+def test_inc_counts_by_labels():
+    Metrics.inc('codebase_files_total', entity='group', result='written')
+    Metrics.inc('codebase_files_total', result='written', entity='group')
+    Metrics.inc('codebase_files_total', entity='project', result='skipped')
+
+    assert Metrics.samples()['codebase_files_total'] == {
+        (('entity', 'group'), ('result', 'written')): 2,
+        (('entity', 'project'), ('result', 'skipped')): 1,
+    }
+
+
+@pytest.mark.parametrize("url, endpoint", [
+    ("https://gitlab.example.com/api/v4/projects/root%2Fapp/badges?page=2", "/api/v4/projects/:id/badges"),
+    ("https://gitlab.example.com/api/v4/groups/12/variables/KEY", "/api/v4/groups/:id/variables/KEY"),
+    ("https://gitlab.example.com/api/v4/projects/1/protected_tags/7", "/api/v4/projects/:id/protected_tags/:id"),
+    ("http://127.0.0.1:8080/api/graphql", "/api/graphql"),
+    ("/api/v4/users/root", "/api/v4/users/:id"),
+])
+def test_endpoint(url, endpoint):
+    assert Metrics.endpoint(url) == endpoint
+
+
+def test_render_counters_and_span_histograms():
+    Metrics.inc('codebase_gitlab_requests_total', api='rest', endpoint='/api/v4/projects/:id/badges', status=200)
+    for duration in (0.003, 0.2, 400.0):
+        span = Span('gitlab.rest', 'root/app')
+        span.duration = duration
+        span.bytes = 100
+        Profiler.record(span)
+    span = Span('cache.group', 'root')
+    span.duration = 0.0
+    span.cache = 'hit'
+    Profiler.record(span)
+    span = Span('terraform.plan', '/repo')
+    span.duration = 2.0
+    Profiler.record(span)
+
+    lines = Metrics.render().splitlines()
+
+    assert '# TYPE codebase_gitlab_requests_total counter' in lines
+    assert 'codebase_gitlab_requests_total{api="rest",endpoint="/api/v4/projects/:id/badges",status="200"} 1' in lines
+    assert '# TYPE codebase_gitlab_request_duration_seconds histogram' in lines
+    assert 'codebase_gitlab_request_duration_seconds_bucket{api="rest",le="0.005"} 1' in lines
+    assert 'codebase_gitlab_request_duration_seconds_bucket{api="rest",le="0.25"} 2' in lines
+    assert 'codebase_gitlab_request_duration_seconds_bucket{api="rest",le="300.0"} 2' in lines
+    assert 'codebase_gitlab_request_duration_seconds_bucket{api="rest",le="+Inf"} 3' in lines
+    assert 'codebase_gitlab_request_duration_seconds_count{api="rest"} 3' in lines
+    assert 'codebase_gitlab_response_bytes_total{api="rest"} 300' in lines
+    assert 'codebase_cache_lookups_total{cache="group",result="hit"} 1' in lines
+    assert 'codebase_command_duration_seconds_sum{command="terraform.plan"} 2.0' in lines
+    assert any(line.startswith('codebase_run_timestamp_seconds ') for line in lines)
+
+
+def test_render_escapes_label_values():
+    Metrics.inc('codebase_terraform_resources_imported_total', type='a"b\\c\nd', dry='false')
+
+    assert 'codebase_terraform_resources_imported_total{dry="false",type="a\\"b\\\\c\\nd"} 1' in Metrics.render().splitlines()
+
+
+def test_save_replaces_file_atomically(tmp_path):
+    path = tmp_path / "codebase.prom"
+    path.write_text("old")
+    Metrics.inc('codebase_files_total', entity='group', result='written')
+
+    Metrics.save(path)
+
+    assert 'codebase_files_total{entity="group",result="written"} 1' in path.read_text()
+    assert os.stat(path).st_mode & 0o777 == 0o644
+    assert os.listdir(tmp_path) == ["codebase.prom"]
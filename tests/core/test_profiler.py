@@ -0,0 +1,82 @@
+import json
+import pytest
+
+from codebase_suite.core import Profiler, Span
+from codebase_suite.core.Profiler import NullSpan
+
+
+@pytest.fixture(autouse=True)
+def profiler():
+    Profiler.configure(enabled=True)
+    yield Profiler
+    Profiler.configure()
+
+
+def test_span_disabled_is_not_recorded():
+    Profiler.configure(enabled=False)
+
+    with Profiler.span('gitlab.graphql', 'root') as span:
+        span.cache = 'hit'
+        span.add_bytes(10)
+        Profiler.add_bytes(10)
+
+    assert isinstance(span, NullSpan)
+    assert span.cache is None
+    assert Profiler.current() is None
+    assert Profiler.spans() == []
+
+
+def test_nested_spans_record_bytes_retries_and_errors():
+    response = []
+    with Profiler.span('gitlab.group', 'root') as outer:
+        with Profiler.span('gitlab.graphql', 'root') as inner:
+            assert Profiler.current() is inner
+            Profiler.add_bytes(lambda: len(response))
+            Profiler.add_retry()
+            response.extend(range(5))
+        assert Profiler.current() is outer
+        outer.cache = 'miss'
+    with pytest.raises(ValueError):
+        with Profiler.span('terraform.plan', '/repo'):
+            raise ValueError("failed")
+
+    spans = {span.operation: span for span in Profiler.spans()}
+    assert Profiler.current() is None
+    assert spans['gitlab.graphql'].bytes == 5
+    assert spans['gitlab.graphql'].retries == 1
+    assert spans['gitlab.group'].bytes == 0
+    assert spans['gitlab.group'].duration >= spans['gitlab.graphql'].duration
+    assert spans['terraform.plan'].error == 'ValueError'
+
+
+def test_report_percentiles_slowest_and_cache_ratio(tmp_path):
+    for i in range(1, 101):
+        span = Span('gitlab.rest', f"project-{i}")
+        span.duration = i / 100
+        span.bytes = 10
+        Profiler.record(span)
+    for cache in ('hit', 'hit', 'hit', 'miss'):
+        span = Span('cache.project', 'root/project')
+        span.duration = 0.0
+        span.cache = cache
+        Profiler.record(span)
+
+    report = Profiler.save(tmp_path / "report.json")
+
+    rest = report['operations']['gitlab.rest']
+    assert (rest['count'], rest['p50'], rest['p95'], rest['p99'], rest['max']) == (100, 0.5, 0.95, 0.99, 1.0)
+    assert rest['total'] == pytest.approx(50.5)
+    assert rest['bytes'] == 1000
+    assert report['operations']['cache.project']['cache_hits'] == 3
+    assert report['cache'] == {'hits': 3, 'misses': 1, 'hit_ratio': 0.75}
+    assert [span['target'] for span in report['slowest'][:2]] == ['project-100', 'project-99']
+    assert json.loads((tmp_path / "report.json").read_text())['spans'] == 104
+
+
+def test_empty_report():
+    report = Profiler.report()
+
+    assert report['spans'] == 0
+    assert report['operations'] == {}
+    assert report['cache']['hit_ratio'] is None
+    assert Profiler.percentile([], 0.5) is None
@@ -0,0 +1,34 @@
+import json
+import threading
+import time
+
+from codebase_suite.core import SamplingProfiler
+
+
+def busy_loop(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(100))
+
+
+def test_sampling_profiler_writes_speedscope_profile(tmp_path):
+    sampler = SamplingProfiler(interval=0.001).start()
+    worker = threading.Thread(target=busy_loop, args=(0.1,), name="worker")
+    worker.start()
+    busy_loop(0.1)
+    worker.join()
+    sampler.stop()
+
+    document = sampler.save(tmp_path / "profile.speedscope.json", name="test")
+
+    assert json.loads((tmp_path / "profile.speedscope.json").read_text()) == document
+    assert document['$schema'] == SamplingProfiler.SCHEMA
+    assert sampler.samples() > 0
+    frames = document['shared']['frames']
+    profiles = {profile['name']: profile for profile in document['profiles']}
+    assert {'MainThread', 'worker'} <= set(profiles)
+    for profile in profiles.values():
+        assert profile['type'] == 'sampled'
+        assert len(profile['samples']) == len(profile['weights'])
+        assert all(0 <= index < len(frames) for stack in profile['samples'] for index in stack)
+    assert any('busy_loop' in [frames[index]['name'] for index in stack] for stack in profiles['worker']['samples'])
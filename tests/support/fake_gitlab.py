@@ -0,0 +1,467 @@
+"""
+Lokalny zastępnik Gitlab (GraphQL oraz endpointy REST używane przez GitlabConnector) do testów
+i pomiarów wydajności konektora bez dostępu do prawdziwej instancji.
+
+    with FakeGitlab(SyntheticTree(depth=3, width=4, projects=20), latency=0.05, rate_limit=600) as fake:
+        config.gitlab_url = fake.url
+        ...
+
+Serwer udostępnia syntetyczne drzewo grup (SyntheticTree) albo odtwarza sesję nagraną przez
+SessionRecorder (ReplayGitlab). Opóźnienie, odsetek błędów 5xx i nagłówki RateLimit-* można ustawiać
+również w trakcie działania serwera.
+"""
+import json
+import random
+import re
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from graphql import build_schema, graphql_sync
+
+
+SCHEMA = build_schema('''
+    enum Sort { PATH_ASC PATH_DESC ACTIVITY_DESC }
+
+    type Query {
+        group(fullPath: ID!): Group
+        project(fullPath: ID!): Project
+    }
+
+    type PageInfo {
+        endCursor: String
+        hasNextPage: Boolean!
+    }
+
+    type Group {
+        id: ID!
+        name: String
+        fullPath: ID!
+        description: String
+        visibility: String
+        avatarUrl: String
+        labels(first: Int, after: String): LabelConnection
+        ciVariables(first: Int, after: String): CiVariableConnection
+        descendantGroups(first: Int, after: String, includeParentDescendants: Boolean, sort: Sort): GroupConnection
+        projects(first: Int, after: String, includeSubgroups: Boolean, sort: Sort): ProjectConnection
+    }
+
+    type Project {
+        id: ID!
+        name: String
+        archived: Boolean
+        ciConfigPathOrDefault: String
+        description: String
+        fullPath: ID!
+        visibility: String
+        avatarUrl: String
+        topics: [String!]
+        lastActivityAt: String
+        branchRules(first: Int, after: String): BranchRuleConnection
+        ciVariables(first: Int, after: String): CiVariableConnection
+        labels(first: Int, after: String): LabelConnection
+    }
+
+    type Label { id: ID! color: String description: String title: String }
+    type CiVariable { id: ID! key: String description: String value: String protected: Boolean masked: Boolean environmentScope: String }
+    type AccessLevel { accessLevel: Int accessLevelDescription: String }
+    type AccessLevelConnection { nodes: [AccessLevel] }
+    type BranchProtection { allowForcePush: Boolean pushAccessLevels: AccessLevelConnection mergeAccessLevels: AccessLevelConnection }
+    type BranchRule { id: ID! name: String isDefault: Boolean branchProtection: BranchProtection }
+
+    type GroupConnection { nodes: [Group] pageInfo: PageInfo! }
+    type ProjectConnection { nodes: [Project] pageInfo: PageInfo! }
+    type LabelConnection { nodes: [Label] pageInfo: PageInfo! }
+    type CiVariableConnection { nodes: [CiVariable] pageInfo: PageInfo! }
+    type BranchRuleConnection { nodes: [BranchRule] pageInfo: PageInfo! }
+''')
+
+
+class SyntheticTree:
+    """
+    Syntetyczne drzewo grup i projektów Gitlab o zadanym rozmiarze. Liczba grup wynosi
+    width + width^2 + ... + width^depth (plus grupa główna), a każda grupa ma `projects` projektów.
+    """
+
+    def __init__(self, root: str = "root", depth: int = 2, width: int = 3, projects: int = 5, variables: int = 3,
+                 labels: int = 2, branch_rules: int = 1, badges: int = 1, protected_tags: int = 1, mirrors: int = 0) -> None:
+        self.groups = {}
+        self.projects = {}
+        self.__next_id = 0
+        self.__sizes = {
+            'variables': variables, 'labels': labels, 'branch_rules': branch_rules,
+            'badges': badges, 'protected_tags': protected_tags, 'mirrors': mirrors,
+        }
+
+        pending = [(root, 0)]
+        while pending:
+            path, level = pending.pop(0)
+            self.add_group(path)
+            for i in range(projects):
+                self.add_project(f"{path}/project-{i}")
+            if level < depth:
+                pending.extend((f"{path}/group-{i}", level + 1) for i in range(width))
+
+    def __id(self) -> int:
+        self.__next_id += 1
+        return self.__next_id
+
+    def add_group(self, full_path: str) -> dict:
+        """
+        Dodaje grupę do drzewa.
+
+        :params full_path: Nazwa (fullPath) grupy
+        :return: Atrybuty grupy
+        """
+        sizes = self.__sizes
+        group = {
+            'id': self.__id(),
+            'name': full_path.rsplit('/', 1)[-1],
+            'fullPath': full_path,
+            'description': f"Group {full_path}",
+            'visibility': 'private',
+            'avatarUrl': None,
+            'labels': [self.__label(full_path, i) for i in range(sizes['labels'])],
+            'ciVariables': [self.__variable(full_path, i) for i in range(sizes['variables'])],
+            'badges': [self.__badge(full_path, i, 'group') for i in range(sizes['badges'])],
+        }
+        self.groups[full_path] = group
+        return group
+
+    def add_project(self, full_path: str, last_activity_at: str = None) -> dict:
+        """
+        Dodaje projekt do drzewa.
+
+        :params full_path: Nazwa (fullPath) projektu
+        :params last_activity_at: Czas ostatniej aktywności (ISO 8601, domyślnie kolejne sekundy od 2024-01-01)
+        :return: Atrybuty projektu
+        """
+        sizes = self.__sizes
+        project_id = self.__id()
+        if last_activity_at is None:
+            last_activity_at = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(1704067200 + project_id))
+        project = {
+            'id': project_id,
+            'name': full_path.rsplit('/', 1)[-1],
+            'archived': False,
+            'ciConfigPathOrDefault': '.gitlab-ci.yml',
+            'description': f"Project {full_path}",
+            'fullPath': full_path,
+            'visibility': 'private',
+            'avatarUrl': None,
+            'topics': ['synthetic'],
+            'lastActivityAt': last_activity_at,
+            'branchRules': [self.__branch_rule(i) for i in range(sizes['branch_rules'])],
+            'ciVariables': [self.__variable(full_path, i) for i in range(sizes['variables'])],
+            'labels': [self.__label(full_path, i) for i in range(sizes['labels'])],
+            'badges': [self.__badge(full_path, i, 'project') for i in range(sizes['badges'])],
+            'protected_tags': [{'name': f"v{i}.*", 'create_access_levels': [{'access_level': 40}]} for i in range(sizes['protected_tags'])],
+            'remote_mirrors': [{'id': self.__id(), 'url': f"https://mirror.example.com/{full_path}-{i}.git", 'enabled': True} for i in range(sizes['mirrors'])],
+        }
+        self.projects[full_path] = project
+        return project
+
+    def __label(self, owner: str, i: int) -> dict:
+        return {'id': self.__id(), 'color': '#428bca', 'description': f"Label {i} of {owner}", 'title': f"label-{i}"}
+
+    def __variable(self, owner: str, i: int) -> dict:
+        return {
+            'id': self.__id(), 'key': f"VARIABLE_{i}", 'description': None, 'value': f"{owner}-{i}",
+            'protected': False, 'masked': False, 'environmentScope': '*',
+        }
+
+    def __badge(self, owner: str, i: int, kind: str) -> dict:
+        return {
+            'id': self.__id(), 'name': f"badge-{i}", 'kind': kind,
+            'link_url': f"https://gitlab.example.com/{owner}", 'image_url': f"https://gitlab.example.com/{owner}/badge-{i}.svg",
+        }
+
+    def __branch_rule(self, i: int) -> dict:
+        return {
+            'id': self.__id(), 'name': 'main' if i == 0 else f"release-{i}", 'isDefault': i == 0,
+            'branchProtection': {
+                'allowForcePush': False,
+                'pushAccessLevels': {'nodes': [{'accessLevel': 40, 'accessLevelDescription': 'Maintainers'}]},
+                'mergeAccessLevels': {'nodes': [{'accessLevel': 30, 'accessLevelDescription': 'Developers + Maintainers'}]},
+            },
+        }
+
+    def find(self, kind: str, key: str):
+        """
+        Zwraca grupę lub projekt o podanym id lub fullPath.
+
+        :params kind: groups lub projects
+        :params key: Id lub fullPath
+        :return: Atrybuty obiektu lub None
+        """
+        entities = self.groups if kind == 'groups' else self.projects
+        if key.isdigit():
+            return next((entity for entity in entities.values() if entity['id'] == int(key)), None)
+        return entities.get(key)
+
+
+class FakeServer:
+    """
+    Serwer HTTP na losowym porcie lokalnym, wstrzykujący opóźnienie, błędy 5xx i limit zapytań.
+    Podklasy odpowiadają na zapytania w metodzie respond.
+    """
+
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0, rate_limit: int = None, seed: int = 0) -> None:
+        """
+        :params latency: Opóźnienie każdej odpowiedzi w sekundach
+        :params error_rate: Odsetek zapytań kończonych błędem 503 (0.0 - 1.0)
+        :params rate_limit: Limit zapytań na minutę ogłaszany w nagłówkach RateLimit-* (None - bez limitu)
+        :params seed: Ziarno generatora błędów (powtarzalne przebiegi)
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.requests = []
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+        self.__window = (0.0, 0)
+        self.__server = None
+        self.__thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.__server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeServer":
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                server.handle(self, None)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                server.handle(self, self.rfile.read(length))
+
+            def log_message(self, *args):
+                pass
+
+        self.__server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.__server.daemon_threads = True
+        self.__thread = threading.Thread(target=self.__server.serve_forever, args=(0.05,), daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+        self.__thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def handle(self, handler: BaseHTTPRequestHandler, body: bytes) -> None:
+        with self.__lock:
+            self.requests.append((handler.command, handler.path))
+            failed = self.__random.random() < self.error_rate
+            headers, limited = self.__rate_limit_headers()
+
+        if self.latency:
+            time.sleep(self.latency)
+        if limited:
+            status, payload = 429, {'message': '429 Too Many Requests'}
+        elif failed:
+            status, payload = 503, {'message': '503 Service Unavailable'}
+        else:
+            status, extra, payload = self.respond(handler.command, handler.path, body)
+            headers.update(extra)
+
+        content = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(content)))
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(content)
+
+    def __rate_limit_headers(self):
+        if self.rate_limit is None:
+            return {}, False
+        now = time.time()
+        start, count = self.__window
+        if now - start >= 60:
+            start, count = now, 0
+        count += 1
+        self.__window = (start, count)
+        remaining = max(0, self.rate_limit - count)
+        headers = {
+            'RateLimit-Limit': str(self.rate_limit),
+            'RateLimit-Remaining': str(remaining),
+            'RateLimit-Reset': str(int(start + 60)),
+        }
+        if count > self.rate_limit:
+            headers['Retry-After'] = str(max(1, int(start + 60 - now)))
+            return headers, True
+        return headers, False
+
+    def respond(self, method: str, path: str, body: bytes):
+        """
+        Zwraca odpowiedź na zapytanie.
+
+        :return: Krotka (status, nagłówki, treść - obiekt JSON lub bajty)
+        """
+        raise NotImplementedError
+
+
+class FakeGitlab(FakeServer):
+    """
+    Zastępnik Gitlab udostępniający syntetyczne drzewo grup przez GraphQL (/api/graphql)
+    oraz REST (/api/v4: user, groups, projects, badges, protected_tags, remote_mirrors).
+    """
+
+    def __init__(self, tree: SyntheticTree = None, page_size: int = 100, **faults) -> None:
+        """
+        :params tree: Drzewo grup i projektów (domyślnie SyntheticTree())
+        :params page_size: Domyślny rozmiar strony połączeń GraphQL i list REST
+        :params faults: Parametry FakeServer (latency, error_rate, rate_limit, seed)
+        """
+        super().__init__(**faults)
+        self.tree = SyntheticTree() if tree is None else tree
+        self.page_size = page_size
+
+    def respond(self, method: str, path: str, body: bytes):
+        url = urlsplit(path)
+        if method == 'POST' and url.path == '/api/graphql':
+            return self.__graphql(json.loads(body))
+        if method == 'GET':
+            return self.__rest(url.path, parse_qs(url.query))
+        return 404, {}, {'message': '404 Not Found'}
+
+    def __graphql(self, request: dict):
+        root = {
+            'group': lambda info, fullPath: self.__group(self.tree.groups.get(fullPath)),
+            'project': lambda info, fullPath: self.__project(self.tree.projects.get(fullPath)),
+        }
+        result = graphql_sync(SCHEMA, request['query'], root_value=root, variable_values=request.get('variables'))
+        payload = {'data': result.data}
+        if result.errors:
+            payload['errors'] = [{'message': error.message} for error in result.errors]
+        return 200, {}, payload
+
+    def __page(self, items: list, first: int = None, after: str = None) -> dict:
+        start = int(after) if after else 0
+        end = min(len(items), start + min(first or self.page_size, 100))
+        return {'nodes': items[start:end], 'pageInfo': {'endCursor': str(end), 'hasNextPage': end < len(items)}}
+
+    def __connection(self, items: list, convert=None):
+        def resolve(info, first: int = None, after: str = None, **kwargs):
+            page = self.__page(items, first, after)
+            if convert is not None:
+                page['nodes'] = [convert(item) for item in page['nodes']]
+            return page
+        return resolve
+
+    def __gid(self, kind: str, item: dict) -> dict:
+        return {**item, 'id': f"gid://gitlab/{kind}/{item['id']}"}
+
+    def __group(self, group: dict):
+        if group is None:
+            return None
+        path = group['fullPath']
+        return {
+            **self.__gid('Group', group),
+            'labels': self.__connection(group['labels'], lambda label: self.__gid('GroupLabel', label)),
+            'ciVariables': self.__connection(group['ciVariables'], lambda variable: self.__gid('Ci::GroupVariable', variable)),
+            'descendantGroups': lambda info, sort='PATH_ASC', **kwargs: self.__connection(
+                self.__sorted(self.__under(self.tree.groups, path), sort), self.__group
+            )(info, **kwargs),
+            'projects': lambda info, includeSubgroups=False, sort='PATH_ASC', **kwargs: self.__connection(
+                self.__sorted(self.__under(self.tree.projects, path, includeSubgroups), sort), self.__project
+            )(info, **kwargs),
+        }
+
+    def __project(self, project: dict):
+        if project is None:
+            return None
+        return {
+            **self.__gid('Project', project),
+            'branchRules': self.__connection(project['branchRules'], lambda rule: self.__gid('Projects::BranchRule', rule)),
+            'ciVariables': self.__connection(project['ciVariables'], lambda variable: self.__gid('Ci::Variable', variable)),
+            'labels': self.__connection(project['labels'], lambda label: self.__gid('ProjectLabel', label)),
+        }
+
+    def __under(self, entities: dict, path: str, recursive: bool = True) -> list:
+        if recursive:
+            return [entity for key, entity in entities.items() if key.startswith(f"{path}/")]
+        return [entity for key, entity in entities.items() if key.rsplit('/', 1)[0] == path]
+
+    def __sorted(self, entities: list, sort: str) -> list:
+        if sort == 'ACTIVITY_DESC':
+            return sorted(entities, key=lambda entity: entity['lastActivityAt'], reverse=True)
+        return sorted(entities, key=lambda entity: entity['fullPath'], reverse=sort == 'PATH_DESC')
+
+    def __rest(self, path: str, query: dict):
+        if path == '/api/v4/user':
+            return 200, {}, {'id': 1, 'username': 'fake'}
+
+        match = re.fullmatch(r'/api/v4/(groups|projects)/([^/]+)(?:/(badges|protected_tags|remote_mirrors))?', path)
+        entity = None if match is None else self.tree.find(match.group(1), unquote(match.group(2)))
+        if entity is None or (match.group(1) == 'groups' and match.group(3) in ('protected_tags', 'remote_mirrors')):
+            return 404, {}, {'message': '404 Not Found'}
+        if match.group(3) is None:
+            return 200, {}, self.__rest_entity(match.group(1), entity)
+
+        items = entity[match.group(3)]
+        page = int(query.get('page', ['1'])[0])
+        per_page = int(query.get('per_page', [str(self.page_size)])[0])
+        headers = {'X-Page': str(page), 'X-Per-Page': str(per_page), 'X-Total': str(len(items))}
+        if page * per_page < len(items):
+            headers['X-Next-Page'] = str(page + 1)
+            headers['Link'] = f'<{self.url}{path}?page={page + 1}&per_page={per_page}>; rel="next"'
+        return 200, headers, items[(page - 1) * per_page:page * per_page]
+
+    def __rest_entity(self, kind: str, entity: dict) -> dict:
+        if kind == 'groups':
+            return {'id': entity['id'], 'name': entity['name'], 'full_path': entity['fullPath'], 'description': entity['description']}
+        return {
+            'id': entity['id'], 'name': entity['name'], 'path_with_namespace': entity['fullPath'],
+            'description': entity['description'], 'archived': entity['archived'],
+        }
+
+
+class ReplayGitlab(FakeServer):
+    """
+    Zastępnik Gitlab odtwarzający sesję nagraną przez SessionRecorder. Zapytania dopasowywane są
+    po metodzie, ścieżce i treści; powtórzone zapytania dostają kolejne nagrane odpowiedzi (ostatnia
+    jest powtarzana). Zapytanie spoza nagrania kończy się błędem 404.
+    """
+
+    def __init__(self, recording: dict, **faults) -> None:
+        """
+        :params recording: Nagranie (SessionRecorder.load lub SessionRecorder.recording)
+        :params faults: Parametry FakeServer (latency, error_rate, rate_limit, seed)
+        """
+        super().__init__(**faults)
+        self.__interactions = {}
+        self.__replay_lock = threading.Lock()
+        for interaction in recording['interactions']:
+            key = (interaction['method'], interaction['path'], json.dumps(interaction['body'], sort_keys=True))
+            self.__interactions.setdefault(key, []).append(interaction)
+        self.missing = []
+
+    def respond(self, method: str, path: str, body: bytes):
+        body = None if not body else json.loads(body)
+        key = (method, path, json.dumps(body, sort_keys=True))
+        with self.__replay_lock:
+            interactions = self.__interactions.get(key)
+            if not interactions:
+                self.missing.append(key)
+                return 404, {}, {'message': f"Request not recorded: {method} {path}"}
+            interaction = interactions.pop(0) if len(interactions) > 1 else interactions[0]
+
+        headers = {name: value.replace('{base_url}', self.url) for name, value in interaction['headers'].items()}
+        return interaction['status'], headers, interaction['response'].encode()
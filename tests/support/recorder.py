@@ -0,0 +1,93 @@
+"""
+Nagrywanie sesji HTTP konektora (REST i GraphQL) do plików fixture odtwarzanych przez ReplayGitlab.
+
+    recorder = SessionRecorder(config.gitlab_url)
+    recorder.attach(HttpPool(config))
+    GitlabConnector().graphql_get_group_projects("pl.rachuna-net")
+    recorder.save("tests/fixtures/group_projects.json")
+
+Nagrywane są metoda, ścieżka i treść zapytania oraz status, wybrane nagłówki i treść odpowiedzi.
+Nagłówki zapytań (w tym token) nie są zapisywane, ale odpowiedzi mogą zawierać wartości zmiennych CI/CD.
+"""
+import json
+import threading
+
+
+RECORDED_HEADERS = ('link', 'x-page', 'x-per-page', 'x-total', 'x-next-page', 'ratelimit-limit', 'ratelimit-remaining', 'retry-after')
+
+
+class SessionRecorder:
+    """
+    Zapisuje odpowiedzi sesji requests (Gitlab REST) i klienta httpx (Gitlab GraphQL) z puli HttpPool.
+    """
+
+    VERSION = 1
+
+    def __init__(self, base_url: str) -> None:
+        """
+        :params base_url: Adres instancji Gitlab - w nagłówkach Link zastępowany jest przez {base_url}
+        """
+        self.__base_url = base_url.rstrip('/')
+        self.__lock = threading.Lock()
+        self.recording = {'version': self.VERSION, 'interactions': []}
+
+    def attach(self, pool) -> "SessionRecorder":
+        """
+        Dołącza nagrywanie do sesji requests i klienta httpx puli połączeń.
+
+        :params pool: Pula połączeń (HttpPool)
+        """
+        pool.session().hooks['response'].append(self.__record_requests)
+        pool.client().event_hooks['response'].append(self.__record_httpx)
+        return self
+
+    def __record_requests(self, response, *args, **kwargs) -> None:
+        body = response.request.body
+        self.record(response.request.method, response.request.path_url, body, response.status_code, response.headers, response.text)
+
+    def __record_httpx(self, response) -> None:
+        response.read()
+        request = response.request
+        self.record(request.method, request.url.raw_path.decode(), request.content, response.status_code, response.headers, response.text)
+
+    def record(self, method: str, path: str, body, status: int, headers, response: str) -> None:
+        """
+        Dopisuje interakcję do nagrania.
+
+        :params method: Metoda HTTP
+        :params path: Ścieżka zapytania (z parametrami)
+        :params body: Treść zapytania (JSON jako bajty lub tekst, None)
+        :params status: Status odpowiedzi
+        :params headers: Nagłówki odpowiedzi
+        :params response: Treść odpowiedzi
+        """
+        if isinstance(body, bytes):
+            body = body.decode()
+        interaction = {
+            'method': method,
+            'path': path,
+            'body': json.loads(body) if body else None,
+            'status': status,
+            'headers': {
+                name: value.replace(self.__base_url, '{base_url}')
+                for name, value in headers.items() if name.lower() in RECORDED_HEADERS
+            },
+            'response': response,
+        }
+        with self.__lock:
+            self.recording['interactions'].append(interaction)
+
+    def save(self, path) -> None:
+        """
+        Zapisuje nagranie do pliku JSON.
+        """
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.recording, file, indent=2)
+
+    @staticmethod
+    def load(path) -> dict:
+        """
+        Wczytuje nagranie z pliku JSON.
+        """
+        with open(path, encoding='utf-8') as file:
+            return json.load(file)